@@ -0,0 +1,113 @@
+"""
+Bulk analysis memory benchmark.
+Runs /analyze/bulk's pipeline over growing numbers of synthetic links with large bodies,
+each size in a fresh process, and reports its peak RSS, which should stay flat as links grow.
+Requires a Unix platform for the resource module.
+
+Usage:
+    python benchmarks/bulk_benchmark.py [--sizes 500 1000 2000 4000] [--body-words 1000] [--json]
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import resource
+import sys
+import time
+
+# Add the backend/src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from config.settings import Config
+from core.interfaces import IJobScraper
+from models.job_models import BulkAnalysisRequest, Deadline, JobData
+from services.analyzer_service import JobAnalyzerService
+from services.match_service import MatchCalculatorService
+
+VOCABULARY = [f"term{i}" for i in range(5000)] + [
+    "python", "java", "react", "sql", "docker", "kubernetes", "aws", "developer", "engineer"
+]
+RESUME = "Senior python developer with react, sql, docker and aws experience"
+KEYWORDS = ["python", "docker", "kubernetes"]
+
+
+class SyntheticScraper(IJobScraper):
+    """Scraper returning a fresh random body per link, like real pages would"""
+    
+    def __init__(self, body_words: int):
+        self.body_words = body_words
+    
+    def extract_job_data(self, url: str, deadline: Deadline = None) -> JobData:
+        rng = random.Random(url)
+        body = ' '.join(rng.choices(VOCABULARY, k=self.body_words))
+        return JobData(url=url, title=f"Job {url.rsplit('/', 1)[-1]}", body=body,
+                       word_count=self.body_words)
+
+
+def iter_links(count: int):
+    """Generate links lazily, like an upload being read"""
+    for i in range(count):
+        yield f"https://jobs{i % 50}.example.com/posting/{i}"
+
+
+def measure(size: int, body_words: int, top_n: int, results: multiprocessing.Queue):
+    """Analyze size links in this process and report its peak RSS and throughput"""
+    config = Config()
+    config.ANALYSIS_MODE = 'sequential'
+    config.BULK_MAX_LINKS = size
+    config.JOB_TOKEN_CACHE_SIZE = 0
+    analyzer = JobAnalyzerService(SyntheticScraper(body_words), MatchCalculatorService(config), config)
+    request = BulkAnalysisRequest(links=iter_links(size), keywords=KEYWORDS, resume=RESUME, top_n=top_n)
+    
+    started_at = time.perf_counter()
+    response = analyzer.analyze_jobs_bulk(request)
+    seconds = time.perf_counter() - started_at
+    
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_mb = peak_rss / (1024 * 1024) if sys.platform == 'darwin' else peak_rss / 1024
+    results.put({
+        "links": size,
+        "results": len(response.results),
+        "peak_rss_mb": round(peak_mb, 1),
+        "links_per_second": round(size / seconds, 1)
+    })
+
+
+def run(sizes: list, body_words: int, top_n: int) -> list:
+    """Measure every size in its own process so peak RSS is not shared between sizes"""
+    results = []
+    for size in sizes:
+        queue = multiprocessing.Queue()
+        process = multiprocessing.Process(target=measure, args=(size, body_words, top_n, queue))
+        process.start()
+        results.append(queue.get())
+        process.join()
+    
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[500, 1000, 2000, 4000],
+                        help='link counts to analyze')
+    parser.add_argument('--body-words', type=int, default=1000, help='words per job body')
+    parser.add_argument('--top-n', type=int, default=100, help='results kept per analysis')
+    parser.add_argument('--json', action='store_true', help='print machine-readable results')
+    args = parser.parse_args()
+    
+    results = run(args.sizes, args.body_words, args.top_n)
+    
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    
+    print(f"{'links':>8}{'peak RSS':>12}{'links/s':>10}")
+    for result in results:
+        print(f"{result['links']:>8}{result['peak_rss_mb']:>10.1f}MB{result['links_per_second']:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
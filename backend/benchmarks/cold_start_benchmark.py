@@ -0,0 +1,131 @@
+"""
+Lambda cold start benchmark.
+Starts a fresh interpreter per run, imports lambda_adapter and invokes the handler twice
+against fixture pages served locally, reporting import time, first (cold) and second (warm)
+invocation latency, and the modules whose imports cost the most across the cold start.
+
+Usage:
+    python benchmarks/cold_start_benchmark.py [--runs 5] [--top 15] [--json]
+"""
+
+import argparse
+import functools
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+FIXTURES = ['greenhouse_posting.html', 'lever_posting.html']
+
+# Runs in the fresh interpreter; prints its timings as JSON on the last line of stdout
+CHILD_SCRIPT = '''
+import json, sys, time
+started_at = time.perf_counter()
+import lambda_adapter
+imported_at = time.perf_counter()
+event = {"body": json.dumps({
+    "links": sys.argv[1:], "keywords": ["python", "sql"], "resume": "Python developer with SQL experience"
+})}
+response = lambda_adapter.lambda_handler(event, None)
+cold_at = time.perf_counter()
+lambda_adapter.lambda_handler(event, None)
+warm_at = time.perf_counter()
+print(json.dumps({
+    "status": response["statusCode"],
+    "import_ms": (imported_at - started_at) * 1000,
+    "cold_invocation_ms": (cold_at - imported_at) * 1000,
+    "warm_invocation_ms": (warm_at - cold_at) * 1000
+}))
+'''
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    """Serve the fixture pages without request logging"""
+    
+    def log_message(self, format, *args):
+        pass
+
+
+def parse_import_times(stderr: str) -> dict:
+    """Get the self import time of every module from -X importtime output, in milliseconds"""
+    self_times = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, _, name = line[len('import time:'):].split('|')
+        self_times[name.strip()] = self_times.get(name.strip(), 0) + int(self_us) / 1000
+    return self_times
+
+
+def run_once(links: list) -> tuple:
+    """Run one cold start in a fresh interpreter with an empty HTTP cache"""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        env = dict(os.environ, HTTP_CACHE_DIR=cache_dir, ENVIRONMENT='lambda')
+        completed = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', CHILD_SCRIPT] + links,
+            cwd=SRC_DIR, env=env, capture_output=True, text=True, check=True
+        )
+    timings = json.loads(completed.stdout.strip().splitlines()[-1])
+    return timings, parse_import_times(completed.stderr)
+
+
+def run(runs: int, top: int) -> dict:
+    """Repeat the cold start and summarize medians plus the costliest imports by package"""
+    handler = functools.partial(QuietHandler, directory=FIXTURES_DIR)
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    links = [f"http://127.0.0.1:{server.server_port}/{fixture}" for fixture in FIXTURES]
+    
+    try:
+        results = [run_once(links) for _ in range(runs)]
+    finally:
+        server.shutdown()
+    
+    package_times = {}
+    for _, self_times in results:
+        for module, milliseconds in self_times.items():
+            package = module.split('.')[0]
+            package_times[package] = package_times.get(package, 0) + milliseconds / runs
+    
+    summary = {
+        metric: round(statistics.median(timings[metric] for timings, _ in results), 1)
+        for metric in ('import_ms', 'cold_invocation_ms', 'warm_invocation_ms')
+    }
+    summary["status"] = results[0][0]["status"]
+    summary["imports_by_package_ms"] = {
+        package: round(milliseconds, 1)
+        for package, milliseconds in sorted(package_times.items(), key=lambda item: -item[1])[:top]
+    }
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5, help='fresh interpreters to start')
+    parser.add_argument('--top', type=int, default=15, help='packages listed in the import breakdown')
+    parser.add_argument('--json', action='store_true', help='print machine-readable results')
+    args = parser.parse_args()
+    
+    summary = run(args.runs, args.top)
+    
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return
+    
+    print(f"Handler status: {summary['status']} (median of {args.runs} runs)")
+    print(f"{'import lambda_adapter':<28}{summary['import_ms']:>10.1f}ms")
+    print(f"{'first invocation (cold)':<28}{summary['cold_invocation_ms']:>10.1f}ms")
+    print(f"{'second invocation (warm)':<28}{summary['warm_invocation_ms']:>10.1f}ms")
+    print("\nImport time by package, import and first invocation (self time, mean):")
+    for package, milliseconds in summary["imports_by_package_ms"].items():
+        print(f"  {package:<26}{milliseconds:>10.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+"""
+HTML parser backend comparison.
+Checks that every IHTMLParser backend extracts the same title and body as the
+BeautifulSoup reference for each fixture, then reports per-backend parse times.
+
+Usage:
+    python benchmarks/parser_benchmark.py [--repeat 200] [--json]
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+
+# Add the backend/src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from config.settings import Config
+from services.html_parsers import HTML_PARSER_BACKENDS
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+REFERENCE_BACKEND = 'beautifulsoup'
+
+
+def load_fixtures() -> dict:
+    """Load every HTML fixture keyed by file name"""
+    fixtures = {}
+    for path in sorted(glob.glob(os.path.join(FIXTURES_DIR, '*.html'))):
+        with open(path, encoding='utf-8') as fixture_file:
+            fixtures[os.path.basename(path)] = fixture_file.read()
+    return fixtures
+
+
+def create_parsers(config: Config) -> dict:
+    """Instantiate every backend whose optional dependency is installed"""
+    parsers = {}
+    for name, parser_class in HTML_PARSER_BACKENDS.items():
+        try:
+            parsers[name] = parser_class(config)
+        except ImportError as e:
+            print(f"Skipping {name}: {e}", file=sys.stderr)
+    return parsers
+
+
+def check_equivalence(parsers: dict, fixtures: dict) -> list:
+    """Return (fixture, backend) pairs whose output differs from the reference"""
+    mismatches = []
+    for fixture_name, html_content in fixtures.items():
+        expected = parsers[REFERENCE_BACKEND].parse(html_content)
+        for backend, parser in parsers.items():
+            if parser.parse(html_content) != expected:
+                mismatches.append((fixture_name, backend))
+    return mismatches
+
+
+def time_parsers(parsers: dict, fixtures: dict, repeat: int) -> dict:
+    """Measure mean parse time per fixture in milliseconds for each backend"""
+    timings = {}
+    for backend, parser in parsers.items():
+        timings[backend] = {}
+        for fixture_name, html_content in fixtures.items():
+            started_at = time.perf_counter()
+            for _ in range(repeat):
+                parser.parse(html_content)
+            elapsed = time.perf_counter() - started_at
+            timings[backend][fixture_name] = round(elapsed / repeat * 1000, 4)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=200, help='parses per fixture and backend')
+    parser.add_argument('--json', action='store_true', help='print machine-readable results')
+    args = parser.parse_args()
+    
+    fixtures = load_fixtures()
+    parsers = create_parsers(Config())
+    mismatches = check_equivalence(parsers, fixtures)
+    timings = time_parsers(parsers, fixtures, args.repeat)
+    
+    if args.json:
+        print(json.dumps({"timings_ms": timings, "mismatches": mismatches}, indent=2))
+    else:
+        backends = list(timings)
+        print(f"{'fixture':<28}" + ''.join(f"{backend:>16}" for backend in backends))
+        for fixture_name in fixtures:
+            print(f"{fixture_name:<28}" + ''.join(
+                f"{timings[backend][fixture_name]:>14.3f}ms" for backend in backends
+            ))
+        for fixture_name, backend in mismatches:
+            print(f"MISMATCH: {backend} differs from {REFERENCE_BACKEND} on {fixture_name}")
+    
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == '__main__':
+    main()
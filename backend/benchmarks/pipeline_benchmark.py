@@ -0,0 +1,270 @@
+"""
+End-to-end pipeline benchmark.
+Serves recorded fixture pages and synthetic pages of a configurable size from a local HTTP
+server with configurable latency, drives JobAnalyzerService.analyze_jobs through it and
+serializes every response, reporting throughput, request latency and per-stage latency
+(fetch, parse, extract, score, serialize). Results can be saved and compared against a
+baseline run, exiting with status 1 when a metric regresses beyond the threshold.
+
+Usage:
+    python benchmarks/pipeline_benchmark.py [--requests 20] [--links 10] [--mode sequential]
+        [--page-kb 50] [--latency-ms 20] [--jitter-ms 5] [--output run.json]
+        [--baseline baseline.json] [--threshold 10] [--json]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+# Add the backend/src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from config.settings import Config
+from models.job_models import AnalysisRequest
+from services.analyzer_service import JobAnalyzerService
+from services.html_parsers import create_html_parser
+from services.match_service import MatchCalculatorService
+from services.scraper_service import create_scraper_service
+from utils import json_serializer, timing
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+VOCABULARY = [f"term{i}" for i in range(2000)] + [
+    "python", "java", "react", "sql", "docker", "kubernetes", "aws", "developer", "engineer"
+]
+RESUME = "Senior python developer with react, sql, docker and aws experience"
+KEYWORDS = ["python", "docker", "kubernetes"]
+
+# Metrics compared against a baseline, and whether a higher value is better
+COMPARED_METRICS = {
+    "links_per_second": True,
+    "request_p50_ms": False,
+    "request_p95_ms": False
+}
+
+
+def load_fixtures() -> dict:
+    """Read the recorded job pages served under /fixture/<name>"""
+    return {
+        name: open(os.path.join(FIXTURES_DIR, name), 'rb').read()
+        for name in sorted(os.listdir(FIXTURES_DIR)) if name.endswith('.html')
+    }
+
+
+def synthetic_page(seed: str, page_kb: int) -> bytes:
+    """Build a job page of roughly page_kb kilobytes with a body unique to the seed"""
+    rng = random.Random(seed)
+    paragraphs = []
+    size = 0
+    while size < page_kb * 1024:
+        paragraph = f"<p>{' '.join(rng.choices(VOCABULARY, k=60))}</p>"
+        paragraphs.append(paragraph)
+        size += len(paragraph)
+    return (
+        f"<html><head><title>Engineer {seed}</title><script>var tracking = 1;</script></head>"
+        f"<body><nav>Home Jobs About</nav><h1>Engineer {seed}</h1>{''.join(paragraphs)}"
+        f"<footer>Apply now</footer></body></html>"
+    ).encode('utf-8')
+
+
+def create_handler(fixtures: dict, page_kb: int, latency_ms: float, jitter_ms: float):
+    """Create a request handler class serving the corpus with the configured latency"""
+    
+    class CorpusHandler(BaseHTTPRequestHandler):
+        """Serve fixture and synthetic pages after a simulated network delay, without logging"""
+        
+        protocol_version = 'HTTP/1.1'
+        # Headers and body are written separately; Nagle's algorithm would delay the body
+        disable_nagle_algorithm = True
+        
+        def do_GET(self):
+            parts = urlsplit(self.path)
+            if parts.path.startswith('/fixture/') and parts.path[len('/fixture/'):] in fixtures:
+                body = fixtures[parts.path[len('/fixture/'):]]
+            elif parts.path == '/synthetic':
+                body = synthetic_page(parse_qs(parts.query).get('id', ['0'])[0], page_kb)
+            else:
+                # Also answers robots.txt, which allows everything
+                self.send_response(404)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            
+            delay_ms = latency_ms + random.uniform(-jitter_ms, jitter_ms)
+            if delay_ms > 0:
+                time.sleep(delay_ms / 1000)
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        
+        def log_message(self, format, *args):
+            pass
+    
+    return CorpusHandler
+
+
+def build_links(base_url: str, fixture_names: list, request_number: int, count: int) -> list:
+    """Alternate synthetic and fixture pages, every link unique so nothing is served from a cache"""
+    links = []
+    for i in range(count):
+        link_id = f"{request_number}-{i}"
+        if i % 2 == 0 or not fixture_names:
+            links.append(f"{base_url}/synthetic?id={link_id}")
+        else:
+            links.append(f"{base_url}/fixture/{fixture_names[(i // 2) % len(fixture_names)]}?id={link_id}")
+    return links
+
+
+def create_analyzer(mode: str, links: int) -> JobAnalyzerService:
+    """Build the analyzer the API uses, minus caching and politeness delays that would hide the pipeline"""
+    config = Config()
+    config.ANALYSIS_MODE = mode
+    config.MAX_LINKS_PER_REQUEST = links
+    config.HTTP_CACHE_ENABLED = False
+    config.POLITENESS_ENABLED = False
+    config.JOB_DATA_CACHE_SIZE = 0
+    scraper = create_scraper_service(config, html_parser=create_html_parser(config))
+    return JobAnalyzerService(scraper, MatchCalculatorService(config), config)
+
+
+def run(requests: int, links: int, mode: str, page_kb: int, latency_ms: float, jitter_ms: float) -> dict:
+    """Analyze requests batches of links through the local server after one warm-up request"""
+    fixtures = load_fixtures()
+    server = ThreadingHTTPServer(('127.0.0.1', 0), create_handler(fixtures, page_kb, latency_ms, jitter_ms))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    
+    analyzer = create_analyzer(mode, links)
+    recorder = timing.StageTimings()
+    previous_recorder = timing.set_recorder(recorder)
+    request_seconds = []
+    succeeded = 0
+    
+    try:
+        for request_number in range(-1, requests):
+            request = AnalysisRequest(
+                links=build_links(base_url, list(fixtures), request_number, links),
+                keywords=KEYWORDS,
+                resume=RESUME
+            )
+            started_at = time.perf_counter()
+            response = analyzer.analyze_jobs(request)
+            json_serializer.dumps(response.to_dict())
+            seconds = time.perf_counter() - started_at
+            
+            if request_number < 0:
+                # The warm-up request pays for connection setup and lazy initialization
+                recorder.clear()
+                continue
+            request_seconds.append(seconds)
+            succeeded += response.summary["successful"]
+    finally:
+        timing.set_recorder(previous_recorder)
+        server.shutdown()
+    
+    request_seconds.sort()
+    return {
+        "config": {
+            "requests": requests,
+            "links_per_request": links,
+            "mode": mode,
+            "page_kb": page_kb,
+            "latency_ms": latency_ms,
+            "jitter_ms": jitter_ms,
+            "parser": Config.HTML_PARSER_BACKEND,
+            "serializer": json_serializer.get_backend()
+        },
+        "links_per_second": round(requests * links / sum(request_seconds), 1),
+        "success_rate": round(succeeded / (requests * links), 3),
+        "request_p50_ms": round(timing.percentile(request_seconds, 50) * 1000, 1),
+        "request_p95_ms": round(timing.percentile(request_seconds, 95) * 1000, 1),
+        "stages": recorder.summary(),
+        "events": recorder.counts()
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """Get the relative change of every compared metric and stage mean, flagging regressions"""
+    metrics = [(name, results[name], baseline.get(name), higher_is_better)
+               for name, higher_is_better in COMPARED_METRICS.items()]
+    baseline_stages = baseline.get("stages", {})
+    metrics += [(f"{stage}_mean_ms", stats["mean_ms"], baseline_stages.get(stage, {}).get("mean_ms"), False)
+                for stage, stats in results["stages"].items()]
+    
+    comparisons = []
+    for name, current, previous, higher_is_better in metrics:
+        if not previous:
+            continue
+        change = (current - previous) / previous * 100
+        worse_by = -change if higher_is_better else change
+        comparisons.append({
+            "metric": name,
+            "baseline": previous,
+            "current": current,
+            "change_percent": round(change, 1),
+            "regression": worse_by > threshold
+        })
+    return comparisons
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--requests', type=int, default=20, help='measured analysis requests')
+    parser.add_argument('--links', type=int, default=10, help='links per request')
+    parser.add_argument('--mode', choices=['sequential', 'concurrent', 'async'], default='sequential',
+                        help='analysis mode')
+    parser.add_argument('--page-kb', type=int, default=50, help='size of synthetic pages')
+    parser.add_argument('--latency-ms', type=float, default=20, help='server delay before each page')
+    parser.add_argument('--jitter-ms', type=float, default=5, help='random variation of the delay')
+    parser.add_argument('--output', help='save results as JSON, e.g. as a later baseline')
+    parser.add_argument('--baseline', help='results of an earlier run to compare against')
+    parser.add_argument('--threshold', type=float, default=10, help='percent change counted as a regression')
+    parser.add_argument('--json', action='store_true', help='print machine-readable results')
+    args = parser.parse_args()
+    
+    results = run(args.requests, args.links, args.mode, args.page_kb, args.latency_ms, args.jitter_ms)
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+        if baseline.get("config") != results["config"]:
+            print("Warning: the baseline was run with a different configuration", file=sys.stderr)
+        results["comparison"] = compare(results, baseline, args.threshold)
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump(results, output_file, indent=2)
+    regressions = [c["metric"] for c in results.get("comparison", []) if c["regression"]]
+    
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        config = results["config"]
+        print(f"{config['requests']} requests x {config['links_per_request']} links, {config['mode']} mode, "
+              f"{config['parser']} parser, {config['serializer']} serializer")
+        print(f"Throughput: {results['links_per_second']} links/s "
+              f"(success rate {results['success_rate']:.0%})")
+        print(f"Request latency: p50 {results['request_p50_ms']}ms, p95 {results['request_p95_ms']}ms")
+        print(f"\n{'stage':<12}{'count':>8}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'total ms':>12}")
+        for stage, stats in results["stages"].items():
+            print(f"{stage:<12}{stats['count']:>8}{stats['mean_ms']:>10.3f}{stats['p50_ms']:>10.3f}"
+                  f"{stats['p95_ms']:>10.3f}{stats['total_ms']:>12.1f}")
+        if "comparison" in results:
+            print(f"\n{'metric':<22}{'baseline':>12}{'current':>12}{'change':>10}")
+            for comparison in results["comparison"]:
+                flag = '  REGRESSION' if comparison["regression"] else ''
+                print(f"{comparison['metric']:<22}{comparison['baseline']:>12}{comparison['current']:>12}"
+                      f"{comparison['change_percent']:>+9.1f}%{flag}")
+    
+    if regressions:
+        print(f"Regressed beyond {args.threshold}%: {', '.join(regressions)}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+"""
+Result model memory benchmark.
+Builds N job results the way the analyzer does and reports the bytes each one keeps alive,
+comparing plain dataclasses holding the body (the previous layout), slotted models holding
+the body, and slotted models with the body released after scoring (the current layout).
+
+Usage:
+    python benchmarks/result_memory_benchmark.py [--sizes 10000 100000] [--body-chars 5000] [--json]
+"""
+
+import argparse
+import dataclasses
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+# Add the backend/src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from models.job_models import SLOTS, JobData, JobResult, MatchScore
+
+SKILLS = ["python", "react", "sql", "docker", "aws"]
+TEXT = "We are hiring a senior python developer to build data pipelines and APIs. " * 100
+
+
+def plain_dataclass(cls):
+    """Rebuild a model as a regular dataclass with a per-instance __dict__"""
+    return dataclasses.make_dataclass(cls.__name__, [
+        (f.name, f.type, dataclasses.field(default=f.default, default_factory=f.default_factory))
+        for f in dataclasses.fields(cls)
+    ])
+
+
+def build_results(count: int, body_chars: int, models: tuple, release_body: bool) -> list:
+    """Create results with unique urls, titles, bodies and skill lists, like scraped jobs"""
+    job_data_cls, match_score_cls, job_result_cls = models
+    results = []
+    for i in range(count):
+        job_data = job_data_cls(
+            url=f"https://jobs.example.com/posting/{i}",
+            title=f"Senior Developer {i}",
+            body=TEXT[:body_chars - 8] + f"{i:08d}",
+            word_count=body_chars // 6
+        )
+        if release_body:
+            job_data = job_data.without_body()
+        match_score = match_score_cls(
+            total_score=50.0 + i % 50,
+            resume_score=40.0 + i % 60,
+            keyword_score=60.0,
+            matched_skills=SKILLS[:i % len(SKILLS) + 1],
+            resume_matches=12,
+            keyword_matches=3
+        )
+        results.append(job_result_cls(job_data=job_data, match_score=match_score))
+    return results
+
+
+def measure(count: int, body_chars: int, models: tuple, release_body: bool) -> int:
+    """Get the bytes per result kept alive by a list of count results"""
+    gc.collect()
+    tracemalloc.start()
+    results = build_results(count, body_chars, models, release_body)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+    return round(current / count)
+
+
+def run(sizes: list, body_chars: int) -> list:
+    """Measure every layout at every size"""
+    plain_models = (plain_dataclass(JobData), plain_dataclass(MatchScore), plain_dataclass(JobResult))
+    slotted_models = (JobData, MatchScore, JobResult)
+    layouts = [
+        ("dataclass, body kept", plain_models, False),
+        ("slots, body kept" if SLOTS else "current, body kept", slotted_models, False),
+        ("slots, body released" if SLOTS else "current, body released", slotted_models, True)
+    ]
+    
+    results = []
+    for size in sizes:
+        for name, models, release_body in layouts:
+            results.append({
+                "results": size,
+                "layout": name,
+                "bytes_per_result": measure(size, body_chars, models, release_body)
+            })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000],
+                        help='result counts to measure')
+    parser.add_argument('--body-chars', type=int, default=5000, help='characters per job body')
+    parser.add_argument('--json', action='store_true', help='print machine-readable results')
+    args = parser.parse_args()
+    
+    results = run(args.sizes, args.body_chars)
+    
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    
+    print(f"{'results':>8}  {'layout':<24}{'bytes/result':>14}")
+    for result in results:
+        print(f"{result['results']:>8}  {result['layout']:<24}{result['bytes_per_result']:>14}")
+
+
+if __name__ == '__main__':
+    main()
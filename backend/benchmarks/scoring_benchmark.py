@@ -0,0 +1,94 @@
+"""
+Match scoring benchmark.
+Scores one resume against many synthetic job texts, first with empty caches (every job
+text is tokenized, encoded and scanned for skill phrases) and then with the analyzed job
+texts cached, next to the string-set intersection the bitset scorer replaced.
+
+Usage:
+    python benchmarks/scoring_benchmark.py [--jobs 2000] [--vocabulary 20000] [--json]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+# Add the backend/src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from config.settings import Config
+from services.match_service import MatchCalculatorService
+from utils.helpers import TextProcessor
+
+WORDS_PER_JOB = 700
+WORDS_PER_RESUME = 400
+KEYWORDS = ['python', 'react', 'aws', 'docker', 'kubernetes']
+
+
+def create_corpus(job_count: int, vocabulary_size: int, seed: int = 42) -> tuple:
+    """Generate a resume and job texts with a Zipf-like word distribution"""
+    rng = random.Random(seed)
+    vocabulary = KEYWORDS + [f"term{i}" for i in range(vocabulary_size)]
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+    
+    resume = ' '.join(rng.choices(vocabulary, weights=weights, k=WORDS_PER_RESUME))
+    jobs = [
+        ' '.join(rng.choices(vocabulary, weights=weights, k=WORDS_PER_JOB))
+        for _ in range(job_count)
+    ]
+    return resume, jobs
+
+
+def time_set_intersection(resume: str, jobs: list) -> float:
+    """Score the way the set-based scorer did: tokenize and intersect sets of strings"""
+    text_processor = TextProcessor()
+    started_at = time.perf_counter()
+    resume_words = set(text_processor.normalize_text(resume))
+    keyword_words = set(KEYWORDS)
+    for job_text in jobs:
+        job_words = set(text_processor.normalize_text(job_text))
+        resume_words.intersection(job_words)
+        keyword_words.intersection(job_words)
+    return time.perf_counter() - started_at
+
+
+def time_bitset_scoring(resume: str, jobs: list) -> dict:
+    """Score every job twice: with empty caches and with the encoded job texts cached"""
+    config = Config()
+    config.JOB_TOKEN_CACHE_SIZE = len(jobs)
+    matcher = MatchCalculatorService(config)
+    profile = matcher.create_resume_profile(resume, KEYWORDS)
+    
+    timings = {}
+    for label in ('bitset_cold', 'bitset_cached'):
+        started_at = time.perf_counter()
+        matcher.calculate_match_scores(profile, jobs)
+        timings[label] = time.perf_counter() - started_at
+    timings['vocabulary_size'] = len(matcher.vocabulary)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--jobs', type=int, default=2000, help='job texts scored per run')
+    parser.add_argument('--vocabulary', type=int, default=20000, help='distinct words in the corpus')
+    parser.add_argument('--json', action='store_true', help='print machine-readable results')
+    args = parser.parse_args()
+    
+    resume, jobs = create_corpus(args.jobs, args.vocabulary)
+    results = {'set_intersection': time_set_intersection(resume, jobs)}
+    results.update(time_bitset_scoring(resume, jobs))
+    
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    
+    print(f"{args.jobs} jobs, {results.pop('vocabulary_size')} interned tokens")
+    for label, elapsed in results.items():
+        print(f"{label:<20}{elapsed * 1000:>10.1f}ms{elapsed / args.jobs * 1e6:>10.1f}us/job")
+
+
+if __name__ == '__main__':
+    main()
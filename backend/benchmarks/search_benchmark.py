@@ -0,0 +1,92 @@
+"""
+Job index search benchmark.
+Grows a temporary index of synthetic job postings and reports the mean BM25 query
+latency at each size, showing how search cost scales with the corpus.
+
+Usage:
+    python benchmarks/search_benchmark.py [--sizes 1000 4000 16000] [--queries 20] [--json]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+# Add the backend/src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from config.settings import Config
+from models.job_models import JobData
+from services.index_service import JobIndexService
+
+WORDS_PER_JOB = 300
+WORDS_PER_QUERY = 400
+VOCABULARY_SIZE = 30000
+
+
+def create_texts(rng: random.Random, count: int, words: int) -> list:
+    """Generate texts with a Zipf-like word distribution"""
+    vocabulary = [f"term{i}" for i in range(VOCABULARY_SIZE)]
+    weights = [1 / (rank + 1) for rank in range(VOCABULARY_SIZE)]
+    return [' '.join(rng.choices(vocabulary, weights=weights, k=words)) for _ in range(count)]
+
+
+def run(sizes: list, query_count: int) -> list:
+    """Add postings up to every size in turn and time the same queries at each size"""
+    rng = random.Random(42)
+    queries = create_texts(rng, query_count, WORDS_PER_QUERY)
+    results = []
+    
+    with tempfile.TemporaryDirectory() as index_dir:
+        index = JobIndexService(Config(), index_dir)
+        indexed = 0
+        for size in sorted(sizes):
+            bodies = create_texts(rng, size - indexed, WORDS_PER_JOB)
+            started_at = time.perf_counter()
+            index.add_jobs([
+                JobData(url=f"https://jobs.example.com/{indexed + i}", title="Job", body=body,
+                        word_count=WORDS_PER_JOB)
+                for i, body in enumerate(bodies)
+            ])
+            add_seconds = time.perf_counter() - started_at
+            indexed = size
+            
+            started_at = time.perf_counter()
+            for query in queries:
+                index.search(query, 50)
+            search_seconds = time.perf_counter() - started_at
+            
+            results.append({
+                "documents": size,
+                "add_ms_per_job": round(add_seconds / max(1, len(bodies)) * 1000, 3),
+                "search_ms": round(search_seconds / query_count * 1000, 3)
+            })
+        index.close()
+    
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 4000, 16000],
+                        help='index sizes to measure')
+    parser.add_argument('--queries', type=int, default=20, help='queries timed per size')
+    parser.add_argument('--json', action='store_true', help='print machine-readable results')
+    args = parser.parse_args()
+    
+    results = run(args.sizes, args.queries)
+    
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    
+    print(f"{'documents':>10}{'add/job':>12}{'search':>12}")
+    for result in results:
+        print(f"{result['documents']:>10}{result['add_ms_per_job']:>10.3f}ms{result['search_ms']:>10.3f}ms")
+
+
+if __name__ == '__main__':
+    main()
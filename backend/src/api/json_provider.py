@@ -0,0 +1,26 @@
+"""
+Flask JSON provider backed by the shared serializer.
+Makes jsonify and Flask's own JSON responses use the fast encoder with the same output
+as Flask's default provider; request parsing is unchanged.
+"""
+
+from typing import Any
+
+from flask import Response
+from flask.json.provider import DefaultJSONProvider
+
+from utils import json_serializer
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Encodes compact responses with utils.json_serializer, leaving other JSON to Flask"""
+    
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """Build a JSON response, writing the serialized bytes without re-encoding"""
+        indented = (self.compact is None and self._app.debug) or self.compact is False
+        if indented or not self.sort_keys or not self.ensure_ascii:
+            # Debug output and customized settings are rare enough for Flask's own encoder
+            return super().response(*args, **kwargs)
+        
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(json_serializer.dumps_sorted(obj), mimetype=self.mimetype)
@@ -3,18 +3,44 @@ Flask API routes for the job scraper application.
 Following the Single Responsibility Principle and proper error handling.
 """
 
+import hmac
 import logging
-from flask import Blueprint, request, jsonify
+from typing import Iterator
+from flask import Blueprint, Response, request, jsonify, stream_with_context, url_for
 
-from models.job_models import AnalysisRequest
-from core.interfaces import IJobAnalyzer
+from models.job_models import AnalysisRequest, BulkAnalysisRequest, Deadline, RankRequest, SearchRequest
+from core.interfaces import (
+    IJobAnalyzer, IStreamingJobAnalyzer, IBulkJobAnalyzer, IAnalysisJobQueue, IJobRanker, IJobSearcher,
+    IJobIndex
+)
+from utils import json_serializer
+from utils.bulk_input import detect_format, iter_links
+from utils.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, PipelineMetrics
+from utils.profiling import RequestProfiler
 
 
 class JobAPI:
     """Job analysis API endpoints"""
     
-    def __init__(self, analyzer: IJobAnalyzer):
+    def __init__(self, 
+                 analyzer: IJobAnalyzer, 
+                 index: IJobIndex = None, 
+                 job_queue: IAnalysisJobQueue = None, 
+                 time_budget: float = 0, 
+                 deadline_margin: float = 0, 
+                 bulk_time_budget: float = 0, 
+                 metrics: PipelineMetrics = None, 
+                 profiler: RequestProfiler = None, 
+                 admin_token: str = None):
         self.analyzer = analyzer
+        self.index = index
+        self.job_queue = job_queue
+        self.time_budget = time_budget
+        self.deadline_margin = deadline_margin
+        self.bulk_time_budget = bulk_time_budget
+        self.metrics = metrics
+        self.profiler = profiler
+        self.admin_token = admin_token
         self.logger = logging.getLogger(__name__)
         self.blueprint = self._create_blueprint()
     
@@ -25,6 +51,30 @@ class JobAPI:
         bp.route('/analyze', methods=['POST'])(self.analyze_jobs)
         bp.route('/health', methods=['GET'])(self.health_check)
         
+        if isinstance(self.analyzer, IStreamingJobAnalyzer):
+            bp.route('/analyze/stream', methods=['POST'])(self.analyze_jobs_stream)
+        
+        if isinstance(self.analyzer, IBulkJobAnalyzer):
+            bp.route('/analyze/bulk', methods=['POST'])(self.analyze_jobs_bulk)
+        
+        if self.job_queue is not None:
+            bp.route('/jobs', methods=['POST'])(self.submit_job)
+            bp.route('/jobs/<job_id>', methods=['GET'])(self.get_job)
+        
+        if isinstance(self.analyzer, IJobRanker):
+            bp.route('/rank', methods=['POST'])(self.rank_jobs)
+        
+        if self.index is not None:
+            if isinstance(self.analyzer, IJobSearcher):
+                bp.route('/search', methods=['POST'])(self.search_jobs)
+            # Index maintenance changes shared state, so it only exists with an admin token
+            if self.admin_token:
+                bp.route('/index/jobs', methods=['DELETE'])(self.remove_indexed_jobs)
+                bp.route('/index/compact', methods=['POST'])(self.compact_index)
+        
+        if self.metrics is not None:
+            bp.route('/metrics', methods=['GET'])(self.get_metrics)
+        
         return bp
     
     def analyze_jobs(self):
@@ -35,31 +85,256 @@ class JobAPI:
             if not data:
                 return jsonify({"error": "No JSON data provided"}), 400
             
-            # Create request object
+            # Create request object, due within the configured time budget
+            analysis_request = AnalysisRequest(
+                links=data.get('links', []),
+                keywords=data.get('keywords', []),
+                resume=data.get('resume', ''),
+                deadline=Deadline.from_budget(self.time_budget, self.deadline_margin)
+            )
+            
+            # Perform analysis, validated against the analyzer's MAX_LINKS_PER_REQUEST
+            response, profile = self._analyze_profiled(analysis_request)
+            
+            # Return results, with the profile when the caller asked for one
+            result = response.to_dict()
+            if profile is not None:
+                result["profile"] = profile
+            return jsonify(result)
+        
+        except ValueError as e:
+            self.logger.warning(f"Validation error: {str(e)}")
+            return jsonify({"error": str(e)}), 400
+        except Exception as e:
+            self.logger.error(f"Unexpected error in analyze_jobs: {str(e)}")
+            return jsonify({"error": f"Internal server error: {str(e)}"}), 500
+    
+    def _analyze_profiled(self, analysis_request: AnalysisRequest):
+        """Analyze jobs, under the profiler when the request asks for or is sampled for a profile"""
+        if self.profiler is None:
+            return self.analyzer.analyze_jobs(analysis_request), None
+        
+        return self.profiler.run(
+            lambda: self.analyzer.analyze_jobs(analysis_request),
+            self.profiler.is_requested(request.headers, request.args)
+        )
+    
+    def analyze_jobs_stream(self):
+        """
+        Job analysis streamed as newline-delimited JSON.
+        Emits one "result" line per link as soon as it completes, then a "complete" line
+        with the final ordering and summary.
+        """
+        try:
+            data = request.get_json()
+            if not data:
+                return jsonify({"error": "No JSON data provided"}), 400
+            
+            analysis_request = AnalysisRequest(
+                links=data.get('links', []),
+                keywords=data.get('keywords', []),
+                resume=data.get('resume', ''),
+                deadline=Deadline.from_budget(self.time_budget, self.deadline_margin)
+            )
+            
+            # Validation errors are raised before the stream starts
+            events = self.analyzer.analyze_jobs_stream(analysis_request)
+            
+            return Response(
+                stream_with_context(self._format_ndjson(events)),
+                mimetype='application/x-ndjson',
+                headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+            )
+        
+        except ValueError as e:
+            self.logger.warning(f"Validation error: {str(e)}")
+            return jsonify({"error": str(e)}), 400
+        except Exception as e:
+            self.logger.error(f"Unexpected error in analyze_jobs_stream: {str(e)}")
+            return jsonify({"error": f"Internal server error: {str(e)}"}), 500
+    
+    def _format_ndjson(self, events: Iterator) -> Iterator[bytes]:
+        """Serialize events one per line, ending the stream with an error line on failure"""
+        try:
+            for event in events:
+                yield json_serializer.dumps(event.to_dict()) + b'\n'
+        except Exception as e:
+            self.logger.error(f"Unexpected error in analyze_jobs_stream: {str(e)}")
+            yield json_serializer.dumps({"type": "error", "error": f"Internal server error: {str(e)}"}) + b'\n'
+    
+    def analyze_jobs_bulk(self):
+        """
+        Analyze a JSONL or CSV upload of up to BULK_MAX_LINKS links, returning the top_n jobs.
+        Accepts a multipart "file" with keywords, resume and top_n form fields, or the upload
+        as the raw request body with those options as query parameters. Links unfinished
+        after BULK_TIME_BUDGET seconds are counted as timed out.
+        """
+        try:
+            upload = request.files.get('file')
+            if upload is not None:
+                stream, options = upload.stream, request.form
+                upload_format = detect_format(upload.filename, upload.mimetype)
+            else:
+                stream, options = request.stream, request.args
+                upload_format = detect_format(None, request.mimetype)
+            
+            if upload_format is None:
+                return jsonify({"error": "Upload links as a .jsonl or .csv file"}), 400
+            
+            # Options arrive as strings: comma-separated keywords and a numeric top_n
+            keywords = options.get('keywords', '')
+            top_n = options.get('top_n', '')
+            bulk_request = BulkAnalysisRequest(
+                links=iter_links(stream, upload_format),
+                keywords=[keyword.strip() for keyword in keywords.split(',') if keyword.strip()],
+                resume=options.get('resume', ''),
+                top_n=int(top_n) if top_n.isdigit() else top_n or None,
+                deadline=Deadline.from_budget(self.bulk_time_budget, self.deadline_margin)
+            )
+            
+            response = self.analyzer.analyze_jobs_bulk(bulk_request)
+            
+            return jsonify(response.to_dict())
+        
+        except ValueError as e:
+            self.logger.warning(f"Validation error: {str(e)}")
+            return jsonify({"error": str(e)}), 400
+        except Exception as e:
+            self.logger.error(f"Unexpected error in analyze_jobs_bulk: {str(e)}")
+            return jsonify({"error": f"Internal server error: {str(e)}"}), 500
+    
+    def submit_job(self):
+        """Queue an analysis in the background and return its job ID immediately"""
+        try:
+            data = request.get_json()
+            if not data:
+                return jsonify({"error": "No JSON data provided"}), 400
+            
             analysis_request = AnalysisRequest(
                 links=data.get('links', []),
                 keywords=data.get('keywords', []),
                 resume=data.get('resume', '')
             )
             
-            # Validate request
-            validation_error = analysis_request.validate()
-            if validation_error:
-                return jsonify({"error": validation_error}), 400
+            job = self.job_queue.submit(analysis_request)
+            if job is None:
+                response = jsonify({"error": "Analysis queue is full, retry later"})
+                response.headers['Retry-After'] = str(self.job_queue.get_retry_after())
+                return response, 503
+            
+            return jsonify({
+                "job_id": job.job_id,
+                "status": job.status.value,
+                "status_url": url_for('job_api.get_job', job_id=job.job_id)
+            }), 202
+        
+        except ValueError as e:
+            self.logger.warning(f"Validation error: {str(e)}")
+            return jsonify({"error": str(e)}), 400
+        except Exception as e:
+            self.logger.error(f"Unexpected error in submit_job: {str(e)}")
+            return jsonify({"error": f"Internal server error: {str(e)}"}), 500
+    
+    def get_job(self, job_id: str):
+        """Get the progress and partial or final results of a submitted analysis"""
+        try:
+            job = self.job_queue.get(job_id)
+            if job is None:
+                return jsonify({"error": "Job not found or expired"}), 404
+            
+            return jsonify(job.to_dict())
+        
+        except Exception as e:
+            self.logger.error(f"Unexpected error in get_job: {str(e)}")
+            return jsonify({"error": f"Internal server error: {str(e)}"}), 500
+    
+    def rank_jobs(self):
+        """Rank job postings for many resumes in one request"""
+        try:
+            data = request.get_json()
+            if not data:
+                return jsonify({"error": "No JSON data provided"}), 400
+            
+            rank_request = RankRequest(
+                resumes=data.get('resumes', []),
+                links=data.get('links', []),
+                keywords=data.get('keywords', []),
+                top_k=data.get('top_k')
+            )
             
-            # Perform analysis
-            response = self.analyzer.analyze_jobs(analysis_request)
+            response = self.analyzer.rank_jobs(rank_request)
             
-            # Return results
             return jsonify(response.to_dict())
+        
+        except ValueError as e:
+            self.logger.warning(f"Validation error: {str(e)}")
+            return jsonify({"error": str(e)}), 400
+        except Exception as e:
+            self.logger.error(f"Unexpected error in rank_jobs: {str(e)}")
+            return jsonify({"error": f"Internal server error: {str(e)}"}), 500
+    
+    def search_jobs(self):
+        """Search previously scraped job postings for a resume and keywords"""
+        try:
+            data = request.get_json()
+            if not data:
+                return jsonify({"error": "No JSON data provided"}), 400
             
+            search_request = SearchRequest(
+                resume=data.get('resume', ''),
+                keywords=data.get('keywords', []),
+                top_k=data.get('top_k')
+            )
+            
+            response = self.analyzer.search_jobs(search_request)
+            
+            return jsonify(response.to_dict())
+        
         except ValueError as e:
             self.logger.warning(f"Validation error: {str(e)}")
             return jsonify({"error": str(e)}), 400
         except Exception as e:
-            self.logger.error(f"Unexpected error in analyze_jobs: {str(e)}")
+            self.logger.error(f"Unexpected error in search_jobs: {str(e)}")
+            return jsonify({"error": f"Internal server error: {str(e)}"}), 500
+    
+    def remove_indexed_jobs(self):
+        """Delete job postings from the index by URL"""
+        if not self._is_admin():
+            return jsonify({"error": "Unauthorized"}), 401
+        
+        try:
+            data = request.get_json()
+            if not data or not data.get('urls'):
+                return jsonify({"error": "No URLs provided"}), 400
+            
+            urls = data['urls']
+            if not isinstance(urls, list) or not all(isinstance(url, str) for url in urls):
+                return jsonify({"error": "urls must be a list of URLs"}), 400
+            
+            removed = self.index.remove_jobs(urls)
+            
+            return jsonify({"removed": removed, "index": self.index.get_stats()})
+        
+        except Exception as e:
+            self.logger.error(f"Unexpected error in remove_indexed_jobs: {str(e)}")
             return jsonify({"error": f"Internal server error: {str(e)}"}), 500
     
+    def compact_index(self):
+        """Reclaim index storage used by deleted job postings"""
+        if not self._is_admin():
+            return jsonify({"error": "Unauthorized"}), 401
+        
+        try:
+            return jsonify({"index": self.index.compact()})
+        except Exception as e:
+            self.logger.error(f"Unexpected error in compact_index: {str(e)}")
+            return jsonify({"error": f"Internal server error: {str(e)}"}), 500
+    
+    def _is_admin(self) -> bool:
+        """Check the request's bearer token against the admin token in constant time"""
+        scheme, _, token = request.headers.get('Authorization', '').partition(' ')
+        return scheme.lower() == 'bearer' and hmac.compare_digest(token.encode(), self.admin_token.encode())
+    
     def health_check(self):
         """Health check endpoint"""
         return jsonify({
@@ -68,6 +343,10 @@ class JobAPI:
             "version": "2.0.0"
         })
     
+    def get_metrics(self):
+        """Pipeline metrics in the Prometheus text exposition format"""
+        return Response(self.metrics.render(), content_type=METRICS_CONTENT_TYPE)
+    
     def get_blueprint(self) -> Blueprint:
         """Get the Flask blueprint"""
         return self.blueprint
@@ -4,6 +4,7 @@ Centralizes all configuration values following the DRY principle.
 """
 
 import os
+import tempfile
 from typing import Dict, List
 
 
@@ -18,9 +19,128 @@ class Config:
     # Request Configuration
     REQUEST_TIMEOUT = int(os.getenv('REQUEST_TIMEOUT', 10))
     MAX_CONTENT_LENGTH = int(os.getenv('MAX_CONTENT_LENGTH', 1024 * 1024))  # 1MB
+    STREAM_CHUNK_SIZE = int(os.getenv('STREAM_CHUNK_SIZE', 64 * 1024))  # Download chunk size
     MAX_LINKS_PER_REQUEST = int(os.getenv('MAX_LINKS_PER_REQUEST', 10))
     MAX_TEXT_LENGTH = int(os.getenv('MAX_TEXT_LENGTH', 5000))
     
+    # Deadline Configuration (/analyze returns the links finished in time, the rest as timed out)
+    ANALYSIS_TIME_BUDGET = float(os.getenv('ANALYSIS_TIME_BUDGET', 25))  # Seconds per request, 0 disables
+    DEADLINE_MARGIN = float(os.getenv('DEADLINE_MARGIN', 0.5))  # Seconds kept for scoring and the response
+    
+    # Ranking Configuration (/rank scores every resume against every job)
+    RANK_MAX_RESUMES = int(os.getenv('RANK_MAX_RESUMES', 500))
+    RANK_MAX_LINKS = int(os.getenv('RANK_MAX_LINKS', 500))
+    RANK_DEFAULT_TOP_K = int(os.getenv('RANK_DEFAULT_TOP_K', 10))  # Jobs returned per resume
+    
+    # Bulk Analysis Configuration (/analyze/bulk keeps only the top_n results in memory)
+    BULK_MAX_LINKS = int(os.getenv('BULK_MAX_LINKS', 10000))
+    BULK_BATCH_SIZE = int(os.getenv('BULK_BATCH_SIZE', 100))  # Links scraped and scored per batch
+    BULK_DEFAULT_TOP_N = int(os.getenv('BULK_DEFAULT_TOP_N', 100))
+    BULK_MAX_TOP_N = int(os.getenv('BULK_MAX_TOP_N', 1000))
+    BULK_TIME_BUDGET = float(os.getenv('BULK_TIME_BUDGET', 120))  # Seconds per upload, 0 disables
+    
+    # Concurrency Configuration
+    ANALYSIS_MODE = os.getenv('ANALYSIS_MODE', 'sequential').lower()  # sequential, concurrent, async
+    MAX_WORKERS = int(os.getenv('MAX_WORKERS', 8))
+    MAX_CONCURRENCY_PER_HOST = int(os.getenv('MAX_CONCURRENCY_PER_HOST', 2))
+    ASYNC_MAX_CONCURRENCY = int(os.getenv('ASYNC_MAX_CONCURRENCY', 100))
+    
+    # Per-host Politeness Configuration (rate limits, Retry-After and adaptive concurrency)
+    POLITENESS_ENABLED = os.getenv('POLITENESS_ENABLED', 'True').lower() == 'true'
+    POLITENESS_RATE = float(os.getenv('POLITENESS_RATE', 2))  # Requests per second per host (0 disables)
+    POLITENESS_BURST = float(os.getenv('POLITENESS_BURST', 4))  # Requests sent back to back per host
+    POLITENESS_BACKOFF = float(os.getenv('POLITENESS_BACKOFF', 1))  # Seconds, when throttled without Retry-After
+    POLITENESS_MAX_RETRY_AFTER = float(os.getenv('POLITENESS_MAX_RETRY_AFTER', 60))  # Longest host backoff
+    POLITENESS_RETRY_WAIT = float(os.getenv('POLITENESS_RETRY_WAIT', 5))  # Longest backoff retried in-request
+    POLITENESS_MAX_RETRIES = int(os.getenv('POLITENESS_MAX_RETRIES', 1))
+    POLITENESS_MAX_HOSTS = int(os.getenv('POLITENESS_MAX_HOSTS', 10000))  # Idle hosts beyond are forgotten
+    
+    # robots.txt Configuration
+    ROBOTS_TXT_ENABLED = os.getenv('ROBOTS_TXT_ENABLED', 'True').lower() == 'true'
+    ROBOTS_USER_AGENT = os.getenv('ROBOTS_USER_AGENT', 'job-scraper')  # Product token matched against rules
+    ROBOTS_CACHE_SIZE = int(os.getenv('ROBOTS_CACHE_SIZE', 1000))  # Sites kept in memory
+    ROBOTS_CACHE_TTL = float(os.getenv('ROBOTS_CACHE_TTL', 86400))  # Seconds
+    ROBOTS_ERROR_TTL = float(os.getenv('ROBOTS_ERROR_TTL', 300))  # Seconds, after 5xx or network errors
+    ROBOTS_MAX_BYTES = int(os.getenv('ROBOTS_MAX_BYTES', 500 * 1024))  # RFC 9309 parsing limit
+    
+    # Connection Pool Configuration
+    HTTP_POOL_CONNECTIONS = int(os.getenv('HTTP_POOL_CONNECTIONS', 20))  # Hosts kept in the pool
+    HTTP_POOL_MAXSIZE = int(os.getenv('HTTP_POOL_MAXSIZE', 4))  # Connections kept per host
+    HTTP_KEEPALIVE_TIMEOUT = float(os.getenv('HTTP_KEEPALIVE_TIMEOUT', 30))  # Seconds
+    
+    # HTTP Response Cache Configuration
+    HTTP_CACHE_ENABLED = os.getenv('HTTP_CACHE_ENABLED', 'True').lower() == 'true'
+    HTTP_CACHE_DIR = os.getenv(
+        'HTTP_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'job-scraper', 'http-cache')
+    )
+    HTTP_CACHE_TTL = float(os.getenv('HTTP_CACHE_TTL', 3600))  # Seconds before revalidation
+    HTTP_CACHE_MAX_BYTES = int(os.getenv('HTTP_CACHE_MAX_BYTES', 100 * 1024 * 1024))  # 100MB
+    
+    # Parsed JobData Cache Configuration (0 disables)
+    JOB_DATA_CACHE_SIZE = int(os.getenv('JOB_DATA_CACHE_SIZE', 1000))
+    
+    # Resume Profile Cache Configuration (0 disables)
+    RESUME_PROFILE_CACHE_SIZE = int(os.getenv('RESUME_PROFILE_CACHE_SIZE', 128))
+    
+    # Token Vocabulary Configuration
+    JOB_TOKEN_CACHE_SIZE = int(os.getenv('JOB_TOKEN_CACHE_SIZE', 1000))  # Analyzed job texts (0 disables)
+    TOKEN_VOCABULARY_MAX_SIZE = int(os.getenv('TOKEN_VOCABULARY_MAX_SIZE', 200000))  # Tokens before a reset
+    
+    # Compiled TECH_SKILLS plus keywords phrase matchers, one per keyword set (0 disables)
+    PHRASE_MATCHER_CACHE_SIZE = int(os.getenv('PHRASE_MATCHER_CACHE_SIZE', 64))
+    
+    # Background Analysis Queue Configuration (POST /jobs)
+    ANALYSIS_QUEUE_ENABLED = os.getenv('ANALYSIS_QUEUE_ENABLED', 'False').lower() == 'true'
+    ANALYSIS_QUEUE_DIR = os.getenv(
+        'ANALYSIS_QUEUE_DIR', os.path.join(tempfile.gettempdir(), 'job-scraper', 'analysis-jobs')
+    )
+    ANALYSIS_QUEUE_WORKERS = int(os.getenv('ANALYSIS_QUEUE_WORKERS', 2))
+    ANALYSIS_QUEUE_MAX_SIZE = int(os.getenv('ANALYSIS_QUEUE_MAX_SIZE', 100))  # Queued and running jobs
+    ANALYSIS_QUEUE_RETRY_AFTER = int(os.getenv('ANALYSIS_QUEUE_RETRY_AFTER', 5))  # Seconds, when full
+    ANALYSIS_JOB_TTL = float(os.getenv('ANALYSIS_JOB_TTL', 3600))  # Seconds after the last update
+    ANALYSIS_JOB_LEASE = float(os.getenv('ANALYSIS_JOB_LEASE', 60))  # Seconds, renewed while a job runs
+    ANALYSIS_QUEUE_POLL_INTERVAL = float(os.getenv('ANALYSIS_QUEUE_POLL_INTERVAL', 1))  # Seconds
+    
+    # Persistent Job Index Configuration (successful /analyze and /rank jobs, searched by /search)
+    JOB_INDEX_ENABLED = os.getenv('JOB_INDEX_ENABLED', 'False').lower() == 'true'
+    JOB_INDEX_DIR = os.getenv(
+        'JOB_INDEX_DIR', os.path.join(tempfile.gettempdir(), 'job-scraper', 'job-index')
+    )
+    JOB_INDEX_MAX_DOCUMENTS = int(os.getenv('JOB_INDEX_MAX_DOCUMENTS', 50000))  # 0 for no limit
+    INDEX_ADMIN_TOKEN = os.getenv('INDEX_ADMIN_TOKEN', '')  # Bearer token for /index/*, unset disables them
+    SEARCH_DEFAULT_TOP_K = int(os.getenv('SEARCH_DEFAULT_TOP_K', 10))
+    SEARCH_MAX_TOP_K = int(os.getenv('SEARCH_MAX_TOP_K', 100))
+    SEARCH_CANDIDATE_FACTOR = int(os.getenv('SEARCH_CANDIDATE_FACTOR', 5))  # BM25 candidates per result
+    SEARCH_MAX_QUERY_TERMS = int(os.getenv('SEARCH_MAX_QUERY_TERMS', 32))  # Rarest terms looked up
+    SEARCH_POSTINGS_PER_TERM = int(os.getenv('SEARCH_POSTINGS_PER_TERM', 500))  # Highest-tf postings read
+    SEARCH_BM25_WEIGHT = float(os.getenv('SEARCH_BM25_WEIGHT', 0.3))  # Versus the match score
+    BM25_K1 = float(os.getenv('BM25_K1', 1.2))
+    BM25_B = float(os.getenv('BM25_B', 0.75))
+    
+    # Near-Duplicate Detection Configuration (MinHash signatures in a banded LSH index)
+    DUPLICATE_DETECTION_ENABLED = os.getenv('DUPLICATE_DETECTION_ENABLED', 'True').lower() == 'true'
+    DUPLICATE_THRESHOLD = float(os.getenv('DUPLICATE_THRESHOLD', 0.7))  # Estimated Jaccard similarity
+    DUPLICATE_INDEX_SIZE = int(os.getenv('DUPLICATE_INDEX_SIZE', 10000))  # Postings remembered
+    MINHASH_NUM_PERM = int(os.getenv('MINHASH_NUM_PERM', 64))
+    MINHASH_SHINGLE_SIZE = int(os.getenv('MINHASH_SHINGLE_SIZE', 3))  # Words per shingle
+    LSH_BANDS = int(os.getenv('LSH_BANDS', 16))  # Must divide MINHASH_NUM_PERM
+    MINHASH_VECTORIZED = os.getenv('MINHASH_VECTORIZED', 'True').lower() == 'true'  # NumPy signatures
+    
+    # Pipeline Metrics Configuration (Prometheus /metrics, per-invocation timing logs on Lambda)
+    METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'False').lower() == 'true'
+    METRICS_MAX_HOSTS = int(os.getenv('METRICS_MAX_HOSTS', 200))  # Hosts labelled before folding into "other"
+    
+    # Per-Request Profiling Configuration (sampled stacks of /analyze requests, as folded stacks)
+    PROFILING_ENABLED = os.getenv('PROFILING_ENABLED', 'False').lower() == 'true'
+    PROFILING_HEADER = os.getenv('PROFILING_HEADER', 'X-Profile')  # "1" asks for the request's profile
+    PROFILING_QUERY_PARAM = os.getenv('PROFILING_QUERY_PARAM', 'profile')  # Same, as ?profile=1
+    PROFILING_SAMPLE_RATE = float(os.getenv('PROFILING_SAMPLE_RATE', 0))  # Share of other requests profiled
+    PROFILING_INTERVAL = float(os.getenv('PROFILING_INTERVAL', 0.005))  # Seconds between stack samples
+    PROFILING_DIR = os.getenv(
+        'PROFILING_DIR', os.path.join(tempfile.gettempdir(), 'job-scraper', 'profiles')
+    )
+    PROFILING_MAX_FILES = int(os.getenv('PROFILING_MAX_FILES', 1000))  # Oldest profiles deleted first
+    
     # User Agent for web scraping
     USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
     
@@ -58,6 +178,16 @@ class Config:
         'title'
     ]
     
+    # Query parameters that never change page content (stripped by URL normalization)
+    TRACKING_QUERY_PARAMS = {
+        'gclid', 'fbclid', 'msclkid', 'mc_cid', 'mc_eid', 'trk', 'trackingid', 'refid',
+        'ref', 'gh_src', 'lever-source', 'lever-origin'
+    }
+    TRACKING_QUERY_PREFIXES = ('utm_',)
+    
+    # HTML parser backend: beautifulsoup, lxml, selectolax, streaming
+    HTML_PARSER_BACKEND = os.getenv('HTML_PARSER_BACKEND', 'beautifulsoup').lower()
+    
     # Elements to remove from scraped content
     REMOVE_ELEMENTS = ["script", "style", "nav", "header", "footer", "aside", "advertisement"]
 
@@ -79,6 +209,11 @@ class LambdaConfig(Config):
     DEBUG = False
     REQUEST_TIMEOUT = 8  # Lambda has timeout constraints
     MAX_LINKS_PER_REQUEST = 5  # Conservative for Lambda
+    DEADLINE_MARGIN = float(os.getenv('DEADLINE_MARGIN', 1.0))  # Of the invocation's remaining time
+    
+    # Cold start: same output as the defaults without importing BeautifulSoup or NumPy
+    HTML_PARSER_BACKEND = os.getenv('HTML_PARSER_BACKEND', 'streaming').lower()
+    MINHASH_VECTORIZED = os.getenv('MINHASH_VECTORIZED', 'False').lower() == 'true'
 
 
 def get_config() -> Config:
@@ -4,16 +4,29 @@ Following the Dependency Inversion Principle (DIP) and Interface Segregation Pri
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
-from models.job_models import JobData, MatchScore, JobResult, AnalysisRequest, AnalysisResponse
+from typing import Dict, Iterator, List, Optional, Tuple
+from models.job_models import (
+    JobData, MatchScore, JobResult, AnalysisRequest, AnalysisResponse, AnalysisEvent, AnalysisJob,
+    BulkAnalysisRequest, BulkAnalysisResponse, ResumeProfile, MatchMatrix, RankRequest, RankResponse,
+    SearchRequest, SearchResponse, Deadline
+)
 
 
 class IJobScraper(ABC):
     """Interface for job scraping functionality"""
     
     @abstractmethod
-    def extract_job_data(self, url: str) -> JobData:
-        """Extract job data from a given URL"""
+    def extract_job_data(self, url: str, deadline: Deadline = None) -> JobData:
+        """Extract job data from a given URL, timing out at the deadline"""
+        pass
+
+
+class IAsyncJobScraper(ABC):
+    """Interface for asynchronous job scraping functionality"""
+    
+    @abstractmethod
+    async def extract_job_data_async(self, url: str, deadline: Deadline = None) -> JobData:
+        """Extract job data from a given URL without blocking the event loop, timing out at the deadline"""
         pass
 
 
@@ -24,6 +37,37 @@ class IMatchCalculator(ABC):
     def calculate_match_score(self, resume_text: str, job_text: str, keywords: List[str]) -> MatchScore:
         """Calculate match score between resume/keywords and job description"""
         pass
+    
+    @abstractmethod
+    def create_resume_profile(self, resume_text: str, keywords: List[str]) -> ResumeProfile:
+        """Tokenize a resume and keywords once so they can be scored against many jobs"""
+        pass
+    
+    @abstractmethod
+    def calculate_match_scores(self, profile: ResumeProfile, job_texts: List[str]) -> List[MatchScore]:
+        """Calculate match scores of one resume profile against many job descriptions"""
+        pass
+
+
+class IMatchMatrixCalculator(ABC):
+    """Interface for scoring many resumes against many jobs at once"""
+    
+    @abstractmethod
+    def calculate_match_matrix(self, 
+                               resume_texts: List[str], 
+                               job_texts: List[str], 
+                               keywords: List[str]) -> MatchMatrix:
+        """Calculate match scores for every resume and job pair"""
+        pass
+
+
+class IDuplicateDetector(ABC):
+    """Interface for detecting near-duplicate job postings"""
+    
+    @abstractmethod
+    def find_duplicates(self, job_data_list: List[JobData]) -> List[Optional[str]]:
+        """Get, for every job, the URL of the posting it duplicates or None"""
+        pass
 
 
 class IJobAnalyzer(ABC):
@@ -35,6 +79,99 @@ class IJobAnalyzer(ABC):
         pass
 
 
+class IAsyncJobAnalyzer(ABC):
+    """Interface for asynchronous job analysis workflow"""
+    
+    @abstractmethod
+    async def analyze_jobs_async(self, request: AnalysisRequest) -> AnalysisResponse:
+        """Analyze multiple job postings on the running event loop"""
+        pass
+
+
+class IStreamingJobAnalyzer(ABC):
+    """Interface for job analysis that reports each result as soon as it is ready"""
+    
+    @abstractmethod
+    def analyze_jobs_stream(self, request: AnalysisRequest) -> Iterator[AnalysisEvent]:
+        """Yield a progress event per requested link, then the final ordering and summary"""
+        pass
+
+
+class IBulkJobAnalyzer(ABC):
+    """Interface for analyzing large uploads of links with bounded memory"""
+    
+    @abstractmethod
+    def analyze_jobs_bulk(self, request: BulkAnalysisRequest) -> BulkAnalysisResponse:
+        """Analyze every link of a bulk request, keeping only the best results"""
+        pass
+
+
+class IAnalysisJobQueue(ABC):
+    """Interface for running analysis requests in the background"""
+    
+    @abstractmethod
+    def submit(self, request: AnalysisRequest) -> Optional[AnalysisJob]:
+        """Enqueue an analysis request, returning None when the queue is full"""
+        pass
+    
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[AnalysisJob]:
+        """Get the progress and results of a submitted job"""
+        pass
+    
+    @abstractmethod
+    def get_retry_after(self) -> int:
+        """Get the seconds clients should wait before resubmitting to a full queue"""
+        pass
+
+
+class IJobRanker(ABC):
+    """Interface for ranking job postings for many resumes"""
+    
+    @abstractmethod
+    def rank_jobs(self, request: RankRequest) -> RankResponse:
+        """Rank job postings for every resume in the request"""
+        pass
+
+
+class IJobSearcher(ABC):
+    """Interface for searching previously scraped job postings"""
+    
+    @abstractmethod
+    def search_jobs(self, request: SearchRequest) -> SearchResponse:
+        """Find the best indexed job postings for a resume and keywords"""
+        pass
+
+
+class IJobIndex(ABC):
+    """Interface for persistent storage and retrieval of scraped job postings"""
+    
+    @abstractmethod
+    def add_jobs(self, job_data_list: List[JobData]) -> int:
+        """Add or replace jobs, returning the number of documents written"""
+        pass
+    
+    @abstractmethod
+    def remove_jobs(self, urls: List[str]) -> int:
+        """Delete jobs by URL, returning the number of documents removed"""
+        pass
+    
+    @abstractmethod
+    def search(self, query: str, limit: int) -> List[Tuple[JobData, float]]:
+        """Get the best matching jobs for a query text with their relevance scores"""
+        pass
+    
+    @abstractmethod
+    def compact(self) -> Dict:
+        """Reclaim storage used by deleted jobs and return index statistics"""
+        pass
+    
+    @abstractmethod
+    def get_stats(self) -> Dict:
+        """Get index statistics"""
+        pass
+
+
 class BaseService(ABC):
     """Base service class providing common functionality"""
     
@@ -63,6 +200,10 @@ class IHTMLParser(ABC):
     def extract_clean_text(self, html_content: str) -> str:
         """Extract and clean text content from HTML"""
         pass
+    
+    def parse(self, html_content: str) -> Tuple[str, str]:
+        """Extract title and clean text - backends override this to parse the document once"""
+        return self.extract_title(html_content), self.extract_clean_text(html_content)
 
 
 class ITextAnalyzer(ABC):
@@ -7,19 +7,24 @@ import json
 import logging
 import sys
 import os
+import time
 
 # Add the backend/src directory to Python path for Lambda
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'backend', 'src'))
 
 from config.settings import LambdaConfig
-from services.scraper_service import JobScraperService
 from services.match_service import MatchCalculatorService
-from services.analyzer_service import JobAnalyzerService
-from models.job_models import AnalysisRequest
+from models.job_models import AnalysisRequest, Deadline
+from utils import json_serializer, timing
+from utils.profiling import create_request_profiler
 
 
 class LambdaHandler:
-    """Lambda handler implementing the same business logic as the Flask API"""
+    """
+    Lambda handler implementing the same business logic as the Flask API.
+    Only the matcher is built at init; the scraper and analyzer, with their HTTP and
+    parsing dependencies, are imported and built on the first request that needs them.
+    """
     
     def __init__(self):
         # Setup logging for Lambda
@@ -28,16 +33,57 @@ class LambdaHandler:
         
         # Create services with Lambda configuration
         config = LambdaConfig()
-        self.scraper_service = JobScraperService(config)
+        self.config = config
         self.match_service = MatchCalculatorService(config)
-        self.analyzer_service = JobAnalyzerService(
-            self.scraper_service, 
-            self.match_service, 
-            config
-        )
+        self.match_service.precompile()
+        self.scraper_service = None
+        self.analyzer_service = None
+        
+        # Per-invocation stage timings, logged as structured fields after each request
+        self.timings = None
+        if config.METRICS_ENABLED:
+            self.timings = timing.StageTimings()
+            timing.set_recorder(self.timings)
+        self.profiler = create_request_profiler(config)
+    
+    def _get_analyzer_service(self):
+        """Build the scraper and analyzer on first use, then reuse them across warm invocations"""
+        if self.analyzer_service is None:
+            from services.scraper_service import create_scraper_service
+            from services.html_parsers import create_html_parser
+            from services.analyzer_service import JobAnalyzerService
+            from services.duplicate_service import create_duplicate_detector
+            
+            self.scraper_service = create_scraper_service(self.config, create_html_parser(self.config))
+            self.analyzer_service = JobAnalyzerService(
+                self.scraper_service, 
+                self.match_service, 
+                self.config, 
+                duplicate_detector=create_duplicate_detector(self.config)
+            )
+        return self.analyzer_service
     
     def handle_request(self, event, context):
-        """Handle Lambda request"""
+        """Handle Lambda request, logging its stage timings when metrics are enabled"""
+        if self.timings is None:
+            return self._handle_request(event, context)
+        
+        # Invocations of one Lambda instance never overlap, so the timings are this request's
+        self.timings.clear()
+        started_at = time.perf_counter()
+        response = self._handle_request(event, context)
+        self.logger.info(json_serializer.dumps_text({
+            "message": "analysis timing",
+            "request_id": getattr(context, 'aws_request_id', None),
+            "status_code": response["statusCode"],
+            "duration_ms": round((time.perf_counter() - started_at) * 1000, 3),
+            "stages": self.timings.summary(),
+            "events": self.timings.counts()
+        }))
+        return response
+    
+    def _handle_request(self, event, context):
+        """Parse, validate and analyze one request"""
         try:
             # Parse the event body
             if 'body' not in event:
@@ -48,28 +94,55 @@ class LambdaHandler:
             except json.JSONDecodeError:
                 return self._create_error_response(400, "Invalid JSON in request body")
             
-            # Create analysis request
+            # Create analysis request, due before the invocation times out
             analysis_request = AnalysisRequest(
                 links=payload.get("links", []),
                 keywords=payload.get("keywords", []),
-                resume=payload.get("resume", "")
+                resume=payload.get("resume", ""),
+                deadline=self._create_deadline(context)
             )
             
             # Validate request
-            validation_error = analysis_request.validate()
+            validation_error = analysis_request.validate(self.config.MAX_LINKS_PER_REQUEST)
             if validation_error:
                 return self._create_error_response(400, validation_error)
             
-            # Perform analysis
-            response = self.analyzer_service.analyze_jobs(analysis_request)
+            # Perform analysis, profiled when the request asks for or is sampled for a profile
+            profile = None
+            if self.profiler is None:
+                response = self._get_analyzer_service().analyze_jobs(analysis_request)
+            else:
+                response, profile = self.profiler.run(
+                    lambda: self._get_analyzer_service().analyze_jobs(analysis_request),
+                    self.profiler.is_requested(
+                        {name.lower(): value for name, value in (event.get("headers") or {}).items()},
+                        event.get("queryStringParameters") or {}
+                    )
+                )
             
-            # Return success response
-            return self._create_success_response(response.to_dict())
+            # Pooled connections live on the global handler across warm invocations
+            self.logger.info(
+                f"Connection pool stats: {json.dumps(self.scraper_service.get_connection_stats())}"
+            )
             
+            # Return success response, with the profile when the caller asked for one
+            result = response.to_dict()
+            if profile is not None:
+                result["profile"] = profile
+            return self._create_success_response(result)
+        
         except Exception as e:
             self.logger.error(f"Lambda handler error: {str(e)}")
             return self._create_error_response(500, f"Internal server error: {str(e)}")
     
+    def _create_deadline(self, context):
+        """Get the request deadline from the invocation's remaining time, or the configured budget"""
+        if context is not None and hasattr(context, 'get_remaining_time_in_millis'):
+            budget = context.get_remaining_time_in_millis() / 1000
+        else:
+            budget = self.config.ANALYSIS_TIME_BUDGET
+        return Deadline.from_budget(budget, self.config.DEADLINE_MARGIN)
+    
     def _create_success_response(self, data):
         """Create successful Lambda response"""
         return {
@@ -80,7 +153,7 @@ class LambdaHandler:
                 "Access-Control-Allow-Headers": "*",
                 "Access-Control-Allow-Methods": "*"
             },
-            "body": json.dumps(data)
+            "body": json_serializer.dumps_standard(data)
         }
     
     def _create_error_response(self, status_code, message):
@@ -91,7 +164,7 @@ class LambdaHandler:
                 "Content-Type": "application/json",
                 "Access-Control-Allow-Origin": "*"
             },
-            "body": json.dumps({"error": message})
+            "body": json_serializer.dumps_standard({"error": message})
         }
 
 
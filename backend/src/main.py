@@ -14,9 +14,16 @@ from flask import Flask
 from flask_cors import CORS
 
 from config.settings import get_config
-from services.scraper_service import JobScraperService
+from services.scraper_service import create_scraper_service
+from services.html_parsers import create_html_parser
 from services.match_service import MatchCalculatorService
 from services.analyzer_service import JobAnalyzerService
+from services.index_service import create_job_index
+from services.duplicate_service import create_duplicate_detector
+from services.job_queue_service import create_analysis_job_queue
+from utils.metrics import create_metrics
+from utils.profiling import create_request_profiler
+from api.json_provider import FastJSONProvider
 from api.routes import JobAPI
 
 
@@ -34,15 +41,34 @@ class ApplicationFactory:
         
         # Create Flask app
         app = Flask(__name__)
+        app.json = FastJSONProvider(app)
         CORS(app)
         
         # Create services (Dependency Injection)
-        scraper_service = JobScraperService(config)
+        html_parser = create_html_parser(config)
+        scraper_service = create_scraper_service(config, html_parser)
         match_service = MatchCalculatorService(config)
-        analyzer_service = JobAnalyzerService(scraper_service, match_service, config)
+        job_index = create_job_index(config)
+        analyzer_service = JobAnalyzerService(
+            scraper_service, match_service, config, job_index, create_duplicate_detector(config)
+        )
+        metrics = create_metrics(config)
+        if metrics is not None:
+            metrics.add_cache_stats(scraper_service.get_cache_stats)
+            metrics.add_cache_stats(match_service.get_cache_stats)
         
         # Create API with injected dependencies
-        job_api = JobAPI(analyzer_service)
+        job_api = JobAPI(
+            analyzer_service, 
+            job_index, 
+            create_analysis_job_queue(config, analyzer_service), 
+            time_budget=config.ANALYSIS_TIME_BUDGET, 
+            deadline_margin=config.DEADLINE_MARGIN, 
+            bulk_time_budget=config.BULK_TIME_BUDGET, 
+            metrics=metrics, 
+            profiler=create_request_profiler(config), 
+            admin_token=config.INDEX_ADMIN_TOKEN
+        )
         
         # Register blueprints
         app.register_blueprint(job_api.get_blueprint())
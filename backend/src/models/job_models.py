@@ -3,10 +3,17 @@ Data models for the job scraper application.
 Following the Single Responsibility Principle (SRP).
 """
 
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+import dataclasses
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple, Union
 from enum import Enum
 
+# Result models are created per job, so they drop the per-instance __dict__ where
+# dataclasses support it (Python 3.10+)
+SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
 class JobStatus(Enum):
     """Job processing status enumeration"""
@@ -14,9 +21,18 @@ class JobStatus(Enum):
     ERROR = "error"
     TIMEOUT = "timeout"
     INVALID_URL = "invalid_url"
+    DISALLOWED = "disallowed"
 
 
-@dataclass
+class AnalysisJobStatus(Enum):
+    """Background analysis job status enumeration"""
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+@dataclass(**SLOTS)
 class JobData:
     """Job data model representing scraped job information"""
     url: str
@@ -38,9 +54,13 @@ class JobData:
         
         if self.error_message:
             result["error"] = self.error_message
-            
+        
         return result
     
+    def without_body(self) -> 'JobData':
+        """Copy without the body, for results kept after scoring (JobResult never serializes it)"""
+        return dataclasses.replace(self, body="") if self.body else self
+    
     @classmethod
     def from_error(cls, url: str, error_message: str, status: JobStatus = JobStatus.ERROR) -> 'JobData':
         """Create JobData instance for error cases"""
@@ -54,7 +74,7 @@ class JobData:
         )
 
 
-@dataclass
+@dataclass(**SLOTS)
 class MatchScore:
     """Match score model representing job matching results"""
     total_score: float
@@ -77,53 +97,197 @@ class MatchScore:
         }
 
 
-@dataclass
+@dataclass(frozen=True)
+class ResumeProfile:
+    """
+    Resume and keyword tokens computed once per resume and shared by every job scored against it.
+    Immutable because profiles are cached across requests.
+    """
+    resume_hash: str
+    resume_words: FrozenSet[str]
+    keyword_words: Tuple[str, ...]
+    tech_skill_words: FrozenSet[str]
+    
+    # resume_words as a TokenVocabulary bitset; job texts are encoded with the same vocabulary
+    vocabulary: Any = field(default=None, repr=False, compare=False)
+    resume_bits: int = 0
+    
+    # PhraseMatcher compiled from TECH_SKILLS plus keyword_words
+    phrase_matcher: Any = field(default=None, repr=False, compare=False)
+
+
+@dataclass(**SLOTS)
 class JobResult:
     """Complete job analysis result combining job data and match score"""
     job_data: JobData
     match_score: Optional[MatchScore] = None
     
+    # URL of the canonical posting when this job is a near-duplicate
+    duplicate_of: Optional[str] = None
+    
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization"""
-        result = {
-            "url": self.job_data.url,
-            "title": self.job_data.title,
-            "total_score": 0,
-            "resume_score": 0,
-            "keyword_score": 0,
-            "matched_skills": [],
-            "match_keywords": [],  # Backward compatibility
-            "resume_matches": 0,
-            "keyword_matches": 0
-        }
+        # Built in one dictionary, in MatchScore.to_dict's key order, since it runs per result
+        match_score = self.match_score
+        if match_score:
+            result = {
+                "url": self.job_data.url,
+                "title": self.job_data.title,
+                "total_score": round(match_score.total_score, 2),
+                "resume_score": round(match_score.resume_score, 2),
+                "keyword_score": round(match_score.keyword_score, 2),
+                "matched_skills": match_score.matched_skills,
+                "match_keywords": match_score.matched_skills,  # Backward compatibility
+                "resume_matches": match_score.resume_matches,
+                "keyword_matches": match_score.keyword_matches
+            }
+        else:
+            result = {
+                "url": self.job_data.url,
+                "title": self.job_data.title,
+                "total_score": 0,
+                "resume_score": 0,
+                "keyword_score": 0,
+                "matched_skills": [],
+                "match_keywords": [],  # Backward compatibility
+                "resume_matches": 0,
+                "keyword_matches": 0
+            }
         
         if self.job_data.error_message:
             result["error"] = self.job_data.error_message
         
-        if self.match_score:
-            result.update(self.match_score.to_dict())
-            
+        if self.duplicate_of:
+            result["duplicate_of"] = self.duplicate_of
+        
         return result
 
 
+@dataclass(frozen=True)
+class Deadline:
+    """Point on the monotonic clock by which a request's results are due"""
+    expires_at: float
+    
+    @classmethod
+    def after(cls, seconds: float) -> 'Deadline':
+        """Create a deadline the given number of seconds from now"""
+        return cls(time.monotonic() + seconds)
+    
+    @classmethod
+    def from_budget(cls, seconds: float, margin: float) -> Optional['Deadline']:
+        """Create the deadline of a request given seconds to respond, keeping margin seconds to do so"""
+        if seconds <= 0:
+            return None
+        return cls.after(max(0.0, seconds - margin))
+    
+    def remaining(self) -> float:
+        """Get the seconds left, never negative"""
+        return max(0.0, self.expires_at - time.monotonic())
+    
+    def expired(self) -> bool:
+        """Check whether the deadline has passed"""
+        return time.monotonic() >= self.expires_at
+
+
 @dataclass
 class AnalysisRequest:
     """Request model for job analysis"""
     links: List[str]
     keywords: List[str]
     resume: str = ""
+    deadline: Optional[Deadline] = None  # Links unfinished by then are reported as timed out
     
-    def validate(self) -> Optional[str]:
-        """Validate the request data"""
+    def validate(self, max_links: int) -> Optional[str]:
+        """Validate the request data against the configured MAX_LINKS_PER_REQUEST"""
         if not self.links:
             return "No job links provided"
         
-        if len(self.links) > 10:  # This should come from config
-            return "Too many links. Maximum 10 allowed."
+        if len(self.links) > max_links:
+            return f"Too many links. Maximum {max_links} allowed."
+        
+        return None
+
+
+@dataclass
+class RankRequest:
+    """Request model for ranking job postings for many resumes at once"""
+    resumes: List[str]
+    links: List[str]
+    keywords: List[str]
+    top_k: Optional[int] = None
+    
+    def validate(self, max_resumes: int, max_links: int) -> Optional[str]:
+        """Validate the request data against the configured grid limits"""
+        if not self.resumes:
+            return "No resumes provided"
+        
+        if not self.links:
+            return "No job links provided"
+        
+        if len(self.resumes) > max_resumes:
+            return f"Too many resumes. Maximum {max_resumes} allowed."
+        
+        if len(self.links) > max_links:
+            return f"Too many links. Maximum {max_links} allowed."
+        
+        if self.top_k is not None and (not isinstance(self.top_k, int) or self.top_k < 1):
+            return "top_k must be a positive integer"
         
         return None
 
 
+@dataclass
+class SearchRequest:
+    """Request model for searching indexed job postings"""
+    resume: str
+    keywords: List[str]
+    top_k: Optional[int] = None
+    
+    def validate(self, max_top_k: int) -> Optional[str]:
+        """Validate the request data"""
+        if not isinstance(self.resume, str):
+            return "resume must be a string"
+        
+        if not isinstance(self.keywords, list) or not all(isinstance(k, str) for k in self.keywords):
+            return "keywords must be a list of strings"
+        
+        if not self.resume.strip() and not any(keyword.strip() for keyword in self.keywords):
+            return "No resume or keywords provided"
+        
+        if self.top_k is not None and (not isinstance(self.top_k, int) or self.top_k < 1):
+            return "top_k must be a positive integer"
+        
+        if self.top_k is not None and self.top_k > max_top_k:
+            return f"top_k too large. Maximum {max_top_k} allowed."
+        
+        return None
+
+
+@dataclass
+class MatchMatrix:
+    """
+    Match scores of every resume (rows) against every job (columns) as NumPy arrays.
+    Keyword matches only depend on the job, so they are stored once per column.
+    """
+    total_scores: Any
+    resume_scores: Any
+    keyword_scores: Any
+    resume_matches: Any
+    keyword_matches: Any
+    matched_skills: List[List[str]]
+    
+    def get_match_score(self, resume_index: int, job_index: int) -> MatchScore:
+        """Get the MatchScore of a single cell"""
+        return MatchScore(
+            total_score=float(self.total_scores[resume_index, job_index]),
+            resume_score=float(self.resume_scores[resume_index, job_index]),
+            keyword_score=float(self.keyword_scores[resume_index, job_index]),
+            matched_skills=list(self.matched_skills[job_index]),
+            resume_matches=int(self.resume_matches[resume_index, job_index]),
+            keyword_matches=int(self.keyword_matches[job_index])
+        )
+
+
 @dataclass
 class AnalysisResponse:
     """Response model for job analysis"""
@@ -143,9 +307,235 @@ class AnalysisResponse:
         total_jobs = len(results)
         successful = len([r for r in results if not r.job_data.error_message])
         failed = total_jobs - successful
+        timed_out = len([r for r in results if r.job_data.status == JobStatus.TIMEOUT])
+        duplicates = [r.duplicate_of for r in results if r.duplicate_of]
         
         return {
             "total_jobs": total_jobs,
             "successful": successful,
+            "failed": failed,
+            "timed_out": timed_out,
+            "duplicates": len(duplicates),
+            "duplicate_groups": len(set(duplicates))
+        }
+
+
+@dataclass
+class BulkAnalysisRequest:
+    """Request model for analyzing thousands of uploaded links with bounded memory"""
+    links: Iterable[str]  # Consumed once, while the analysis runs
+    keywords: List[str]
+    resume: str = ""
+    top_n: Optional[int] = None
+    deadline: Optional[Deadline] = None  # Links unfinished by then are counted as timed out
+    
+    def validate(self, max_top_n: int) -> Optional[str]:
+        """Validate the request options; the link limit is enforced while links are read"""
+        if self.top_n is not None and (not isinstance(self.top_n, int) or self.top_n < 1):
+            return "top_n must be a positive integer"
+        
+        if self.top_n is not None and self.top_n > max_top_n:
+            return f"top_n too large. Maximum {max_top_n} allowed."
+        
+        return None
+
+
+@dataclass
+class BulkAnalysisStats:
+    """Running totals of a bulk analysis, updated as each link completes"""
+    total_links: int = 0
+    repeated_links: int = 0
+    successful: int = 0
+    failed: int = 0
+    timed_out: int = 0
+    duplicates: int = 0
+    total_score: float = 0.0
+    best_score: float = 0.0
+    
+    def add(self, result: JobResult):
+        """Count one scraped and scored link"""
+        if result.match_score is None:
+            self.failed += 1
+            self.timed_out += 1 if result.job_data.status == JobStatus.TIMEOUT else 0
+            return
+        
+        self.successful += 1
+        self.duplicates += 1 if result.duplicate_of else 0
+        self.total_score += result.match_score.total_score
+        self.best_score = max(self.best_score, result.match_score.total_score)
+    
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for JSON serialization"""
+        return {
+            "total_links": self.total_links,
+            "repeated_links": self.repeated_links,
+            "total_jobs": self.successful + self.failed,
+            "successful": self.successful,
+            "failed": self.failed,
+            "timed_out": self.timed_out,
+            "duplicates": self.duplicates,
+            "average_score": round(self.total_score / self.successful, 2) if self.successful else 0,
+            "best_score": round(self.best_score, 2)
+        }
+
+
+@dataclass
+class BulkAnalysisResponse:
+    """Response model for bulk analysis: the top_n best jobs and totals over every link"""
+    results: List[JobResult]
+    summary: Dict
+    
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for JSON serialization"""
+        return {
+            "results": [result.to_dict() for result in self.results],
+            "summary": self.summary
+        }
+
+
+@dataclass
+class AnalysisProgress:
+    """Streaming analysis event with the result of one requested link, sent as soon as it completes"""
+    index: int  # Position of the link in the request
+    result: JobResult
+    
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for JSON serialization"""
+        return {
+            "type": "result",
+            "index": self.index,
+            "result": self.result.to_dict()
+        }
+
+
+@dataclass
+class AnalysisComplete:
+    """Final streaming analysis event with the ordering and summary of the full response"""
+    order: List[int]  # Link positions sorted like AnalysisResponse.results
+    summary: Dict
+    
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for JSON serialization"""
+        return {
+            "type": "complete",
+            "order": self.order,
+            "summary": self.summary
+        }
+
+
+AnalysisEvent = Union[AnalysisProgress, AnalysisComplete]
+
+
+@dataclass
+class RankResponse:
+    """Response model for ranking; rankings hold the top jobs of each resume, best first"""
+    rankings: List[List[JobResult]]
+    failed_jobs: List[JobData]
+    summary: Dict
+    
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for JSON serialization"""
+        return {
+            "rankings": [
+                {
+                    "resume_index": resume_index,
+                    "results": [result.to_dict() for result in results]
+                }
+                for resume_index, results in enumerate(self.rankings)
+            ],
+            "failed_jobs": [
+                {"url": job_data.url, "error": job_data.error_message}
+                for job_data in self.failed_jobs
+            ],
+            "summary": self.summary
+        }
+    
+    @classmethod
+    def create_summary(cls, total_resumes: int, total_jobs: int, failed: int) -> Dict:
+        """Create summary statistics for ranking results"""
+        return {
+            "total_resumes": total_resumes,
+            "total_jobs": total_jobs,
+            "successful": total_jobs - failed,
             "failed": failed
         }
+
+
+@dataclass(**SLOTS)
+class SearchResult:
+    """Indexed job posting with its match score and BM25 relevance"""
+    job_result: JobResult
+    bm25_score: float
+    search_score: float
+    
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for JSON serialization"""
+        result = self.job_result.to_dict()
+        result["bm25_score"] = round(self.bm25_score, 4)
+        result["search_score"] = round(self.search_score, 2)
+        return result
+
+
+@dataclass
+class SearchResponse:
+    """Response model for index search, best results first"""
+    results: List[SearchResult]
+    summary: Dict
+    
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for JSON serialization"""
+        return {
+            "results": [result.to_dict() for result in self.results],
+            "summary": self.summary
+        }
+    
+    @classmethod
+    def create_summary(cls, results: List[SearchResult], candidates: int, indexed_jobs: int) -> Dict:
+        """Create summary statistics for search results"""
+        return {
+            "total_results": len(results),
+            "candidates": candidates,
+            "indexed_jobs": indexed_jobs
+        }
+
+
+@dataclass
+class AnalysisJob:
+    """
+    Analysis request submitted for background processing.
+    Results are kept as their JSON dictionaries because jobs are persisted between restarts.
+    """
+    job_id: str
+    status: AnalysisJobStatus
+    request: AnalysisRequest
+    created_at: float
+    updated_at: float
+    expires_at: float
+    partial_results: Dict[int, Dict] = field(default_factory=dict)  # Link position -> JobResult dict
+    response: Optional[Dict] = None  # AnalysisResponse dict once completed
+    error: Optional[str] = None
+    
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for JSON serialization"""
+        result = {
+            "job_id": self.job_id,
+            "status": self.status.value,
+            "progress": {
+                "completed": len(self.partial_results),
+                "total": len(self.request.links)
+            },
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "expires_at": self.expires_at
+        }
+        
+        if self.response is not None:
+            result.update(self.response)
+        elif self.partial_results:
+            # Completed links so far, in request order
+            result["results"] = [self.partial_results[i] for i in sorted(self.partial_results)]
+        
+        if self.error:
+            result["error"] = self.error
+        
+        return result
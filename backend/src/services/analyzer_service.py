@@ -3,16 +3,35 @@ Job analysis service orchestrating the complete analysis workflow.
 Following the Single Responsibility Principle and Dependency Injection.
 """
 
+import asyncio
+import dataclasses
+import heapq
 import logging
-from typing import List
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from core.interfaces import IJobAnalyzer, IJobScraper, IMatchCalculator, BaseService
-from models.job_models import AnalysisRequest, AnalysisResponse, JobResult
+from core.interfaces import (
+    IJobAnalyzer, IAsyncJobAnalyzer, IStreamingJobAnalyzer, IBulkJobAnalyzer, IJobRanker, IJobSearcher,
+    IJobIndex, IDuplicateDetector, IJobScraper, IAsyncJobScraper, IMatchCalculator, BaseService
+)
+from models.job_models import (
+    AnalysisRequest, AnalysisResponse, AnalysisEvent, AnalysisProgress, AnalysisComplete,
+    BulkAnalysisRequest, BulkAnalysisResponse, BulkAnalysisStats, Deadline, JobData, JobResult, JobStatus,
+    ResumeProfile, RankRequest, RankResponse, SearchRequest, SearchResponse, SearchResult
+)
 from config.settings import Config
-from utils.helpers import LoggerHelper
+from utils.helpers import LoggerHelper, URLValidator, BackgroundEventLoop
+from utils.timing import JOB_STATUS, count
 
+DEADLINE_EXCEEDED_MESSAGE = "Analysis deadline exceeded"
 
-class JobAnalyzerService(BaseService, IJobAnalyzer):
+
+class JobAnalyzerService(BaseService, IJobAnalyzer, IAsyncJobAnalyzer, IStreamingJobAnalyzer,
+                         IBulkJobAnalyzer, IJobRanker, IJobSearcher):
     """
     Service responsible for orchestrating the complete job analysis workflow.
     Coordinates between scraping and matching services.
@@ -21,12 +40,21 @@ class JobAnalyzerService(BaseService, IJobAnalyzer):
     def __init__(self, 
                  scraper: IJobScraper, 
                  matcher: IMatchCalculator, 
-                 config: Config = None):
+                 config: Config = None, 
+                 index: IJobIndex = None, 
+                 duplicate_detector: IDuplicateDetector = None):
         super().__init__()
         self.scraper = scraper
         self.matcher = matcher
         self.config = config or Config()
+        self.index = index
+        self.duplicate_detector = duplicate_detector
         self.logger_helper = LoggerHelper()
+        self.url_validator = URLValidator()
+        self._executor = None
+        self._event_loop = None
+        # Request threads may reach the lazily created pool and loop at the same time
+        self._lazy_lock = threading.Lock()
     
     def _setup_logging(self):
         """Setup logging for the analyzer service"""
@@ -37,39 +65,313 @@ class JobAnalyzerService(BaseService, IJobAnalyzer):
         Analyze multiple job postings against resume and keywords.
         Returns comprehensive analysis results with scoring and statistics.
         """
-        # Validate request
-        validation_error = request.validate()
+        if self.config.ANALYSIS_MODE == 'async':
+            return self._get_event_loop().run(self.analyze_jobs_async(request))
+        
+        self._validate_request(request)
+        
+        # Scrape all unique jobs, keeping the input order regardless of execution mode
+        started_at = time.perf_counter()
+        job_data_list = self._scrape_links(self._deduplicate_links(request.links), request.deadline)
+        
+        return self._build_response(request, job_data_list, started_at)
+    
+    async def analyze_jobs_async(self, request: AnalysisRequest) -> AnalysisResponse:
+        """
+        Analyze multiple job postings on the running event loop.
+        Produces the same ordering and summary as the synchronous path.
+        """
+        self._validate_request(request)
+        
+        started_at = time.perf_counter()
+        job_data_list = await self._scrape_async(
+            self._deduplicate_links(request.links), deadline=request.deadline
+        )
+        
+        return self._build_response(request, job_data_list, started_at)
+    
+    def analyze_jobs_stream(self, request: AnalysisRequest) -> Iterator[AnalysisEvent]:
+        """
+        Analyze job postings, yielding each requested link's result as soon as it is scraped
+        and scored. Links are scraped concurrently even in sequential mode, so results arrive
+        in completion order. The request is validated before this returns; the final event
+        carries the ordering and summary that analyze_jobs would return.
+        """
+        self._validate_request(request)
+        return self._stream_results(request)
+    
+    def _stream_results(self, request: AnalysisRequest) -> Iterator[AnalysisEvent]:
+        """Scrape and score links in completion order, then emit the final ordering"""
+        started_at = time.perf_counter()
+        unique_links = self._deduplicate_links(request.links)
+        positions: Dict[str, List[int]] = {}
+        for i, link in enumerate(request.links):
+            positions.setdefault(self.url_validator.normalize_url(link), []).append(i)
+        
+        # Tokenize the resume before the first link completes
+        profile = self.matcher.create_resume_profile(request.resume, request.keywords)
+        group_scores = {}
+        job_data_list: List[JobData] = [None] * len(unique_links)
+        results: List[JobResult] = [None] * len(request.links)
+        
+        for i, job_data in self._iter_scrape_links(unique_links, request.deadline, concurrent=True):
+            job_data_list[i] = job_data
+            result = self._score_streamed_job(job_data, profile, group_scores)
+            for position in positions[self.url_validator.normalize_url(job_data.url)]:
+                link = request.links[position]
+                if link != job_data.url:
+                    results[position] = dataclasses.replace(
+                        result, job_data=dataclasses.replace(result.job_data, url=link)
+                    )
+                else:
+                    results[position] = result
+                yield AnalysisProgress(index=position, result=results[position])
+        
+        self._index_jobs(job_data_list)
+        
+        # Same ordering as analyze_jobs: by total score, input order between ties
+        order = sorted(
+            range(len(results)),
+            key=lambda i: results[i].match_score.total_score if results[i].match_score else 0,
+            reverse=True
+        )
+        
+        self.logger.info(self.logger_helper.format_completion_log(len(results)))
+        self.logger.info(self.logger_helper.format_timing_log(
+            self.config.ANALYSIS_MODE, len(results), time.perf_counter() - started_at
+        ))
+        
+        yield AnalysisComplete(order=order, summary=AnalysisResponse.create_summary(results))
+    
+    def _score_streamed_job(self, job_data: JobData, profile: ResumeProfile, group_scores: Dict) -> JobResult:
+        """Score one completed job, reusing the score of an already scored near-duplicate"""
+        count(JOB_STATUS, job_data.status.value)
+        if job_data.status.value != "success" or job_data.error_message:
+            return JobResult(job_data=job_data.without_body())
+        
+        duplicate_of = self._find_duplicates([job_data])[0]
+        group = duplicate_of or job_data.url
+        match_score = group_scores.get(group)
+        if match_score is None:
+            match_score = self.matcher.calculate_match_scores(profile, [job_data.body])[0]
+            group_scores[group] = match_score
+        
+        return JobResult(job_data=job_data.without_body(), match_score=match_score, duplicate_of=duplicate_of)
+    
+    def analyze_jobs_bulk(self, request: BulkAnalysisRequest) -> BulkAnalysisResponse:
+        """
+        Analyze up to BULK_MAX_LINKS links as a pipeline of BULK_BATCH_SIZE batches.
+        Each batch is scraped and scored as its links complete, then dropped: only a heap of
+        the top_n best results (without bodies), running totals and the normalized URLs seen
+        so far are kept, so memory does not grow with the job bodies. Once the request's
+        deadline passes, the remaining links are read and counted as timed out without fetching.
+        """
+        validation_error = request.validate(self.config.BULK_MAX_TOP_N)
+        if validation_error:
+            raise ValueError(validation_error)
+        
+        started_at = time.perf_counter()
+        top_n = request.top_n or self.config.BULK_DEFAULT_TOP_N
+        profile = self.matcher.create_resume_profile(request.resume, request.keywords)
+        stats = BulkAnalysisStats()
+        
+        # Min-heap of (score, -link position, result): the root is the worst result kept,
+        # and between equal scores the later link is dropped first
+        top: List[Tuple[float, int, JobResult]] = []
+        offset = 0
+        for batch in self._iter_bulk_batches(request.links, stats):
+            # Scores are shared by near-duplicates within a batch only, keeping memory flat
+            group_scores = {}
+            job_data_list: List[JobData] = [None] * len(batch)
+            for i, job_data in self._iter_bulk_batch(batch, request.deadline):
+                job_data_list[i] = job_data
+                result = self._score_streamed_job(job_data, profile, group_scores)
+                stats.add(result)
+                if result.match_score is None:
+                    continue
+                
+                entry = (result.match_score.total_score, -(offset + i), result)
+                if len(top) < top_n:
+                    heapq.heappush(top, entry)
+                elif entry[:2] > top[0][:2]:
+                    heapq.heapreplace(top, entry)
+            
+            self._index_jobs(job_data_list)
+            offset += len(batch)
+        
+        results = [entry[2] for entry in sorted(top, key=lambda entry: entry[:2], reverse=True)]
+        
+        self.logger.info(self.logger_helper.format_completion_log(stats.successful + stats.failed))
+        self.logger.info(self.logger_helper.format_timing_log(
+            self.config.ANALYSIS_MODE, stats.successful + stats.failed, time.perf_counter() - started_at
+        ))
+        
+        return BulkAnalysisResponse(results=results, summary=stats.to_dict())
+    
+    def _iter_bulk_batch(self, batch: List[str], deadline: Deadline = None) -> Iterator[Tuple[int, JobData]]:
+        """Scrape one batch in completion order, or time it out at once when the deadline has passed"""
+        if deadline is not None and deadline.expired():
+            return ((i, self._create_timed_out_job(link)) for i, link in enumerate(batch))
+        return self._iter_scrape_links(batch, deadline)
+    
+    def _iter_bulk_batches(self, links: Iterable[str], stats: BulkAnalysisStats) -> Iterator[List[str]]:
+        """Read links lazily into batches, skipping repeated URLs and enforcing BULK_MAX_LINKS"""
+        batch_size = max(1, self.config.BULK_BATCH_SIZE)
+        seen = set()
+        batch = []
+        for link in links:
+            stats.total_links += 1
+            if stats.total_links > self.config.BULK_MAX_LINKS:
+                raise ValueError(f"Too many links. Maximum {self.config.BULK_MAX_LINKS} allowed.")
+            
+            key = self.url_validator.normalize_url(link)
+            if key in seen:
+                stats.repeated_links += 1
+                continue
+            seen.add(key)
+            
+            batch.append(link)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        
+        if batch:
+            yield batch
+    
+    def rank_jobs(self, request: RankRequest) -> RankResponse:
+        """
+        Rank job postings for many resumes at once.
+        Every job is scraped once and the whole resumes x jobs grid is scored in one
+        matrix pass; each resume keeps its top_k jobs, best first.
+        """
+        validation_error = request.validate(self.config.RANK_MAX_RESUMES, self.config.RANK_MAX_LINKS)
         if validation_error:
             raise ValueError(validation_error)
         
         self.logger.info(
-            f"Processing {len(request.links)} job links with {len(request.keywords)} keywords"
+            f"Ranking {len(request.links)} job links for {len(request.resumes)} resumes"
+        )
+        
+        started_at = time.perf_counter()
+        job_data_list = self._scrape_links(self._deduplicate_links(request.links))
+        scored_jobs = [
+            job_data for job_data in job_data_list
+            if job_data.status.value == "success" and not job_data.error_message
+        ]
+        failed_jobs = [job_data for job_data in job_data_list if job_data.error_message]
+        self._index_jobs(job_data_list)
+        
+        rankings = [[] for _ in request.resumes]
+        if scored_jobs:
+            matrix = self.matcher.calculate_match_matrix(
+                request.resumes, [job_data.body for job_data in scored_jobs], request.keywords
+            )
+            top_k = request.top_k or self.config.RANK_DEFAULT_TOP_K
+            for resume_index, scores in enumerate(matrix.total_scores):
+                # Stable sort keeps input order between equal scores
+                top_jobs = (-scores).argsort(kind='stable')[:top_k]
+                rankings[resume_index] = [
+                    JobResult(
+                        job_data=scored_jobs[job_index].without_body(),
+                        match_score=matrix.get_match_score(resume_index, job_index)
+                    )
+                    for job_index in top_jobs
+                ]
+        
+        summary = RankResponse.create_summary(len(request.resumes), len(job_data_list), len(failed_jobs))
+        
+        self.logger.info(self.logger_helper.format_timing_log(
+            self.config.ANALYSIS_MODE, len(job_data_list), time.perf_counter() - started_at
+        ))
+        
+        return RankResponse(rankings=rankings, failed_jobs=failed_jobs, summary=summary)
+    
+    def search_jobs(self, request: SearchRequest) -> SearchResponse:
+        """
+        Find the best previously scraped postings without fetching anything.
+        The index returns the top BM25 candidates, which are re-ranked by blending
+        BM25 (normalized to the best candidate) with the regular match score.
+        """
+        if self.index is None:
+            raise ValueError("Job index is disabled")
+        
+        validation_error = request.validate(self.config.SEARCH_MAX_TOP_K)
+        if validation_error:
+            raise ValueError(validation_error)
+        
+        started_at = time.perf_counter()
+        top_k = request.top_k or self.config.SEARCH_DEFAULT_TOP_K
+        candidates = self.index.search(
+            ' '.join([request.resume] + request.keywords),
+            top_k * max(1, self.config.SEARCH_CANDIDATE_FACTOR)
         )
         
-        # Process each job
         results = []
-        for i, link in enumerate(request.links):
-            self.logger.info(self.logger_helper.format_job_log(i, len(request.links), link))
-            
-            # Scrape job data
-            job_data = self.scraper.extract_job_data(link)
-            
-            # Calculate match score if scraping was successful
-            match_score = None
-            if job_data.status.value == "success" and not job_data.error_message:
-                match_score = self.matcher.calculate_match_score(
-                    request.resume, 
-                    job_data.body, 
-                    request.keywords
+        if candidates:
+            profile = self.matcher.create_resume_profile(request.resume, request.keywords)
+            scores = self.matcher.calculate_match_scores(profile, [job_data.body for job_data, _ in candidates])
+            max_bm25 = max(bm25_score for _, bm25_score in candidates) or 1.0
+            bm25_weight = self.config.SEARCH_BM25_WEIGHT
+            for (job_data, bm25_score), match_score in zip(candidates, scores):
+                search_score = (
+                    (1 - bm25_weight) * match_score.total_score
+                    + bm25_weight * 100.0 * bm25_score / max_bm25
                 )
-            
-            # Create job result
-            job_result = JobResult(job_data=job_data, match_score=match_score)
-            results.append(job_result)
+                results.append(SearchResult(
+                    job_result=JobResult(job_data=job_data.without_body(), match_score=match_score),
+                    bm25_score=bm25_score,
+                    search_score=search_score
+                ))
+            results.sort(key=lambda x: x.search_score, reverse=True)
+            results = results[:top_k]
+        
+        summary = SearchResponse.create_summary(
+            results, len(candidates), self.index.get_stats().get('documents', 0)
+        )
+        
+        self.logger.info(
+            f"Searched index for {len(results)} jobs from {len(candidates)} candidates in "
+            f"{time.perf_counter() - started_at:.3f}s"
+        )
+        
+        return SearchResponse(results=results, summary=summary)
+    
+    def _index_jobs(self, job_data_list: List[JobData]):
+        """Add the successfully scraped jobs to the persistent index, if one is configured"""
+        if self.index is None:
+            return
+        
+        try:
+            self.index.add_jobs(job_data_list)
+        except Exception as e:
+            self.logger.warning(f"Indexing scraped jobs failed: {str(e)}")
+    
+    def _validate_request(self, request: AnalysisRequest):
+        """Validate the request and log what is about to be processed"""
+        validation_error = request.validate(self.config.MAX_LINKS_PER_REQUEST)
+        if validation_error:
+            raise ValueError(validation_error)
+        
+        self.logger.info(
+            f"Processing {len(request.links)} job links with {len(request.keywords)} keywords"
+        )
+    
+    def _build_response(self, 
+                        request: AnalysisRequest, 
+                        job_data_list: List[JobData], 
+                        started_at: float) -> AnalysisResponse:
+        """Score scraped jobs in input order and assemble the sorted response"""
+        for job_data in job_data_list:
+            count(JOB_STATUS, job_data.status.value)
+        self._index_jobs(job_data_list)
+        
+        # Score each unique job once and fan the result out to every requested link
+        unique_results = self._create_job_results(job_data_list, request)
+        results = self._fan_out_results(request.links, unique_results)
         
         # Sort by total score (highest first)
         results.sort(
-            key=lambda x: x.match_score.total_score if x.match_score else 0, 
+            key=lambda x: x.match_score.total_score if x.match_score else 0,
             reverse=True
         )
         
@@ -77,5 +379,278 @@ class JobAnalyzerService(BaseService, IJobAnalyzer):
         summary = AnalysisResponse.create_summary(results)
         
         self.logger.info(self.logger_helper.format_completion_log(len(results)))
+        self.logger.info(self.logger_helper.format_timing_log(
+            self.config.ANALYSIS_MODE, len(results), time.perf_counter() - started_at
+        ))
         
         return AnalysisResponse(results=results, summary=summary)
+    
+    def _create_job_results(self, job_data_list: List[JobData], request: AnalysisRequest) -> List[JobResult]:
+        """
+        Calculate match scores for successfully scraped jobs and wrap every job in a JobResult.
+        The resume is tokenized once and all jobs are scored in a single batch. Near-duplicate
+        postings are scored once per group and marked with the URL of their canonical posting.
+        """
+        scored_jobs = [
+            job_data for job_data in job_data_list
+            if job_data.status.value == "success" and not job_data.error_message
+        ]
+        duplicate_of = self._find_duplicates(scored_jobs)
+        
+        match_scores = {}
+        if scored_jobs:
+            # The first copy of each group in this request is scored for the whole group
+            groups = [duplicate or job_data.url for job_data, duplicate in zip(scored_jobs, duplicate_of)]
+            representatives = {}
+            for job_data, group in zip(scored_jobs, groups):
+                representatives.setdefault(group, job_data)
+            
+            profile = self.matcher.create_resume_profile(request.resume, request.keywords)
+            scores = self.matcher.calculate_match_scores(
+                profile, [job_data.body for job_data in representatives.values()]
+            )
+            group_scores = dict(zip(representatives, scores))
+            match_scores = {id(job_data): group_scores[group] for job_data, group in zip(scored_jobs, groups)}
+        
+        duplicates = {id(job_data): duplicate for job_data, duplicate in zip(scored_jobs, duplicate_of)}
+        return [
+            JobResult(
+                job_data=job_data.without_body(),
+                match_score=match_scores.get(id(job_data)),
+                duplicate_of=duplicates.get(id(job_data))
+            )
+            for job_data in job_data_list
+        ]
+    
+    def _find_duplicates(self, job_data_list: List[JobData]) -> List[Optional[str]]:
+        """Get the canonical posting URL of every near-duplicate job, if a detector is configured"""
+        if self.duplicate_detector is None:
+            return [None] * len(job_data_list)
+        
+        try:
+            return self.duplicate_detector.find_duplicates(job_data_list)
+        except Exception as e:
+            self.logger.warning(f"Duplicate detection failed: {str(e)}")
+            return [None] * len(job_data_list)
+    
+    def _deduplicate_links(self, links: List[str]) -> List[str]:
+        """Keep the first link per normalized URL so tracking-parameter variants are scraped once"""
+        seen = set()
+        unique_links = []
+        for link in links:
+            normalized_link = self.url_validator.normalize_url(link)
+            if normalized_link not in seen:
+                seen.add(normalized_link)
+                unique_links.append(link)
+        
+        return unique_links
+    
+    def _fan_out_results(self, links: List[str], unique_results: List[JobResult]) -> List[JobResult]:
+        """Map results of deduplicated links back onto every requested link, in input order"""
+        results_by_url = {
+            self.url_validator.normalize_url(result.job_data.url): result
+            for result in unique_results
+        }
+        
+        results = []
+        for link in links:
+            result = results_by_url[self.url_validator.normalize_url(link)]
+            if result.job_data.url != link:
+                result = dataclasses.replace(
+                    result, job_data=dataclasses.replace(result.job_data, url=link)
+                )
+            results.append(result)
+        
+        return results
+    
+    def _scrape_links(self, links: List[str], deadline: Deadline = None) -> List[JobData]:
+        """
+        Scrape links in input order with the configured ANALYSIS_MODE.
+        Links not scraped by the deadline are returned as timed out.
+        """
+        if self.config.ANALYSIS_MODE == 'async':
+            return self._get_event_loop().run(self._scrape_async(links, deadline=deadline))
+        if self.config.ANALYSIS_MODE == 'concurrent':
+            return self._scrape_concurrently(links, deadline)
+        return self._scrape_sequentially(links, deadline)
+    
+    def _iter_scrape_links(self, 
+                           links: List[str], 
+                           deadline: Deadline = None, 
+                           concurrent: bool = False) -> Iterator[Tuple[int, JobData]]:
+        """
+        Scrape links with the configured ANALYSIS_MODE, yielding (index, job data) as each completes.
+        With concurrent, sequential mode scrapes on the worker pool as well.
+        """
+        if self.config.ANALYSIS_MODE == 'async':
+            completed = queue.Queue()
+            future = self._get_event_loop().submit(
+                self._scrape_async(links, lambda i, job_data: completed.put((i, job_data)), deadline)
+            )
+            # Ends the wait below however the scrape ends, even when it failed before reporting every link
+            future.add_done_callback(lambda _: completed.put(None))
+            while True:
+                item = completed.get()
+                if item is None:
+                    break
+                yield item
+            future.result()
+        elif self.config.ANALYSIS_MODE == 'concurrent' or concurrent:
+            yield from self._iter_scrape_concurrently(links, deadline)
+        else:
+            for i, link in enumerate(links):
+                yield i, self._scrape_link(i, links, deadline)
+    
+    def _scrape_sequentially(self, links: List[str], deadline: Deadline = None) -> List[JobData]:
+        """Scrape links one at a time"""
+        return [self._scrape_link(i, links, deadline) for i in range(len(links))]
+    
+    def _scrape_link(self, i: int, links: List[str], deadline: Deadline = None) -> JobData:
+        """Scrape the i-th link, or mark it timed out without fetching once the deadline has passed"""
+        if deadline is not None and deadline.expired():
+            return self._create_timed_out_job(links[i])
+        
+        self.logger.info(self.logger_helper.format_job_log(i, len(links), links[i]))
+        return self.scraper.extract_job_data(links[i], deadline)
+    
+    @staticmethod
+    def _create_timed_out_job(link: str) -> JobData:
+        """Create the result of a link left unfinished when the deadline passed"""
+        return JobData.from_error(link, DEADLINE_EXCEEDED_MESSAGE, JobStatus.TIMEOUT)
+    
+    def _scrape_concurrently(self, links: List[str], deadline: Deadline = None) -> List[JobData]:
+        """Scrape links on a bounded worker pool, returning results in input order"""
+        job_data_list: List[JobData] = [None] * len(links)
+        for i, job_data in self._iter_scrape_concurrently(links, deadline):
+            job_data_list[i] = job_data
+        
+        return job_data_list
+    
+    def _iter_scrape_concurrently(self, 
+                                  links: List[str], 
+                                  deadline: Deadline = None) -> Iterator[Tuple[int, JobData]]:
+        """
+        Scrape links on a bounded worker pool, yielding (index, job data) as each completes.
+        A link is only dispatched while its host is below MAX_CONCURRENCY_PER_HOST,
+        so waiting links never occupy a worker. When the deadline passes, queued links are
+        cancelled and every unfinished link is yielded as timed out; fetches already running
+        end on their own at timeouts cut short to the deadline.
+        """
+        executor = self._get_executor()
+        max_in_flight = max(1, self.config.MAX_WORKERS)
+        per_host_limit = max(1, self.config.MAX_CONCURRENCY_PER_HOST)
+        
+        pending = deque(enumerate(links))
+        hosts = [self.url_validator.get_host(link) for link in links]
+        active_per_host: Dict[str, int] = {}
+        in_flight = {}
+        
+        while pending or in_flight:
+            if deadline is not None and deadline.expired():
+                for future, i in in_flight.items():
+                    future.cancel()
+                    yield i, self._create_timed_out_job(links[i])
+                for i, link in pending:
+                    yield i, self._create_timed_out_job(link)
+                return
+            
+            # Dispatch every pending link whose host has spare capacity
+            deferred = deque()
+            while pending and len(in_flight) < max_in_flight:
+                i, link = pending.popleft()
+                host = hosts[i]
+                if active_per_host.get(host, 0) >= per_host_limit:
+                    deferred.append((i, link))
+                    continue
+                
+                self.logger.info(self.logger_helper.format_job_log(i, len(links), link))
+                active_per_host[host] = active_per_host.get(host, 0) + 1
+                in_flight[executor.submit(self.scraper.extract_job_data, link, deadline)] = i
+            pending = deferred + pending
+            
+            timeout = deadline.remaining() if deadline is not None else None
+            done, _ = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                i = in_flight.pop(future)
+                active_per_host[hosts[i]] -= 1
+                try:
+                    job_data = future.result()
+                except Exception as e:
+                    self.logger.error(f"Unexpected error scraping {links[i]}: {str(e)}")
+                    job_data = JobData.from_error(links[i], f"Scraping failed: {str(e)}")
+                yield i, job_data
+    
+    async def _scrape_async(self, 
+                            links: List[str], 
+                            on_result: Callable[[int, JobData], None] = None, 
+                            deadline: Deadline = None) -> List[JobData]:
+        """
+        Scrape links concurrently on the running event loop.
+        Scrapers without native async support are run on the worker pool.
+        on_result is called with (index, job data) as each link completes. Links still
+        running when the deadline passes are cancelled and reported as timed out.
+        """
+        overall_limit = asyncio.Semaphore(max(1, self.config.ASYNC_MAX_CONCURRENCY))
+        per_host_limit = max(1, self.config.MAX_CONCURRENCY_PER_HOST)
+        host_limits: Dict[str, asyncio.Semaphore] = {}
+        
+        async def scrape(i: int, link: str) -> JobData:
+            job_data = await scrape_link(i, link)
+            if on_result is not None:
+                on_result(i, job_data)
+            return job_data
+        
+        async def scrape_link(i: int, link: str) -> JobData:
+            host = self.url_validator.get_host(link)
+            host_limit = host_limits.setdefault(host, asyncio.Semaphore(per_host_limit))
+            async with overall_limit, host_limit:
+                self.logger.info(self.logger_helper.format_job_log(i, len(links), link))
+                try:
+                    if isinstance(self.scraper, IAsyncJobScraper):
+                        return await self.scraper.extract_job_data_async(link, deadline)
+                    
+                    loop = asyncio.get_running_loop()
+                    return await loop.run_in_executor(
+                        self._get_executor(), self.scraper.extract_job_data, link, deadline
+                    )
+                except Exception as e:
+                    self.logger.error(f"Unexpected error scraping {link}: {str(e)}")
+                    return JobData.from_error(link, f"Scraping failed: {str(e)}")
+        
+        tasks = [asyncio.ensure_future(scrape(i, link)) for i, link in enumerate(links)]
+        if deadline is None or not tasks:
+            return list(await asyncio.gather(*tasks))
+        
+        _, unfinished = await asyncio.wait(tasks, timeout=deadline.remaining())
+        for task in unfinished:
+            task.cancel()
+        await asyncio.gather(*unfinished, return_exceptions=True)
+        
+        job_data_list = []
+        for i, (link, task) in enumerate(zip(links, tasks)):
+            if task.cancelled():
+                job_data = self._create_timed_out_job(link)
+                if on_result is not None:
+                    on_result(i, job_data)
+            else:
+                job_data = task.result()
+            job_data_list.append(job_data)
+        
+        return job_data_list
+    
+    def _get_event_loop(self) -> BackgroundEventLoop:
+        """Get the background event loop used to serve async mode from sync callers"""
+        with self._lazy_lock:
+            if self._event_loop is None:
+                self._event_loop = BackgroundEventLoop()
+            return self._event_loop
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the shared worker pool, creating it on first use"""
+        with self._lazy_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=max(1, self.config.MAX_WORKERS),
+                    thread_name_prefix="job-scraper"
+                )
+            return self._executor
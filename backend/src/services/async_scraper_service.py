@@ -0,0 +1,245 @@
+"""
+Asynchronous job scraping service implementing the IAsyncJobScraper interface.
+Shares validation and parsing with JobScraperService, fetching pages with a pooled aiohttp client.
+"""
+
+import asyncio
+import time
+import aiohttp
+import requests
+from typing import Dict, Optional
+
+from core.interfaces import IAsyncJobScraper, IHTMLParser
+from models.job_models import Deadline, JobData, JobStatus
+from config.settings import Config
+from services.scraper_service import JobScraperService
+from utils.http_client import ConnectionPoolStats
+from utils.timing import (
+    CONNECT, DNS, DOWNLOAD, FETCH, HOST_REQUEST, HTTP_CACHE, TTFB, count, record, timed
+)
+
+
+class AsyncJobScraperService(JobScraperService, IAsyncJobScraper):
+    """
+    Service responsible for scraping job data from URLs on an asyncio event loop.
+    The synchronous extract_job_data inherited from JobScraperService keeps working.
+    """
+    
+    def __init__(self, config: Config = None, html_parser: IHTMLParser = None):
+        super().__init__(config, html_parser=html_parser)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._async_pool_stats = ConnectionPoolStats()
+    
+    async def extract_job_data_async(self, url: str, deadline: Deadline = None) -> JobData:
+        """
+        Extract job data from URL with the same error handling as the sync scraper.
+        HTML parsing runs in the default executor so it never blocks other fetches.
+        """
+        # Validate URL first
+        if not self.url_validator.is_valid_url(url):
+            return JobData.from_error(url, "Invalid URL format", JobStatus.INVALID_URL)
+        
+        try:
+            # Skip pages the site asks crawlers not to fetch
+            if not await self._is_allowed_by_robots(url, deadline):
+                return JobData.from_error(url, "Disallowed by robots.txt", JobStatus.DISALLOWED)
+            
+            with timed(FETCH):
+                html_content = await self._fetch_page(url, deadline)
+            if html_content is None:
+                self.logger.warning(f"Content too large for URL: {url}")
+                return JobData.from_error(url, "Content too large")
+            
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self._parse_job_page, url, html_content)
+        
+        except (asyncio.TimeoutError, requests.exceptions.Timeout):
+            return JobData.from_error(url, "Request timeout", JobStatus.TIMEOUT)
+        except aiohttp.ClientResponseError as e:
+            # Match the message format of requests' raise_for_status
+            kind = "Client" if e.status < 500 else "Server"
+            return JobData.from_error(
+                url, f"Request failed: {e.status} {kind} Error: {e.message} for url: {url}"
+            )
+        except aiohttp.ClientError as e:
+            return JobData.from_error(url, f"Request failed: {str(e)}")
+        except Exception as e:
+            self.logger.error(f"Unexpected error scraping {url}: {str(e)}")
+            return JobData.from_error(url, f"Parsing failed: {str(e)}")
+    
+    async def _fetch_page(self, url: str, deadline: Deadline = None) -> Optional[str]:
+        """
+        Fetch page HTML through the response cache.
+        Returns None when the page exceeds MAX_CONTENT_LENGTH.
+        """
+        cache_key = self.url_validator.normalize_url(url)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None and cached.is_fresh(self.config.HTTP_CACHE_TTL):
+            count(HTTP_CACHE, 'hit')
+            return cached.text
+        
+        headers = cached.conditional_headers() if cached else None
+        response = await self._make_request_async(url, headers, deadline)
+        
+        async with response:
+            if response.status == 304 and cached is not None:
+                count(HTTP_CACHE, 'revalidated')
+                self.response_cache.touch(cache_key)
+                return cached.text
+            if self.response_cache is not None:
+                count(HTTP_CACHE, 'miss')
+            
+            response.raise_for_status()
+            with timed(DOWNLOAD):
+                content = await self._read_limited_body_async(response, deadline)
+            if content is None:
+                return None
+            
+            encoding = response.charset or self._detect_encoding(content)
+            self._store_response(cache_key, url, content, encoding, response.headers)
+            return content.decode(encoding, errors="replace")
+    
+    async def _make_request_async(self, 
+                                  url: str, 
+                                  headers: Dict[str, str] = None, 
+                                  deadline: Deadline = None) -> aiohttp.ClientResponse:
+        """
+        Send a GET request over the pooled session once the politeness scheduler allows it.
+        Throttled requests are retried like the sync scraper's, and each attempt's total
+        timeout is cut short to the time left before the deadline.
+        """
+        session = self._get_session()
+        host = self.url_validator.get_host(url)
+        attempt = 0
+        while True:
+            if self.scheduler is not None and not await self.scheduler.acquire_async(
+                host, deadline.remaining() if deadline is not None else None
+            ):
+                # Reported like a fetch timeout, so the link is returned as timed out
+                raise asyncio.TimeoutError()
+            
+            try:
+                with timed(TTFB):
+                    response = await session.get(
+                        url, headers=headers, timeout=self._get_client_timeout(session, deadline)
+                    )
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                count(HOST_REQUEST, host, 'error')
+                self._release_host(host, None)
+                raise
+            except BaseException:
+                # Cancelled at the deadline or failed unexpectedly: free the slot without blaming the host
+                self._cancel_host(host)
+                raise
+            
+            backoff = self._release_host(host, response.status, response.headers.get('Retry-After'))
+            if not self._should_retry(response.status, backoff, attempt, deadline):
+                count(HOST_REQUEST, host, 'error' if response.status >= 400 else 'success')
+                return response
+            response.release()
+            attempt += 1
+    
+    def _get_client_timeout(self, 
+                            session: aiohttp.ClientSession, 
+                            deadline: Deadline = None) -> aiohttp.ClientTimeout:
+        """Get the session's timeout, cut short to the time left before the deadline"""
+        if deadline is None:
+            return session.timeout
+        
+        remaining = deadline.remaining()
+        if remaining <= 0:
+            raise asyncio.TimeoutError()
+        return aiohttp.ClientTimeout(total=min(self.config.REQUEST_TIMEOUT, remaining))
+    
+    async def _is_allowed_by_robots(self, url: str, deadline: Deadline = None) -> bool:
+        """Check robots.txt, fetching it in the default executor on a cache miss"""
+        if self.robots_cache is None:
+            return True
+        
+        allowed = self.robots_cache.lookup(url)
+        if allowed is None:
+            loop = asyncio.get_running_loop()
+            allowed = await loop.run_in_executor(None, self.robots_cache.is_allowed, url, deadline)
+        return allowed
+    
+    async def _read_limited_body_async(self, 
+                                       response: aiohttp.ClientResponse, 
+                                       deadline: Deadline = None) -> Optional[bytearray]:
+        """
+        Stream the response body into a single buffer.
+        Returns None as soon as Content-Length or the bytes read exceed MAX_CONTENT_LENGTH.
+        """
+        max_length = self.config.MAX_CONTENT_LENGTH
+        if response.content_length is not None and response.content_length > max_length:
+            return None
+        
+        content = bytearray()
+        async for chunk in response.content.iter_chunked(self.config.STREAM_CHUNK_SIZE):
+            content += chunk
+            if len(content) > max_length:
+                return None
+            if deadline is not None and deadline.expired():
+                raise asyncio.TimeoutError()
+        
+        return content
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the pooled client session for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            connector = aiohttp.TCPConnector(
+                limit=self.config.ASYNC_MAX_CONCURRENCY,
+                limit_per_host=self.config.MAX_CONCURRENCY_PER_HOST,
+                keepalive_timeout=self.config.HTTP_KEEPALIVE_TIMEOUT
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.config.REQUEST_TIMEOUT),
+                headers={'User-Agent': self.config.USER_AGENT},
+                trace_configs=[self._create_trace_config()]
+            )
+            self._session_loop = loop
+        
+        return self._session
+    
+    def get_connection_stats(self) -> Dict:
+        """Get connection reuse statistics across the sync and async pools"""
+        stats = ConnectionPoolStats()
+        self.http_client.collect_stats(stats)
+        stats.merge(self._async_pool_stats)
+        return stats.to_dict()
+    
+    def _create_trace_config(self) -> aiohttp.TraceConfig:
+        """Create trace hooks counting requests and newly opened connections, timing DNS and connects"""
+        trace_config = aiohttp.TraceConfig()
+        
+        async def on_request_start(session, context, params):
+            self._async_pool_stats.record(requests_made=1)
+        
+        async def on_dns_resolvehost_start(session, context, params):
+            context.dns_started_at = time.perf_counter()
+        
+        async def on_dns_resolvehost_end(session, context, params):
+            record(DNS, time.perf_counter() - context.dns_started_at)
+        
+        async def on_connection_create_start(session, context, params):
+            context.connect_started_at = time.perf_counter()
+        
+        async def on_connection_create_end(session, context, params):
+            self._async_pool_stats.record(handshakes=1)
+            record(CONNECT, time.perf_counter() - context.connect_started_at)
+        
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_dns_resolvehost_start.append(on_dns_resolvehost_start)
+        trace_config.on_dns_resolvehost_end.append(on_dns_resolvehost_end)
+        trace_config.on_connection_create_start.append(on_connection_create_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        return trace_config
+    
+    async def close(self):
+        """Close the pooled client session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
@@ -0,0 +1,103 @@
+"""
+Near-duplicate job detection implementing the IDuplicateDetector interface.
+Recognizes the same posting cross-posted on several sites with MinHash and LSH.
+"""
+
+import itertools
+import logging
+import threading
+from typing import List, Optional, Tuple
+
+from core.interfaces import IDuplicateDetector, BaseService
+from models.job_models import JobData
+from config.settings import Config
+from utils.helpers import URLValidator
+from utils.minhash import LSHIndex, MinHasher
+
+
+class DuplicateDetectorService(BaseService, IDuplicateDetector):
+    """
+    Groups job postings whose bodies are near-duplicates.
+    Every posting seen is remembered in an LSH index, so duplicates are found within a
+    request and against earlier requests. The earliest posting of a group is its canonical.
+    """
+    
+    def __init__(self, config: Config = None):
+        super().__init__()
+        self.config = config or Config()
+        self.url_validator = URLValidator()
+        self.minhasher = MinHasher(
+            self.config.MINHASH_NUM_PERM,
+            self.config.MINHASH_SHINGLE_SIZE,
+            vectorized=self.config.MINHASH_VECTORIZED
+        )
+        self.lsh_index = LSHIndex(
+            self.config.MINHASH_NUM_PERM, self.config.LSH_BANDS, self.config.DUPLICATE_INDEX_SIZE
+        )
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+    
+    def _setup_logging(self):
+        """Setup logging for the duplicate detector service"""
+        self.logger = logging.getLogger(__name__)
+    
+    def find_duplicates(self, job_data_list: List[JobData]) -> List[Optional[str]]:
+        """
+        Get, for every job in order, the URL of the canonical posting it duplicates.
+        Canonical postings, failed jobs and unique jobs get None.
+        """
+        signatures = [
+            self.minhasher.signature(job_data.body) if not job_data.error_message else None
+            for job_data in job_data_list
+        ]
+        
+        duplicate_of = []
+        with self._lock:
+            for job_data, signature in zip(job_data_list, signatures):
+                if signature is None:
+                    duplicate_of.append(None)
+                    continue
+                
+                key = self.url_validator.normalize_url(job_data.url)
+                canonical = self._find_canonical(key, signature)
+                existing = self.lsh_index.get(key)
+                sequence = existing[1][0] if existing else next(self._sequence)
+                if canonical is None:
+                    self.lsh_index.insert(key, signature, (sequence, job_data.url, None))
+                    duplicate_of.append(None)
+                else:
+                    canonical_key, canonical_url = canonical
+                    self.lsh_index.insert(key, signature, (sequence, job_data.url, canonical_key))
+                    self.lsh_index.touch(canonical_key)
+                    duplicate_of.append(canonical_url)
+        
+        return duplicate_of
+    
+    def _find_canonical(self, key: str, signature: Tuple[int, ...]) -> Optional[Tuple[str, str]]:
+        """Get the key and URL of the oldest canonical posting similar to the signature"""
+        best = None
+        for candidate in self.lsh_index.query(signature):
+            if candidate == key:
+                continue
+            candidate_signature, (_, _, canonical_key) = self.lsh_index.get(candidate)
+            similarity = self.minhasher.estimate_similarity(signature, candidate_signature)
+            if similarity < self.config.DUPLICATE_THRESHOLD:
+                continue
+            
+            # Resolve to the group's canonical unless it has been evicted
+            root = canonical_key if canonical_key and self.lsh_index.get(canonical_key) else candidate
+            if root == key:
+                continue
+            sequence, url, _ = self.lsh_index.get(root)[1]
+            if best is None or sequence < best[0]:
+                best = (sequence, root, url)
+        
+        return best[1:] if best else None
+
+
+def create_duplicate_detector(config: Config) -> Optional[DuplicateDetectorService]:
+    """Create the near-duplicate detector when enabled in config"""
+    if not config.DUPLICATE_DETECTION_ENABLED:
+        return None
+    
+    return DuplicateDetectorService(config)
@@ -0,0 +1,538 @@
+"""
+HTML parser backends implementing the IHTMLParser interface.
+Every backend reproduces the output of BeautifulSoup's html.parser builder:
+the title of the first TITLE_SELECTORS match and the document text with
+REMOVE_ELEMENTS stripped, cleaned and truncated to MAX_TEXT_LENGTH.
+"""
+
+import re
+from abc import abstractmethod
+from html import unescape as html_unescape
+from html.entities import html5
+from html.parser import HTMLParser
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from core.interfaces import IHTMLParser
+from config.settings import Config
+from utils.helpers import TextProcessor
+from utils.timing import EXTRACT, PARSE, timed
+
+
+DEFAULT_TITLE = "Job Posting"
+
+# BeautifulSoup's get_text() skips strings inside these elements
+NON_TEXT_ELEMENTS = ('script', 'style', 'template', 'rt', 'rp')
+
+# BeautifulSoup's HTMLTreeBuilder closes these immediately and keeps whitespace in these
+VOID_ELEMENTS = frozenset({
+    'area', 'base', 'basefont', 'bgsound', 'br', 'col', 'command', 'embed', 'frame', 'hr',
+    'image', 'img', 'input', 'isindex', 'keygen', 'link', 'menuitem', 'meta', 'nextid',
+    'param', 'source', 'spacer', 'track', 'wbr'
+})
+PRESERVE_WHITESPACE_ELEMENTS = frozenset({'pre', 'textarea'})
+
+# Characters str.splitlines() breaks on
+LINE_BREAKS = frozenset('\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029')
+ASCII_SPACES = ' \n\t\x0c\r'
+
+SIMPLE_SELECTOR_PATTERN = re.compile(
+    r'([.#]?)([\w-]+)|\[([\w-]+)(?:=(?:"([^"]*)"|\'([^\']*)\'|([\w-]+)))?\]'
+)
+
+
+def _build_entity_table() -> Dict[str, str]:
+    """
+    Map entity names to characters as BeautifulSoup's EntitySubstitution does: the first
+    of the sorted HTML5 names with and without a semicolon wins. Built from the standard
+    library so the streaming backend does not import bs4.
+    """
+    table: Dict[str, str] = {}
+    for name, character in sorted(html5.items()):
+        table.setdefault(name[:-1] if name.endswith(';') else name, character)
+    return table
+
+
+HTML_ENTITY_TO_CHARACTER = _build_entity_table()
+
+
+class BaseHTMLParser(IHTMLParser):
+    """Base parser running title and text extraction on a single parsed document"""
+    
+    def __init__(self, config: Config = None):
+        self.config = config or Config()
+        self.text_processor = TextProcessor()
+    
+    def extract_title(self, html_content: str) -> str:
+        """Extract title from HTML content"""
+        return self._extract_title(self._parse_document(html_content))
+    
+    def extract_clean_text(self, html_content: str) -> str:
+        """Extract and clean text content from HTML"""
+        return self._extract_clean_text(self._parse_document(html_content))
+    
+    def parse(self, html_content: str) -> Tuple[str, str]:
+        """Extract title and clean text from one parsed document"""
+        with timed(PARSE):
+            document = self._parse_document(html_content)
+        
+        # The title is extracted first because text extraction removes elements
+        with timed(EXTRACT):
+            title = self._extract_title(document)
+            body = self._extract_clean_text(document)
+        return title, body
+    
+    @abstractmethod
+    def _parse_document(self, html_content: str) -> Any:
+        """Parse HTML content into the backend's document type"""
+        pass
+    
+    @abstractmethod
+    def _extract_title(self, document: Any) -> str:
+        """Extract job title with multiple fallback strategies"""
+        pass
+    
+    @abstractmethod
+    def _extract_clean_text(self, document: Any) -> str:
+        """Extract and clean body text, removing REMOVE_ELEMENTS"""
+        pass
+
+
+class BeautifulSoupHTMLParser(BaseHTMLParser):
+    """Reference backend using BeautifulSoup with Python's built-in html.parser"""
+    
+    def __init__(self, config: Config = None):
+        super().__init__(config)
+        # Imported here so the other backends start without loading BeautifulSoup
+        from bs4 import BeautifulSoup
+        
+        self._soup_class = BeautifulSoup
+    
+    def _parse_document(self, html_content: str) -> Any:
+        return self._soup_class(html_content, "html.parser")
+    
+    def _extract_title(self, soup: Any) -> str:
+        """Extract job title with multiple fallback strategies"""
+        for selector in self.config.TITLE_SELECTORS:
+            element = soup.select_one(selector)
+            if element and element.get_text(strip=True):
+                return element.get_text(strip=True)
+        
+        return DEFAULT_TITLE
+    
+    def _extract_clean_text(self, soup: Any) -> str:
+        """Extract and clean body text from HTML"""
+        # Remove unwanted elements
+        for element_name in self.config.REMOVE_ELEMENTS:
+            for element in soup(element_name):
+                element.decompose()
+        
+        # Get text and clean it
+        text = soup.get_text()
+        return self.text_processor.clean_html_text(text, self.config.MAX_TEXT_LENGTH)
+
+
+class LxmlHTMLParser(BaseHTMLParser):
+    """libxml2 backend; CSS title selectors are compiled to XPath once"""
+    
+    def __init__(self, config: Config = None):
+        super().__init__(config)
+        # Optional dependencies, only required when this backend is selected
+        import lxml.html
+        from cssselect import GenericTranslator
+        from lxml import etree
+        
+        self._lxml_html = lxml.html
+        self._parser_error = etree.ParserError
+        self._comment_class = etree.Comment
+        translator = GenericTranslator()
+        self._title_xpaths = [
+            etree.XPath(translator.css_to_xpath(selector))
+            for selector in self.config.TITLE_SELECTORS
+        ]
+    
+    def _parse_document(self, html_content: str) -> Any:
+        try:
+            document = self._lxml_html.document_fromstring(html_content)
+        except ValueError:
+            # Unicode strings with an XML encoding declaration must be parsed as bytes
+            document = self._lxml_html.document_fromstring(html_content.encode('utf-8'))
+        except self._parser_error:
+            return None
+        
+        # Strings inside these elements are never text. They are swapped for empty
+        # comments so the surrounding strings stay separate, as they do in BeautifulSoup
+        for element in list(document.iter(*NON_TEXT_ELEMENTS)):
+            placeholder = self._comment_class()
+            placeholder.tail = element.tail
+            element.getparent().replace(element, placeholder)
+        
+        return document
+    
+    def _extract_title(self, document: Any) -> str:
+        """Extract job title with multiple fallback strategies"""
+        if document is None:
+            return DEFAULT_TITLE
+        
+        for title_xpath in self._title_xpaths:
+            elements = title_xpath(document)
+            if elements:
+                title = ''.join(part.strip() for part in elements[0].itertext())
+                if title:
+                    return title
+        
+        return DEFAULT_TITLE
+    
+    def _extract_clean_text(self, document: Any) -> str:
+        """Extract and clean body text from HTML"""
+        if document is None:
+            return ""
+        
+        for element in list(document.iter(*self.config.REMOVE_ELEMENTS)):
+            element.drop_tree()
+        
+        text = ''.join(document.itertext())
+        return self.text_processor.clean_html_text(text, self.config.MAX_TEXT_LENGTH)
+
+
+class SelectolaxHTMLParser(BaseHTMLParser):
+    """Lexbor backend via selectolax - the fastest available HTML5 parser"""
+    
+    def __init__(self, config: Config = None):
+        super().__init__(config)
+        # Optional dependency, only required when this backend is selected
+        from selectolax.lexbor import LexborHTMLParser
+        
+        self._parser_class = LexborHTMLParser
+    
+    def _parse_document(self, html_content: str) -> Any:
+        tree = self._parser_class(html_content)
+        tree.strip_tags(list(NON_TEXT_ELEMENTS))
+        return tree
+    
+    def _extract_title(self, tree: Any) -> str:
+        """Extract job title with multiple fallback strategies"""
+        for selector in self.config.TITLE_SELECTORS:
+            node = tree.css_first(selector)
+            if node is not None:
+                title = node.text(deep=True, separator='', strip=True)
+                if title:
+                    return title
+        
+        return DEFAULT_TITLE
+    
+    def _extract_clean_text(self, tree: Any) -> str:
+        """Extract and clean body text from HTML"""
+        tree.strip_tags(list(self.config.REMOVE_ELEMENTS))
+        if tree.root is None:
+            return ""
+        
+        text = tree.root.text(deep=True, separator='', strip=False)
+        return self.text_processor.clean_html_text(text, self.config.MAX_TEXT_LENGTH)
+
+
+def compile_simple_selector(selector: str) -> Optional[Callable[[str, Dict[str, str]], bool]]:
+    """
+    Compile a compound selector made of a tag name, .class, #id and [attr="value"] parts
+    into a predicate over (tag, attributes). Returns None for anything more complex.
+    """
+    conditions = []
+    position = 0
+    for match in SIMPLE_SELECTOR_PATTERN.finditer(selector.strip()):
+        if match.start() != position:
+            return None
+        position = match.end()
+        
+        prefix, name, attribute = match.group(1), match.group(2), match.group(3)
+        if attribute is not None:
+            value = next((group for group in match.groups()[3:] if group is not None), None)
+            conditions.append(
+                lambda tag, attrs, key=attribute.lower(), value=value:
+                key in attrs and (value is None or attrs[key] == value)
+            )
+        elif prefix == '.':
+            conditions.append(lambda tag, attrs, name=name: name in attrs.get('class', '').split())
+        elif prefix == '#':
+            conditions.append(lambda tag, attrs, name=name: attrs.get('id') == name)
+        elif not conditions:
+            conditions.append(lambda tag, attrs, name=name.lower(): tag == name)
+        else:
+            return None
+    
+    if not conditions or position != len(selector.strip()):
+        return None
+    return lambda tag, attrs: all(condition(tag, attrs) for condition in conditions)
+
+
+class _StreamingTextCollector(HTMLParser):
+    """
+    Tokenizer-driven replica of BeautifulSoup's html.parser tree builder.
+    Instead of building a tree it keeps the string boundaries, whitespace and
+    element nesting rules of BeautifulSoup, collecting the text of the first
+    element matching each title selector and cleaning body text line by line.
+    """
+    
+    def __init__(self, 
+                 title_matchers: List[Callable[[str, Dict[str, str]], bool]], 
+                 remove_elements: List[str], 
+                 max_length: int):
+        super().__init__(convert_charrefs=False)
+        self.title_matchers = title_matchers
+        self.remove_elements = frozenset(remove_elements)
+        self.max_length = max_length
+        
+        self._pending_data: List[str] = []
+        self._stack: List[Tuple[str, List[int]]] = []
+        self._open_counts: Dict[str, int] = {}
+        self._already_closed: List[str] = []
+        self._removed_depth = 0
+        self._preserve_depth = 0
+        self._string_containers: List[str] = []
+        
+        # Title state per selector: open captures collect strings until their element closes.
+        # Like get_text(), an element only keeps strings of its own kind (see _string_kind)
+        self._title_captures: Dict[int, Tuple[Tuple[Optional[str], ...], List[str]]] = {}
+        self._titles: List[Optional[str]] = [None] * len(title_matchers)
+        
+        self._partial_line: List[str] = []
+        self._chunks: List[str] = []
+        self._body_length = 0
+        self.body_complete = False
+    
+    @property
+    def title_resolved(self) -> bool:
+        """Whether later markup can no longer change the extracted title"""
+        for index, title in enumerate(self._titles):
+            if index in self._title_captures or title is None:
+                return False
+            if title:
+                return True
+        return True
+    
+    @property
+    def finished(self) -> bool:
+        """Whether both title and body are final so the rest of the page can be skipped"""
+        return self.body_complete and self.title_resolved
+    
+    def finish(self):
+        """Flush everything still buffered once the whole document has been fed"""
+        self.close()
+        self._end_data()
+        for index in list(self._title_captures):
+            self._close_title_capture(index)
+        if self._partial_line:
+            self._add_line(''.join(self._partial_line))
+            self._partial_line = []
+    
+    def get_title(self) -> str:
+        """Title of the first selector whose element has non-empty text"""
+        return next((title for title in self._titles if title), DEFAULT_TITLE)
+    
+    def get_body(self) -> str:
+        """Cleaned body text, identical to TextProcessor.clean_html_text output"""
+        body = ' '.join(self._chunks)
+        return body[:self.max_length] if self.max_length else body
+    
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]):
+        self._end_data()
+        self._push_element(tag, attrs)
+        if tag in VOID_ELEMENTS:
+            self._pop_element()
+            # An explicit closing tag for this element may follow and must be ignored
+            self._already_closed.append(tag)
+    
+    def handle_startendtag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]):
+        self._end_data()
+        self._push_element(tag, attrs)
+        self._pop_element()
+    
+    def handle_endtag(self, tag: str):
+        if tag in self._already_closed:
+            self._already_closed.remove(tag)
+            return
+        
+        self._end_data()
+        if not self._open_counts.get(tag):
+            return
+        while self._pop_element() != tag:
+            pass
+    
+    def handle_data(self, data: str):
+        if data:
+            self._pending_data.append(data)
+    
+    def handle_charref(self, name: str):
+        self.handle_data(html_unescape(f'&#{name};'))
+    
+    def handle_entityref(self, name: str):
+        character = HTML_ENTITY_TO_CHARACTER.get(name)
+        self.handle_data(character if character is not None else f'&{name}')
+    
+    def handle_comment(self, data: str):
+        self._end_data()
+    
+    def handle_decl(self, decl: str):
+        self._end_data()
+    
+    def handle_pi(self, data: str):
+        self._end_data()
+    
+    def unknown_decl(self, data: str):
+        self._end_data()
+        if data.upper().startswith('CDATA['):
+            # CDATA sections are text everywhere except inside removed elements
+            self.handle_data(data[len('CDATA['):])
+            self._end_data(is_cdata=True)
+    
+    def _push_element(self, tag: str, attrs: List[Tuple[str, Optional[str]]]):
+        captures = []
+        if self.title_matchers and any(title is None for title in self._titles):
+            attributes = {key: value or '' for key, value in attrs}
+            for index, matcher in enumerate(self.title_matchers):
+                if self._titles[index] is None and index not in self._title_captures \
+                        and matcher(tag, attributes):
+                    kinds = (tag,) if tag in NON_TEXT_ELEMENTS else (None, 'cdata')
+                    self._title_captures[index] = (kinds, [])
+                    captures.append(index)
+        
+        self._stack.append((tag, captures))
+        self._open_counts[tag] = self._open_counts.get(tag, 0) + 1
+        self._removed_depth += tag in self.remove_elements
+        self._preserve_depth += tag in PRESERVE_WHITESPACE_ELEMENTS
+        if tag in NON_TEXT_ELEMENTS:
+            self._string_containers.append(tag)
+    
+    def _pop_element(self) -> str:
+        tag, captures = self._stack.pop()
+        self._open_counts[tag] -= 1
+        self._removed_depth -= tag in self.remove_elements
+        self._preserve_depth -= tag in PRESERVE_WHITESPACE_ELEMENTS
+        if tag in NON_TEXT_ELEMENTS:
+            self._string_containers.pop()
+        for index in captures:
+            self._close_title_capture(index)
+        return tag
+    
+    def _close_title_capture(self, index: int):
+        _, parts = self._title_captures.pop(index)
+        self._titles[index] = ''.join(part.strip() for part in parts)
+    
+    def _end_data(self, is_cdata: bool = False):
+        """Turn buffered data into one string, as BeautifulSoup.endData does"""
+        if not self._pending_data:
+            return
+        
+        text = ''.join(self._pending_data)
+        self._pending_data = []
+        if not self._preserve_depth and not text.strip(ASCII_SPACES):
+            text = '\n' if '\n' in text else ' '
+        
+        kind = self._string_kind(is_cdata)
+        for kinds, parts in self._title_captures.values():
+            if kind in kinds:
+                parts.append(text)
+        
+        if kind in (None, 'cdata') and not self._removed_depth and not self.body_complete:
+            self._add_body_text(text)
+    
+    def _string_kind(self, is_cdata: bool) -> Optional[str]:
+        """
+        Kind of a new string: 'cdata', the innermost enclosing NON_TEXT_ELEMENTS tag,
+        or None for regular text
+        """
+        if is_cdata:
+            return 'cdata'
+        return self._string_containers[-1] if self._string_containers else None
+    
+    def _add_body_text(self, text: str):
+        """Clean every completed line; the trailing partial line waits for more text"""
+        lines = text.splitlines(True)
+        if self._partial_line:
+            lines[0] = ''.join(self._partial_line) + lines[0]
+            self._partial_line = []
+        if lines[-1][-1] not in LINE_BREAKS:
+            self._partial_line.append(lines.pop())
+        
+        for line in lines:
+            self._add_line(line)
+            if self.body_complete:
+                return
+    
+    def _add_line(self, line: str):
+        for phrase in line.strip().split('  '):
+            chunk = phrase.strip()
+            if not chunk:
+                continue
+            
+            self._body_length += len(chunk) + (1 if self._chunks else 0)
+            self._chunks.append(chunk)
+            if self.max_length and self._body_length >= self.max_length:
+                self.body_complete = True
+                self._partial_line = []
+                return
+
+
+class StreamingHTMLParser(BaseHTMLParser):
+    """
+    Single-pass backend on the standard library tokenizer that produces the same output
+    as the BeautifulSoup backend without building a tree. Removed elements are skipped
+    while streaming and parsing stops once MAX_TEXT_LENGTH characters of clean text
+    have been collected and the title can no longer change.
+    """
+    
+    FEED_CHUNK_SIZE = 8192
+    
+    def __init__(self, config: Config = None):
+        super().__init__(config)
+        title_matchers = [compile_simple_selector(selector) for selector in self.config.TITLE_SELECTORS]
+        
+        # Selectors beyond the simple subset fall back to BeautifulSoup for the title
+        self._title_fallback = None
+        if any(matcher is None for matcher in title_matchers):
+            self._title_fallback = BeautifulSoupHTMLParser(self.config)
+            title_matchers = []
+        self._title_matchers = title_matchers
+    
+    def _parse_document(self, html_content: str) -> Any:
+        collector = _StreamingTextCollector(
+            self._title_matchers, self.config.REMOVE_ELEMENTS, self.config.MAX_TEXT_LENGTH
+        )
+        for offset in range(0, len(html_content), self.FEED_CHUNK_SIZE):
+            collector.feed(html_content[offset:offset + self.FEED_CHUNK_SIZE])
+            if collector.finished:
+                break
+        else:
+            collector.finish()
+        
+        if self._title_fallback is not None:
+            collector.title = self._title_fallback.extract_title(html_content)
+        else:
+            collector.title = collector.get_title()
+        return collector
+    
+    def _extract_title(self, collector: Any) -> str:
+        """Extract job title with multiple fallback strategies"""
+        return collector.title
+    
+    def _extract_clean_text(self, collector: Any) -> str:
+        """Extract and clean body text from HTML"""
+        return collector.get_body()
+
+
+HTML_PARSER_BACKENDS = {
+    'beautifulsoup': BeautifulSoupHTMLParser,
+    'lxml': LxmlHTMLParser,
+    'selectolax': SelectolaxHTMLParser,
+    'streaming': StreamingHTMLParser
+}
+
+
+def create_html_parser(config: Config) -> IHTMLParser:
+    """Create the HTML parser backend selected by HTML_PARSER_BACKEND"""
+    backend = config.HTML_PARSER_BACKEND
+    if backend not in HTML_PARSER_BACKENDS:
+        raise ValueError(
+            f"Unknown HTML parser backend '{backend}'. "
+            f"Choose one of: {', '.join(HTML_PARSER_BACKENDS)}"
+        )
+    
+    return HTML_PARSER_BACKENDS[backend](config)
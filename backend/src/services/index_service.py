@@ -0,0 +1,359 @@
+"""
+Persistent job index implementing the IJobIndex interface.
+Keeps scraped postings in an on-disk SQLite inverted index ranked with BM25.
+"""
+
+import hashlib
+import logging
+import math
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from core.interfaces import IJobIndex, BaseService
+from models.job_models import JobData
+from config.settings import Config
+from utils.helpers import TextProcessor, URLValidator
+
+
+class JobIndexService(BaseService, IJobIndex):
+    """
+    Inverted index of job postings keyed by normalized URL.
+    Postings are stored per (term, document), highest term frequency first, so a query
+    only reads the head of the posting lists of its own terms. Deleted and replaced documents are tombstoned and their postings
+    are reclaimed by compact(); document frequencies and length statistics are updated
+    immediately, so BM25 scores never count deleted documents. Past JOB_INDEX_MAX_DOCUMENTS,
+    the least recently indexed documents are removed outright, so the file stops growing.
+    """
+    
+    DB_FILENAME = 'job_index.sqlite3'
+    
+    # SQLite limits the number of bound parameters per statement
+    MAX_QUERY_PARAMETERS = 500
+    
+    # Work per step of compact(), each under the lock: deleted documents purged, then
+    # free pages returned to the file system
+    COMPACT_DOCUMENTS_PER_STEP = 50
+    VACUUM_PAGES_PER_STEP = 256
+    
+    def __init__(self, config: Config = None, index_dir: str = None):
+        super().__init__()
+        self.config = config or Config()
+        self.text_processor = TextProcessor()
+        self.url_validator = URLValidator()
+        self._lock = threading.Lock()
+        
+        index_dir = index_dir or self.config.JOB_INDEX_DIR
+        os.makedirs(index_dir, exist_ok=True)
+        self._path = os.path.join(index_dir, self.DB_FILENAME)
+        self._connection = sqlite3.connect(
+            self._path,
+            check_same_thread=False,
+            isolation_level=None
+        )
+        # Only takes effect on a new database; compact() converts older ones
+        self._connection.execute('PRAGMA auto_vacuum=INCREMENTAL')
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._create_schema()
+    
+    def _setup_logging(self):
+        """Setup logging for the index service"""
+        self.logger = logging.getLogger(__name__)
+    
+    def _create_schema(self):
+        """Create the index tables on first use"""
+        self._connection.executescript(
+            'CREATE TABLE IF NOT EXISTS documents ('
+            ' doc_id INTEGER PRIMARY KEY, key TEXT NOT NULL, deleted INTEGER NOT NULL DEFAULT 0,'
+            ' length INTEGER, word_count INTEGER, content_hash TEXT, indexed_at REAL,'
+            ' url TEXT, title TEXT);'
+            # Bodies live apart so scoring lookups stay within a compact documents table
+            'CREATE TABLE IF NOT EXISTS bodies (doc_id INTEGER PRIMARY KEY, body TEXT);'
+            'CREATE UNIQUE INDEX IF NOT EXISTS documents_live_key ON documents (key) WHERE deleted = 0;'
+            'CREATE TABLE IF NOT EXISTS postings ('
+            ' term TEXT NOT NULL, doc_id INTEGER NOT NULL, tf INTEGER NOT NULL,'
+            ' PRIMARY KEY (term, tf DESC, doc_id)) WITHOUT ROWID;'
+            'CREATE INDEX IF NOT EXISTS postings_doc_id ON postings (doc_id);'
+            'CREATE TABLE IF NOT EXISTS terms (term TEXT PRIMARY KEY, df INTEGER NOT NULL) WITHOUT ROWID;'
+            'CREATE TABLE IF NOT EXISTS stats (name TEXT PRIMARY KEY, value INTEGER NOT NULL) WITHOUT ROWID;'
+            "INSERT OR IGNORE INTO stats VALUES ('documents', 0), ('total_length', 0), ('deleted', 0);"
+        )
+    
+    def add_jobs(self, job_data_list: List[JobData]) -> int:
+        """
+        Add or replace successfully scraped jobs.
+        Jobs whose URL is already indexed with the same content are skipped.
+        Returns the number of documents written.
+        """
+        added = 0
+        with self._lock:
+            self._connection.execute('BEGIN')
+            try:
+                for job_data in job_data_list:
+                    if job_data.error_message or not job_data.body:
+                        continue
+                    if self._add_job(job_data):
+                        added += 1
+                if added:
+                    self._evict()
+                self._connection.execute('COMMIT')
+            except sqlite3.Error:
+                self._connection.execute('ROLLBACK')
+                raise
+        
+        return added
+    
+    def _add_job(self, job_data: JobData) -> bool:
+        """Index a single job inside the open transaction"""
+        key = self.url_validator.normalize_url(job_data.url)
+        content_hash = hashlib.sha1(
+            f"{job_data.title}\0{job_data.body}".encode('utf-8', 'surrogatepass')
+        ).hexdigest()
+        
+        existing = self._connection.execute(
+            'SELECT doc_id, content_hash FROM documents WHERE key = ? AND deleted = 0', (key,)
+        ).fetchone()
+        if existing is not None:
+            if existing[1] == content_hash:
+                return False
+            self._delete_document(existing[0])
+        
+        term_counts = Counter(self.text_processor.normalize_text(f"{job_data.title} {job_data.body}"))
+        length = sum(term_counts.values())
+        doc_id = self._connection.execute(
+            'INSERT INTO documents (key, length, word_count, content_hash, indexed_at, url, title)'
+            ' VALUES (?, ?, ?, ?, ?, ?, ?)',
+            (key, length, job_data.word_count, content_hash, time.time(), job_data.url, job_data.title)
+        ).lastrowid
+        self._connection.execute('INSERT INTO bodies VALUES (?, ?)', (doc_id, job_data.body))
+        
+        self._connection.executemany(
+            'INSERT INTO postings (term, doc_id, tf) VALUES (?, ?, ?)',
+            ((term, doc_id, tf) for term, tf in term_counts.items())
+        )
+        self._connection.executemany(
+            'INSERT INTO terms VALUES (?, 1) ON CONFLICT (term) DO UPDATE SET df = df + 1',
+            ((term,) for term in term_counts)
+        )
+        self._update_stats(documents=1, total_length=length)
+        return True
+    
+    def _evict(self):
+        """Remove the least recently indexed documents past JOB_INDEX_MAX_DOCUMENTS, within the transaction"""
+        excess = self._get_stats()['documents'] - self.config.JOB_INDEX_MAX_DOCUMENTS
+        if self.config.JOB_INDEX_MAX_DOCUMENTS <= 0 or excess <= 0:
+            return
+        
+        # Replaced documents get new IDs, so ID order is indexing order
+        doc_ids = [row[0] for row in self._connection.execute(
+            'SELECT doc_id FROM documents WHERE deleted = 0 ORDER BY doc_id LIMIT ?', (excess,)
+        )]
+        for doc_id in doc_ids:
+            self._delete_document(doc_id)
+        self._delete_rows(doc_ids)
+        self.logger.info(f"Evicted {len(doc_ids)} documents from the job index")
+    
+    def remove_jobs(self, urls: List[str]) -> int:
+        """Delete jobs by URL. Returns the number of documents removed."""
+        removed = 0
+        with self._lock:
+            self._connection.execute('BEGIN')
+            try:
+                for url in urls:
+                    row = self._connection.execute(
+                        'SELECT doc_id FROM documents WHERE key = ? AND deleted = 0',
+                        (self.url_validator.normalize_url(url),)
+                    ).fetchone()
+                    if row is not None:
+                        self._delete_document(row[0])
+                        removed += 1
+                self._connection.execute('COMMIT')
+            except sqlite3.Error:
+                self._connection.execute('ROLLBACK')
+                raise
+        
+        return removed
+    
+    def _delete_document(self, doc_id: int):
+        """Tombstone a document and remove it from the term statistics"""
+        length = self._connection.execute(
+            'SELECT length FROM documents WHERE doc_id = ?', (doc_id,)
+        ).fetchone()[0]
+        self._connection.execute('UPDATE documents SET deleted = 1 WHERE doc_id = ?', (doc_id,))
+        self._connection.execute(
+            'UPDATE terms SET df = df - 1 WHERE term IN (SELECT term FROM postings WHERE doc_id = ?)',
+            (doc_id,)
+        )
+        self._update_stats(documents=-1, total_length=-length, deleted=1)
+    
+    def search(self, query: str, limit: int) -> List[Tuple[JobData, float]]:
+        """
+        Get up to limit indexed jobs ranked by their BM25 score for the query text.
+        Query cost is bounded by the index settings rather than the corpus size: only the
+        rarest SEARCH_MAX_QUERY_TERMS query terms are looked up, and each term contributes
+        its SEARCH_POSTINGS_PER_TERM highest term frequency postings. Terms with shorter
+        posting lists, which carry most of the BM25 weight, are scored exactly.
+        """
+        query_terms = set(self.text_processor.normalize_text(query))
+        if not query_terms or limit < 1:
+            return []
+        
+        with self._lock:
+            stats = self._get_stats()
+            document_count = stats['documents']
+            if not document_count:
+                return []
+            
+            term_weights = self._get_query_term_weights(query_terms, document_count)
+            if not term_weights:
+                return []
+            
+            # Postings are clustered by (term, tf DESC), so every branch is a range read that
+            # skips the postings of deleted documents before taking its limit
+            postings_per_term = max(1, self.config.SEARCH_POSTINGS_PER_TERM)
+            term_postings = ' UNION ALL '.join(
+                ['SELECT * FROM (SELECT t.doc_id, t.tf, ? AS idf FROM postings t'
+                 ' JOIN documents l ON l.doc_id = t.doc_id AND l.deleted = 0'
+                 ' WHERE t.term = ? ORDER BY t.tf DESC LIMIT ?)'] * len(term_weights)
+            )
+            average_length = stats['total_length'] / document_count or 1.0
+            k1, b = self.config.BM25_K1, self.config.BM25_B
+            scores = self._connection.execute(
+                'SELECT d.doc_id,'
+                ' SUM(p.idf * p.tf * (? + 1) / (p.tf + ? * (1 - ? + ? * d.length / ?))) AS score'
+                f" FROM ({term_postings}) p"
+                ' JOIN documents d ON d.doc_id = p.doc_id'
+                ' GROUP BY d.doc_id ORDER BY score DESC, d.doc_id LIMIT ?',
+                [k1, k1, b, b, average_length]
+                + [value for term, idf in term_weights.items() for value in (idf, term, postings_per_term)]
+                + [limit]
+            ).fetchall()
+            
+            # Bodies are only read for the documents that made the cut
+            documents = {
+                row[0]: row[1:] for row in self._connection.execute(
+                    'SELECT d.doc_id, d.url, d.title, b.body, d.word_count'
+                    ' FROM documents d JOIN bodies b ON b.doc_id = d.doc_id'
+                    f" WHERE d.doc_id IN ({', '.join('?' * len(scores))})",
+                    [doc_id for doc_id, _ in scores]
+                )
+            }
+        
+        return [(JobData(*documents[doc_id]), score) for doc_id, score in scores]
+    
+    def _get_query_term_weights(self, query_terms: set, document_count: int) -> Dict[str, float]:
+        """Pick the rarest indexed query terms and compute their BM25 inverse document frequency"""
+        terms = list(query_terms)
+        frequencies = []
+        for start in range(0, len(terms), self.MAX_QUERY_PARAMETERS):
+            chunk = terms[start:start + self.MAX_QUERY_PARAMETERS]
+            frequencies.extend(self._connection.execute(
+                f"SELECT term, df FROM terms WHERE df > 0 AND term IN ({', '.join('?' * len(chunk))})",
+                chunk
+            ).fetchall())
+        
+        frequencies.sort(key=lambda item: (item[1], item[0]))
+        return {
+            term: math.log(1 + (document_count - df + 0.5) / (df + 0.5))
+            for term, df in frequencies[:self.config.SEARCH_MAX_QUERY_TERMS]
+        }
+    
+    def compact(self) -> Dict:
+        """
+        Reclaim the rows of deleted documents, then shrink the database file, in short steps
+        that each take the lock, so concurrent indexing and searches only wait for one step.
+        """
+        while self._purge_deleted_documents():
+            pass
+        
+        with self._lock:
+            self._connection.execute('DELETE FROM terms WHERE df <= 0')
+            incremental = self._connection.execute('PRAGMA auto_vacuum').fetchone()[0] == 2
+        
+        if incremental:
+            while True:
+                with self._lock:
+                    self._connection.execute(f'PRAGMA incremental_vacuum({self.VACUUM_PAGES_PER_STEP})')
+                    if self._connection.execute('PRAGMA freelist_count').fetchone()[0] == 0:
+                        break
+        else:
+            self._convert_to_incremental_vacuum()
+        
+        self.logger.info("Job index compacted")
+        return self.get_stats()
+    
+    def _purge_deleted_documents(self) -> bool:
+        """Delete the rows of up to COMPACT_DOCUMENTS_PER_STEP deleted documents, False when none are left"""
+        with self._lock:
+            doc_ids = [row[0] for row in self._connection.execute(
+                'SELECT doc_id FROM documents WHERE deleted = 1 LIMIT ?', (self.COMPACT_DOCUMENTS_PER_STEP,)
+            )]
+            if not doc_ids:
+                return False
+            
+            self._connection.execute('BEGIN')
+            try:
+                self._delete_rows(doc_ids)
+                self._connection.execute('COMMIT')
+            except sqlite3.Error:
+                self._connection.execute('ROLLBACK')
+                raise
+            return True
+    
+    def _delete_rows(self, doc_ids: List[int]):
+        """Delete the rows of tombstoned documents inside the open transaction"""
+        for start in range(0, len(doc_ids), self.MAX_QUERY_PARAMETERS):
+            chunk = doc_ids[start:start + self.MAX_QUERY_PARAMETERS]
+            placeholders = ','.join('?' * len(chunk))
+            for table in ('postings', 'bodies', 'documents'):
+                self._connection.execute(f'DELETE FROM {table} WHERE doc_id IN ({placeholders})', chunk)
+        self._update_stats(deleted=-len(doc_ids))
+    
+    def _convert_to_incremental_vacuum(self):
+        """
+        Rebuild an index created without incremental vacuuming, once. VACUUM runs on its own
+        connection outside the lock; with WAL, searches keep reading and writes wait for it.
+        """
+        connection = sqlite3.connect(self._path, isolation_level=None)
+        try:
+            connection.execute('PRAGMA auto_vacuum=INCREMENTAL')
+            connection.execute('VACUUM')
+        finally:
+            connection.close()
+        self.logger.info("Job index converted to incremental vacuuming")
+    
+    def get_stats(self) -> Dict:
+        """Get the number of live and deleted documents and the total indexed length"""
+        with self._lock:
+            return self._get_stats()
+    
+    def _get_stats(self) -> Dict:
+        """Read the index statistics; the caller holds the lock"""
+        return dict(self._connection.execute('SELECT name, value FROM stats').fetchall())
+    
+    def _update_stats(self, **deltas: int):
+        """Apply deltas to the index statistics inside the open transaction"""
+        self._connection.executemany(
+            'UPDATE stats SET value = value + ? WHERE name = ?',
+            ((delta, name) for name, delta in deltas.items())
+        )
+    
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._connection.close()
+
+
+def create_job_index(config: Config) -> Optional[JobIndexService]:
+    """Create the persistent job index when enabled in config"""
+    if not config.JOB_INDEX_ENABLED:
+        return None
+    
+    try:
+        return JobIndexService(config)
+    except (OSError, sqlite3.Error) as e:
+        logging.getLogger(__name__).warning(f"Job index disabled: {str(e)}")
+        return None
@@ -0,0 +1,215 @@
+"""
+Background analysis queue implementing the IAnalysisJobQueue interface.
+Runs submitted analysis requests on a worker pool so API requests return immediately.
+"""
+
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Dict, Optional, Set
+
+from core.interfaces import IAnalysisJobQueue, IStreamingJobAnalyzer, BaseService
+from models.job_models import (
+    AnalysisComplete, AnalysisJob, AnalysisJobStatus, AnalysisProgress, AnalysisRequest
+)
+from config.settings import Config
+from utils.analysis_job_store import AnalysisJobStore
+
+
+class AnalysisJobQueueService(BaseService, IAnalysisJobQueue):
+    """
+    Bounded queue of analysis jobs processed by ANALYSIS_QUEUE_WORKERS threads.
+    The store is the queue: every worker process (e.g. each gunicorn worker) claims jobs
+    from it atomically, so a job runs once however many processes share the store.
+    Running jobs hold a lease renewed by a heartbeat; jobs of a process that died are
+    claimed again once their lease runs out, and queued jobs survive a restart. Partial
+    results are visible while a job is running. Jobs expire ANALYSIS_JOB_TTL seconds
+    after their last update. A process starts its workers with its first submission,
+    so creating the service starts no threads.
+    """
+    
+    def __init__(self, 
+                 analyzer: IStreamingJobAnalyzer, 
+                 config: Config = None, 
+                 store: AnalysisJobStore = None):
+        super().__init__()
+        self.analyzer = analyzer
+        self.config = config or Config()
+        self.store = store or AnalysisJobStore.from_config(self.config)
+        # Unique per process and service, so leases of a restarted process are not mistaken for its own
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._job_submitted = threading.Condition()
+        self._running: Set[str] = set()
+        self._lock = threading.Lock()
+        self._workers = []
+    
+    def _setup_logging(self):
+        """Setup logging for the analysis queue service"""
+        self.logger = logging.getLogger(__name__)
+    
+    def submit(self, request: AnalysisRequest) -> Optional[AnalysisJob]:
+        """
+        Validate and enqueue an analysis request.
+        Returns None without enqueueing when ANALYSIS_QUEUE_MAX_SIZE jobs are already pending.
+        """
+        validation_error = request.validate(self.config.MAX_LINKS_PER_REQUEST)
+        if validation_error:
+            raise ValueError(validation_error)
+        
+        # Workers poll the store from then on, picking up unfinished jobs and those of stopped processes
+        self._start_workers()
+        
+        now = time.time()
+        job = AnalysisJob(
+            job_id=uuid.uuid4().hex,
+            status=AnalysisJobStatus.QUEUED,
+            request=request,
+            created_at=now,
+            updated_at=now,
+            expires_at=now + self.config.ANALYSIS_JOB_TTL
+        )
+        # Pending jobs are counted in the store, so the limit holds across worker processes
+        if not self.store.create(job, self.config.ANALYSIS_QUEUE_MAX_SIZE):
+            return None
+        
+        with self._job_submitted:
+            self._job_submitted.notify()
+        return job
+    
+    def get(self, job_id: str) -> Optional[AnalysisJob]:
+        """Get the current state of a job, or None when it is unknown or expired"""
+        return self.store.get(job_id)
+    
+    def get_retry_after(self) -> int:
+        """Get the seconds clients should wait before resubmitting to a full queue"""
+        return self.config.ANALYSIS_QUEUE_RETRY_AFTER
+    
+    def get_stats(self) -> Dict:
+        """Get the number of pending jobs of every worker process, those running here and the queue limit"""
+        with self._lock:
+            running = len(self._running)
+        return {
+            "pending": self.store.count_unfinished(),
+            "running_here": running,
+            "max_size": self.config.ANALYSIS_QUEUE_MAX_SIZE
+        }
+    
+    def _start_workers(self):
+        """Start the worker threads and the lease heartbeat once, dropping expired jobs first"""
+        with self._lock:
+            if self._workers:
+                return
+            self.store.delete_expired()
+            for i in range(max(1, self.config.ANALYSIS_QUEUE_WORKERS)):
+                worker = threading.Thread(
+                    target=self._work, name=f"analysis-worker-{i}", daemon=True
+                )
+                worker.start()
+                self._workers.append(worker)
+            heartbeat = threading.Thread(target=self._heartbeat, name="analysis-heartbeat", daemon=True)
+            heartbeat.start()
+            self._workers.append(heartbeat)
+    
+    def _work(self):
+        """Claim and process jobs until the process exits, polling the store while there are none"""
+        while True:
+            try:
+                job_id = self.store.claim_next(self.owner, self._lease_until())
+            except sqlite3.Error as e:
+                self.logger.error(f"Claiming an analysis job failed: {str(e)}")
+                job_id = None
+            
+            if job_id is None:
+                # Jobs submitted by this process wake a worker at once, other processes' on the next poll
+                with self._job_submitted:
+                    self._job_submitted.wait(self.config.ANALYSIS_QUEUE_POLL_INTERVAL)
+                continue
+            
+            with self._lock:
+                self._running.add(job_id)
+            try:
+                self._run_job(job_id)
+            except Exception as e:
+                self.logger.error(f"Unexpected error running analysis job {job_id}: {str(e)}")
+            finally:
+                with self._lock:
+                    self._running.discard(job_id)
+    
+    def _heartbeat(self):
+        """Renew the leases of the jobs running in this process well before they run out"""
+        while True:
+            time.sleep(self.config.ANALYSIS_JOB_LEASE / 3)
+            with self._lock:
+                running = bool(self._running)
+            if not running:
+                continue
+            try:
+                self.store.renew(self.owner, self._lease_until())
+            except sqlite3.Error as e:
+                self.logger.error(f"Renewing analysis job leases failed: {str(e)}")
+    
+    def _run_job(self, job_id: str):
+        """Analyze a claimed job's request, saving every result as it completes"""
+        job = self.store.get(job_id)
+        if job is None:
+            return
+        
+        # A job interrupted by a restart or a stopped process starts over
+        job.partial_results = {}
+        job.status = AnalysisJobStatus.RUNNING
+        if not self._save(job):
+            return
+        
+        try:
+            for event in self.analyzer.analyze_jobs_stream(job.request):
+                if isinstance(event, AnalysisProgress):
+                    job.partial_results[event.index] = event.result.to_dict()
+                elif isinstance(event, AnalysisComplete):
+                    job.response = {
+                        "results": [job.partial_results[i] for i in event.order],
+                        "summary": event.summary
+                    }
+                    job.status = AnalysisJobStatus.COMPLETED
+                if not self._save(job):
+                    return
+        except Exception as e:
+            self.logger.error(f"Analysis job {job_id} failed: {str(e)}")
+            job.status = AnalysisJobStatus.FAILED
+            job.error = str(e)
+            self._save(job)
+        
+        self.store.delete_expired()
+    
+    def _save(self, job: AnalysisJob) -> bool:
+        """
+        Persist a claimed job, extending its expiry and lease from now. Returns False, after
+        logging it, when the lease ran out and another worker claimed the job meanwhile.
+        """
+        job.updated_at = time.time()
+        job.expires_at = job.updated_at + self.config.ANALYSIS_JOB_TTL
+        if self.store.update(job, self.owner, self._lease_until()):
+            return True
+        
+        self.logger.warning(f"Analysis job {job.job_id} was claimed by another worker, stopping")
+        return False
+    
+    def _lease_until(self) -> float:
+        """Get the end of a lease taken or renewed now"""
+        return time.time() + self.config.ANALYSIS_JOB_LEASE
+
+
+def create_analysis_job_queue(config: Config, 
+                              analyzer: IStreamingJobAnalyzer) -> Optional[AnalysisJobQueueService]:
+    """Create the background analysis queue when enabled in config"""
+    if not config.ANALYSIS_QUEUE_ENABLED:
+        return None
+    
+    try:
+        return AnalysisJobQueueService(analyzer, config)
+    except (OSError, sqlite3.Error) as e:
+        logging.getLogger(__name__).warning(f"Background analysis queue disabled: {str(e)}")
+        return None
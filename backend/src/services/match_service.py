@@ -3,16 +3,23 @@ Job matching service implementing the IMatchCalculator interface.
 Following the Single Responsibility Principle (SRP).
 """
 
+import dataclasses
+import functools
+import hashlib
 import logging
-from typing import List, Set
+import operator
+import threading
+from typing import Dict, List, Set, Tuple
 
-from core.interfaces import IMatchCalculator, BaseService
-from models.job_models import MatchScore
+from core.interfaces import IMatchCalculator, IMatchMatrixCalculator, BaseService
+from models.job_models import MatchMatrix, MatchScore, ResumeProfile
 from config.settings import Config
-from utils.helpers import TextProcessor, ScoreCalculator
+from utils.helpers import TextProcessor, ScoreCalculator, LRUCache, TokenVocabulary, precompile_text_tables
+from utils.phrase_matcher import PhraseMatcher, create_skill_matcher, normalize_phrase
+from utils.timing import SCORE, timed
 
 
-class MatchCalculatorService(BaseService, IMatchCalculator):
+class MatchCalculatorService(BaseService, IMatchCalculator, IMatchMatrixCalculator):
     """Service responsible for calculating job match scores"""
     
     def __init__(self, config: Config = None):
@@ -20,28 +27,169 @@ class MatchCalculatorService(BaseService, IMatchCalculator):
         self.config = config or Config()
         self.text_processor = TextProcessor()
         self.score_calculator = ScoreCalculator()
+        self.profile_cache = LRUCache(self.config.RESUME_PROFILE_CACHE_SIZE)
+        self.job_token_cache = LRUCache(self.config.JOB_TOKEN_CACHE_SIZE)
+        self.phrase_matcher_cache = LRUCache(self.config.PHRASE_MATCHER_CACHE_SIZE)
+        self.vocabulary = TokenVocabulary()
+        self._vocabulary_lock = threading.Lock()
     
     def _setup_logging(self):
         """Setup logging for the match calculator service"""
         self.logger = logging.getLogger(__name__)
     
+    def precompile(self):
+        """Compile the TECH_SKILLS matchers every request uses ahead of the first one"""
+        precompile_text_tables()
+        self._get_phrase_matcher(())
+    
     def calculate_match_score(self, resume_text: str, job_text: str, keywords: List[str]) -> MatchScore:
         """
         Calculate comprehensive match score between resume/keywords and job description.
         Returns MatchScore object with detailed scoring information.
         """
-        # Normalize all text inputs
-        resume_words = set(self.text_processor.normalize_text(resume_text))
-        job_words = set(self.text_processor.normalize_text(job_text))
-        keyword_words = set(kw.lower().strip() for kw in keywords if kw.strip())
+        profile = self.create_resume_profile(resume_text, keywords)
+        return self._score_job(profile, job_text)
+    
+    def calculate_match_scores(self, profile: ResumeProfile, job_texts: List[str]) -> List[MatchScore]:
+        """Calculate match scores of one resume profile against many job descriptions, in order"""
+        with timed(SCORE):
+            return [self._score_job(profile, job_text) for job_text in job_texts]
+    
+    def calculate_match_matrix(self, 
+                               resume_texts: List[str], 
+                               job_texts: List[str], 
+                               keywords: List[str]) -> MatchMatrix:
+        """
+        Score every resume against every job with vectorized NumPy operations.
+        Resumes and jobs become binary bag-of-words matrices over the tokens they share,
+        so resume matches for the whole grid are a single matrix product. Each cell agrees
+        with calculate_match_scores for the same resume and job.
+        """
+        # Optional dependency, only required for matrix scoring
+        import numpy as np
+        
+        # One vocabulary for the whole grid, even if it is rotated concurrently
+        vocabulary = self._get_vocabulary()
+        # Every resume of the request stays cached, so repeating the request skips tokenizing them
+        self.profile_cache.ensure_capacity(len(resume_texts))
+        profiles = [
+            self._create_resume_profile(resume_text, keywords, vocabulary) for resume_text in resume_texts
+        ]
+        keyword_words = profiles[0].keyword_words if profiles else ()
+        job_analyses = [self._analyze_job_text(profiles[0], job_text) for job_text in job_texts] \
+            if profiles else []
+        
+        # Resume matches: |resume tokens & job tokens| for every pair
+        resume_bits = [profile.resume_bits for profile in profiles]
+        job_bits = [analysis[0] for analysis in job_analyses]
+        shared_bits = functools.reduce(operator.or_, resume_bits, 0) & functools.reduce(operator.or_, job_bits, 0)
+        resume_matrix = self._build_bag_of_words_matrix(np, resume_bits, shared_bits)
+        job_matrix = self._build_bag_of_words_matrix(np, job_bits, shared_bits)
+        match_counts = np.rint(resume_matrix @ job_matrix.T).astype(np.int64)
+        
+        # Tech bonus: skills found in both the resume and the job
+        skills = sorted(set().union(*(profile.tech_skill_words for profile in profiles)))
+        resume_skills = np.array(
+            [[skill in profile.tech_skill_words for skill in skills] for profile in profiles],
+            dtype=np.float32
+        ).reshape(len(profiles), len(skills))
+        job_skills = np.array(
+            [[skill in analysis[1] for skill in skills] for analysis in job_analyses],
+            dtype=np.float32
+        ).reshape(len(job_analyses), len(skills))
+        tech_match_counts = np.rint(resume_skills @ job_skills.T).astype(np.int64)
+        
+        # Keyword matches only depend on the job
+        matched_skills = [
+            [keyword for keyword in keyword_words if keyword in analysis[1]] for analysis in job_analyses
+        ]
+        keyword_match_counts = np.array([len(matches) for matches in matched_skills], dtype=np.int64)
+        
+        resume_scores, keyword_scores, total_scores = self.score_calculator.calculate_score_matrices(
+            match_counts,
+            [len(profile.resume_words) for profile in profiles],
+            tech_match_counts,
+            keyword_match_counts,
+            len(keyword_words)
+        )
+        
+        return MatchMatrix(
+            total_scores=total_scores,
+            resume_scores=resume_scores,
+            keyword_scores=keyword_scores,
+            resume_matches=match_counts,
+            keyword_matches=keyword_match_counts,
+            matched_skills=matched_skills
+        )
+    
+    def create_resume_profile(self, resume_text: str, keywords: List[str]) -> ResumeProfile:
+        """
+        Tokenize the resume and keywords once.
+        Resume tokens are cached by resume hash, so repeated requests with the same resume skip normalization.
+        """
+        return self._create_resume_profile(resume_text, keywords, self._get_vocabulary())
+    
+    def _create_resume_profile(self, 
+                               resume_text: str, 
+                               keywords: List[str], 
+                               vocabulary: TokenVocabulary) -> ResumeProfile:
+        """Create or reuse the profile of a resume with bitsets from the given vocabulary"""
+        keyword_words = tuple(dict.fromkeys(normalize_phrase(kw) for kw in keywords if kw.strip()))
+        resume_hash = self._hash_text(resume_text)
+        
+        profile = self.profile_cache.get(resume_hash)
+        if profile is None or profile.vocabulary is not vocabulary:
+            resume_words = frozenset(self.text_processor.normalize_text(resume_text))
+            tech_skill_words = frozenset(self._get_phrase_matcher(()).find_all(resume_text))
+            profile = ResumeProfile(
+                resume_hash=resume_hash,
+                resume_words=resume_words,
+                keyword_words=keyword_words,
+                tech_skill_words=tech_skill_words,
+                vocabulary=vocabulary,
+                resume_bits=vocabulary.encode(resume_words),
+                phrase_matcher=self._get_phrase_matcher(keyword_words)
+            )
+            self.profile_cache.put(resume_hash, profile)
+        elif profile.keyword_words != keyword_words:
+            # Keywords change per request while the tokenized resume is reused
+            profile = dataclasses.replace(
+                profile,
+                keyword_words=keyword_words,
+                phrase_matcher=self._get_phrase_matcher(keyword_words)
+            )
+        
+        return profile
+    
+    def get_profile_cache_stats(self) -> Dict:
+        """Get resume profile cache size and hit/miss counters"""
+        return self.profile_cache.get_stats()
+    
+    def get_cache_stats(self) -> Dict[str, Dict]:
+        """Get the counters of the profile, job token and phrase matcher caches"""
+        return {
+            "resume_profile": self.profile_cache.get_stats(),
+            "job_tokens": self.job_token_cache.get_stats(),
+            "phrase_matcher": self.phrase_matcher_cache.get_stats()
+        }
+    
+    def _score_job(self, profile: ResumeProfile, job_text: str) -> MatchScore:
+        """Score a single job description against a precomputed profile"""
+        vocabulary = profile.vocabulary
+        job_bits, phrase_hits = self._analyze_job_text(profile, job_text)
         
-        # Find matches
-        resume_matches = resume_words.intersection(job_words)
-        keyword_matches = keyword_words.intersection(job_words)
+        # Resume matches are a bitset intersection; keywords and skills are whole-phrase hits
+        resume_matches = vocabulary.count(profile.resume_bits & job_bits)
+        keyword_matches = [keyword for keyword in profile.keyword_words if keyword in phrase_hits]
+        tech_matches = len(profile.tech_skill_words & phrase_hits)
         
         # Calculate individual scores
-        resume_score = self.score_calculator.calculate_resume_score(resume_matches, resume_words)
-        keyword_score = self.score_calculator.calculate_keyword_score(keyword_matches, keyword_words)
+        resume_score = self.score_calculator.calculate_resume_score_from_counts(
+            resume_matches, len(profile.resume_words), tech_matches
+        )
+        keyword_score = self.score_calculator.calculate_keyword_score_from_counts(
+            len(keyword_matches), len(profile.keyword_words)
+        )
         
         # Calculate weighted total score
         total_score = self.score_calculator.calculate_total_score(resume_score, keyword_score)
@@ -50,7 +198,69 @@ class MatchCalculatorService(BaseService, IMatchCalculator):
             total_score=total_score,
             resume_score=resume_score,
             keyword_score=keyword_score,
-            matched_skills=list(keyword_matches),
-            resume_matches=len(resume_matches),
+            matched_skills=keyword_matches,
+            resume_matches=resume_matches,
             keyword_matches=len(keyword_matches)
         )
+    
+    def _analyze_job_text(self, profile: ResumeProfile, job_text: str) -> Tuple[int, Set[str]]:
+        """
+        Encode a job text as a token bitset and find its skill and keyword phrases.
+        Results are cached by text hash and reused while the vocabulary and matcher are unchanged.
+        """
+        text_hash = self._hash_text(job_text)
+        cached = self.job_token_cache.get(text_hash)
+        if cached is not None and cached[0] is profile.vocabulary:
+            job_bits = cached[1]
+            if cached[2] is profile.phrase_matcher:
+                return job_bits, cached[3]
+        else:
+            job_bits = profile.vocabulary.encode(self.text_processor.normalize_text(job_text))
+        
+        phrase_hits = profile.phrase_matcher.find_all(job_text)
+        self.job_token_cache.put(
+            text_hash, (profile.vocabulary, job_bits, profile.phrase_matcher, phrase_hits)
+        )
+        return job_bits, phrase_hits
+    
+    def _get_phrase_matcher(self, keyword_words: Tuple[str, ...]) -> PhraseMatcher:
+        """Get the compiled TECH_SKILLS plus keywords matcher for a keyword set"""
+        cache_key = frozenset(keyword_words)
+        phrase_matcher = self.phrase_matcher_cache.get(cache_key)
+        if phrase_matcher is None:
+            phrase_matcher = create_skill_matcher(keyword_words, self.config)
+            self.phrase_matcher_cache.put(cache_key, phrase_matcher)
+        return phrase_matcher
+    
+    def _get_vocabulary(self) -> TokenVocabulary:
+        """
+        Get the current vocabulary, starting a new one once it grows past TOKEN_VOCABULARY_MAX_SIZE.
+        Cached profiles and job encodings of the old vocabulary are rebuilt on their next use.
+        """
+        with self._vocabulary_lock:
+            if len(self.vocabulary) > self.config.TOKEN_VOCABULARY_MAX_SIZE:
+                self.logger.info(f"Token vocabulary reached {len(self.vocabulary)} tokens, resetting")
+                self.vocabulary = TokenVocabulary()
+            return self.vocabulary
+    
+    @staticmethod
+    def _build_bag_of_words_matrix(np, rows: List[int], shared_bits: int):
+        """
+        Expand token bitsets into a binary matrix with one column per shared token id, in id order.
+        Each row's bytes are unpacked by NumPy, only those holding shared tokens.
+        """
+        width = (shared_bits.bit_length() + 7) // 8
+        shared_bytes = np.frombuffer(shared_bits.to_bytes(width, 'little'), dtype=np.uint8)
+        byte_ids = np.flatnonzero(shared_bytes)
+        shared_mask = np.unpackbits(shared_bytes[byte_ids], bitorder='little').astype(bool)
+        
+        matrix = np.empty((len(rows), int(shared_mask.sum())), dtype=np.float32)
+        for row, bits in enumerate(rows):
+            row_bytes = np.frombuffer((bits & shared_bits).to_bytes(width, 'little'), dtype=np.uint8)
+            matrix[row] = np.unpackbits(row_bytes[byte_ids], bitorder='little')[shared_mask]
+        return matrix
+    
+    @staticmethod
+    def _hash_text(text: str) -> str:
+        """Hash text for cache keys"""
+        return hashlib.sha1((text or '').encode('utf-8', 'surrogatepass')).hexdigest()
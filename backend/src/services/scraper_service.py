@@ -3,64 +3,77 @@ Job scraping service implementing the IJobScraper interface.
 Following the Single Responsibility Principle (SRP).
 """
 
+import dataclasses
+import hashlib
 import requests
 import logging
-from bs4 import BeautifulSoup
-from typing import Dict
+import sqlite3
+from requests.compat import chardet
+from typing import Dict, Mapping, Optional
 
-from core.interfaces import IJobScraper, BaseService
-from models.job_models import JobData, JobStatus
+from core.interfaces import IJobScraper, IHTMLParser, BaseService
+from models.job_models import Deadline, JobData, JobStatus
 from config.settings import Config
-from utils.helpers import TextProcessor, URLValidator
+from utils.helpers import TextProcessor, URLValidator, LRUCache
+from utils.http_client import PooledHTTPClient
+from utils.http_cache import CachedResponse, HTTPResponseCache
+from utils.politeness import HostPolitenessScheduler, THROTTLE_STATUSES, create_politeness_scheduler
+from utils.robots_cache import RobotsTxtCache, create_robots_cache
+from utils.timing import DOWNLOAD, FETCH, HOST_REQUEST, HTTP_CACHE, TTFB, count, timed
+from services.html_parsers import create_html_parser
 
 
 class JobScraperService(BaseService, IJobScraper):
     """Service responsible for scraping job data from URLs"""
     
-    def __init__(self, config: Config = None):
+    def __init__(self, 
+                 config: Config = None, 
+                 http_client: PooledHTTPClient = None, 
+                 response_cache: HTTPResponseCache = None, 
+                 html_parser: IHTMLParser = None, 
+                 scheduler: HostPolitenessScheduler = None, 
+                 robots_cache: RobotsTxtCache = None):
         super().__init__()
         self.config = config or Config()
         self.text_processor = TextProcessor()
         self.url_validator = URLValidator()
+        self.http_client = http_client or PooledHTTPClient(self.config)
+        self.response_cache = response_cache or self._create_response_cache()
+        self.job_data_cache = LRUCache(self.config.JOB_DATA_CACHE_SIZE)
+        self.html_parser = html_parser or create_html_parser(self.config)
+        self.scheduler = scheduler or create_politeness_scheduler(self.config)
+        self.robots_cache = robots_cache or create_robots_cache(self.config, self.http_client, self.scheduler)
     
     def _setup_logging(self):
         """Setup logging for the scraper service"""
         self.logger = logging.getLogger(__name__)
     
-    def extract_job_data(self, url: str) -> JobData:
+    def extract_job_data(self, url: str, deadline: Deadline = None) -> JobData:
         """
         Extract job data from URL with comprehensive error handling.
         Returns JobData object with extracted information or error details.
+        Every wait and request is cut short by the deadline, timing out when it passes.
         """
         # Validate URL first
         if not self.url_validator.is_valid_url(url):
             return JobData.from_error(url, "Invalid URL format", JobStatus.INVALID_URL)
         
         try:
-            # Make HTTP request with configured settings
-            response = self._make_request(url)
+            # Skip pages the site asks crawlers not to fetch
+            if self.robots_cache is not None and not self.robots_cache.is_allowed(url, deadline):
+                return JobData.from_error(url, "Disallowed by robots.txt", JobStatus.DISALLOWED)
+            
+            # Fetch page through the response cache with configured settings
+            with timed(FETCH):
+                html_content = self._fetch_page(url, deadline)
             
             # Check content size
-            if len(response.content) > self.config.MAX_CONTENT_LENGTH:
+            if html_content is None:
                 self.logger.warning(f"Content too large for URL: {url}")
                 return JobData.from_error(url, "Content too large")
             
-            # Parse HTML content
-            soup = BeautifulSoup(response.text, "html.parser")
-            
-            # Extract title and body
-            title = self._extract_title(soup)
-            body = self._extract_clean_text(soup)
-            word_count = len(body.split()) if body else 0
-            
-            return JobData(
-                url=url,
-                title=title,
-                body=body,
-                word_count=word_count,
-                status=JobStatus.SUCCESS
-            )
-            
+            return self._parse_job_page(url, html_content)
+        
         except requests.exceptions.Timeout:
             return JobData.from_error(url, "Request timeout", JobStatus.TIMEOUT)
         except requests.exceptions.RequestException as e:
@@ -69,35 +82,263 @@ class JobScraperService(BaseService, IJobScraper):
             self.logger.error(f"Unexpected error scraping {url}: {str(e)}")
             return JobData.from_error(url, f"Parsing failed: {str(e)}")
     
-    def _make_request(self, url: str) -> requests.Response:
-        """Make HTTP request with proper headers and timeout"""
-        headers = {'User-Agent': self.config.USER_AGENT}
+    def _fetch_page(self, url: str, deadline: Deadline = None) -> Optional[str]:
+        """
+        Fetch page HTML, serving fresh cache entries without a request and
+        revalidating stale ones. Returns None when the page exceeds MAX_CONTENT_LENGTH.
+        """
+        cache_key = self.url_validator.normalize_url(url)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None and cached.is_fresh(self.config.HTTP_CACHE_TTL):
+            count(HTTP_CACHE, 'hit')
+            return cached.text
+        
+        with self._make_request(url, cached.conditional_headers() if cached else None, deadline) as response:
+            if response.status_code == 304 and cached is not None:
+                count(HTTP_CACHE, 'revalidated')
+                self.response_cache.touch(cache_key)
+                return cached.text
+            if self.response_cache is not None:
+                count(HTTP_CACHE, 'miss')
+            
+            with timed(DOWNLOAD):
+                content = self._read_limited_body(response, deadline)
+            if content is None:
+                return None
+        
+        encoding = response.encoding or self._detect_encoding(content)
+        self._store_response(cache_key, url, content, encoding, response.headers)
+        return content.decode(encoding, errors='replace')
+    
+    def _read_limited_body(self, 
+                           response: requests.Response, 
+                           deadline: Deadline = None) -> Optional[bytearray]:
+        """
+        Stream the response body into a single buffer.
+        Returns None as soon as Content-Length or the bytes read exceed MAX_CONTENT_LENGTH.
+        The read timeout applies per chunk, so a trickling body is also stopped at the deadline.
+        """
+        max_length = self.config.MAX_CONTENT_LENGTH
+        content_length = response.headers.get('Content-Length', '')
+        if content_length.isdigit() and int(content_length) > max_length:
+            return None
         
-        response = requests.get(
-            url, 
-            timeout=self.config.REQUEST_TIMEOUT, 
-            headers=headers
+        content = bytearray()
+        for chunk in response.iter_content(chunk_size=self.config.STREAM_CHUNK_SIZE):
+            content += chunk
+            if len(content) > max_length:
+                return None
+            if deadline is not None and deadline.expired():
+                raise requests.exceptions.Timeout("Deadline exceeded while reading the response")
+        
+        return content
+    
+    @staticmethod
+    def _detect_encoding(content: bytes) -> str:
+        """Guess the body encoding when the server did not declare one"""
+        detected = chardet.detect(bytes(content)) if chardet else None
+        return (detected or {}).get('encoding') or 'utf-8'
+    
+    def _get_cached_response(self, cache_key: str) -> Optional[CachedResponse]:
+        """Look up a cached response if caching is enabled"""
+        if self.response_cache is None:
+            return None
+        return self.response_cache.get(cache_key)
+    
+    def _store_response(self, 
+                        cache_key: str, 
+                        url: str, 
+                        content: bytes, 
+                        encoding: Optional[str], 
+                        headers: Mapping[str, str]):
+        """Store a fetched page with its validators if caching is enabled"""
+        if self.response_cache is None:
+            return
+        self.response_cache.put(
+            cache_key, url, content, encoding, 
+            etag=headers.get('ETag'), 
+            last_modified=headers.get('Last-Modified')
         )
-        response.raise_for_status()
+    
+    def _make_request(self, 
+                      url: str, 
+                      extra_headers: Dict[str, str] = None, 
+                      deadline: Deadline = None) -> requests.Response:
+        """
+        Make HTTP request with proper headers and timeout over the pooled session.
+        Requests wait for the politeness scheduler; throttled requests are retried after
+        the host's Retry-After when it is within POLITENESS_RETRY_WAIT and the deadline.
+        """
+        headers = {'User-Agent': self.config.USER_AGENT}
+        if extra_headers:
+            headers.update(extra_headers)
+        
+        host = self.url_validator.get_host(url)
+        attempt = 0
+        while True:
+            response = self._send_request(url, host, headers, deadline)
+            backoff = self._release_host(host, response.status_code, response.headers.get('Retry-After'))
+            if not self._should_retry(response.status_code, backoff, attempt, deadline):
+                break
+            response.close()
+            attempt += 1
+        
+        count(HOST_REQUEST, host, 'error' if response.status_code >= 400 else 'success')
+        try:
+            response.raise_for_status()
+        except requests.exceptions.HTTPError:
+            response.close()
+            raise
         
         return response
     
-    def _extract_title(self, soup: BeautifulSoup) -> str:
-        """Extract job title with multiple fallback strategies"""
-        for selector in self.config.TITLE_SELECTORS:
-            element = soup.select_one(selector)
-            if element and element.get_text(strip=True):
-                return element.get_text(strip=True)
-        
-        return "Job Posting"
-    
-    def _extract_clean_text(self, soup: BeautifulSoup) -> str:
-        """Extract and clean body text from HTML"""
-        # Remove unwanted elements
-        for element_name in self.config.REMOVE_ELEMENTS:
-            for element in soup(element_name):
-                element.decompose()
-        
-        # Get text and clean it
-        text = soup.get_text()
-        return self.text_processor.clean_html_text(text, self.config.MAX_TEXT_LENGTH)
+    def _send_request(self, 
+                      url: str, 
+                      host: str, 
+                      headers: Dict[str, str], 
+                      deadline: Deadline = None) -> requests.Response:
+        """Send one request once the scheduler allows it, recording failures to connect"""
+        if self.scheduler is not None and not self.scheduler.acquire(
+            host, deadline.remaining() if deadline is not None else None
+        ):
+            raise requests.exceptions.Timeout("Deadline exceeded waiting for the host")
+        
+        try:
+            # Returns once the headers arrive, the body is streamed by the caller
+            with timed(TTFB):
+                return self.http_client.get(
+                    url, 
+                    timeout=self._get_request_timeout(deadline), 
+                    headers=headers,
+                    stream=True
+                )
+        except requests.exceptions.RequestException:
+            count(HOST_REQUEST, host, 'error')
+            self._release_host(host, None)
+            raise
+        except BaseException:
+            # Failed unexpectedly: free the slot without blaming the host
+            self._cancel_host(host)
+            raise
+    
+    def _get_request_timeout(self, deadline: Deadline = None) -> float:
+        """Get REQUEST_TIMEOUT, cut short to the time left before the deadline"""
+        if deadline is None:
+            return self.config.REQUEST_TIMEOUT
+        
+        remaining = deadline.remaining()
+        if remaining <= 0:
+            raise requests.exceptions.Timeout("Deadline exceeded before sending the request")
+        return min(self.config.REQUEST_TIMEOUT, remaining)
+    
+    def _release_host(self, host: str, status: Optional[int], retry_after: str = None) -> Optional[float]:
+        """Report a request outcome to the scheduler, returning the host's backoff if it throttled"""
+        if self.scheduler is None:
+            return None
+        return self.scheduler.release(host, status, retry_after)
+    
+    def _cancel_host(self, host: str):
+        """Give a request slot back to the scheduler without reporting an outcome"""
+        if self.scheduler is not None:
+            self.scheduler.cancel(host)
+    
+    def _should_retry(self, 
+                      status: int, 
+                      backoff: Optional[float], 
+                      attempt: int, 
+                      deadline: Deadline = None) -> bool:
+        """Check whether a throttled request is worth retrying after its backoff"""
+        return (
+            self.scheduler is not None
+            and status in THROTTLE_STATUSES
+            and attempt < self.config.POLITENESS_MAX_RETRIES
+            and backoff is not None
+            and backoff <= self.config.POLITENESS_RETRY_WAIT
+            and (deadline is None or backoff < deadline.remaining())
+        )
+    
+    def _create_response_cache(self) -> Optional[HTTPResponseCache]:
+        """Create the disk-backed response cache when enabled in config"""
+        if not self.config.HTTP_CACHE_ENABLED:
+            return None
+        
+        try:
+            return HTTPResponseCache.from_config(self.config)
+        except (OSError, sqlite3.Error) as e:
+            self.logger.warning(f"HTTP response cache disabled: {str(e)}")
+            return None
+    
+    def get_connection_stats(self) -> Dict:
+        """Get connection pool reuse statistics"""
+        return self.http_client.get_stats()
+    
+    def get_politeness_stats(self) -> Dict:
+        """Get per-host scheduler state and robots.txt cache counters"""
+        return {
+            "hosts": self.scheduler.get_stats() if self.scheduler is not None else {},
+            "robots_cache": self.robots_cache.get_stats() if self.robots_cache is not None else None
+        }
+    
+    def get_cache_stats(self) -> Dict[str, Optional[Dict]]:
+        """Get the counters of the in-memory caches, None for disabled ones"""
+        return {
+            "job_data": self.job_data_cache.get_stats(),
+            "robots_txt": self.robots_cache.get_stats() if self.robots_cache is not None else None
+        }
+    
+    def get_job_data_cache_stats(self) -> Dict:
+        """Get parsed JobData cache size and hit/miss counters"""
+        return self.job_data_cache.get_stats()
+    
+    def invalidate_cache(self, url: str = None):
+        """Drop cached responses and parsed job data for one URL, or for every URL"""
+        if url is None:
+            self.job_data_cache.clear()
+            if self.response_cache is not None:
+                self.response_cache.clear()
+            return
+        
+        cache_key = self.url_validator.normalize_url(url)
+        self.job_data_cache.invalidate(cache_key)
+        if self.response_cache is not None:
+            self.response_cache.invalidate(cache_key)
+    
+    def _parse_job_page(self, url: str, html_content: str) -> JobData:
+        """
+        Parse fetched HTML content into a JobData object.
+        Identical content fetched for the same normalized URL is parsed only once.
+        """
+        cache_key = self.url_validator.normalize_url(url)
+        content_hash = hashlib.sha1(html_content.encode('utf-8', 'surrogatepass')).hexdigest()
+        
+        # Content that changed since it was cached counts as a miss and replaces the entry
+        cached = self.job_data_cache.get(cache_key, lambda entry: entry[0] == content_hash)
+        if cached is not None:
+            return dataclasses.replace(cached[1], url=url)
+        
+        job_data = self._build_job_data(url, html_content)
+        self.job_data_cache.put(cache_key, (content_hash, job_data))
+        return dataclasses.replace(job_data)
+    
+    def _build_job_data(self, url: str, html_content: str) -> JobData:
+        """Parse HTML content and extract title and body with the configured backend"""
+        title, body = self.html_parser.parse(html_content)
+        word_count = len(body.split()) if body else 0
+        
+        return JobData(
+            url=url,
+            title=title,
+            body=body,
+            word_count=word_count,
+            status=JobStatus.SUCCESS
+        )
+
+
+def create_scraper_service(config: Config, html_parser: IHTMLParser = None) -> JobScraperService:
+    """Create the scraper matching the configured analysis mode"""
+    if config.ANALYSIS_MODE == 'async':
+        # Imported lazily so aiohttp is only required in async mode
+        from services.async_scraper_service import AsyncJobScraperService
+        return AsyncJobScraperService(config, html_parser=html_parser)
+    
+    return JobScraperService(config, html_parser=html_parser)
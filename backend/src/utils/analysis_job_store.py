@@ -0,0 +1,197 @@
+"""
+Persistent store for background analysis jobs.
+Keeps job state in a local SQLite database so queued work survives a process
+restart and is shared by every worker process, and drops jobs once their TTL has passed.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional, Tuple
+
+from config.settings import Config
+from models.job_models import AnalysisJob, AnalysisJobStatus, AnalysisRequest
+
+
+class AnalysisJobStore:
+    """
+    SQLite-backed analysis job table living in a local directory.
+    A worker claims a job by atomically marking it running under its owner id with a lease;
+    only the owner may update it, and a running job whose lease ran out can be claimed again.
+    """
+    
+    DB_FILENAME = 'analysis_jobs.sqlite3'
+    
+    # Columns of an AnalysisJob, in the order _to_job reads them
+    JOB_COLUMNS = (
+        'job_id, status, request, partial_results, response, error, created_at, updated_at, expires_at'
+    )
+    
+    # Queued jobs, and running jobs whose owner stopped renewing the lease
+    CLAIMABLE = (
+        "expires_at > :now"
+        " AND (status = 'queued' OR (status = 'running' AND COALESCE(lease_until, 0) <= :now))"
+    )
+    
+    # Other workers can claim the same job between the select and the update
+    CLAIM_ATTEMPTS = 3
+    
+    def __init__(self, store_dir: str):
+        self.store_dir = store_dir
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        
+        os.makedirs(store_dir, exist_ok=True)
+        self._connection = sqlite3.connect(
+            os.path.join(store_dir, self.DB_FILENAME),
+            check_same_thread=False,
+            isolation_level=None
+        )
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS analysis_jobs ('
+            ' job_id TEXT PRIMARY KEY, status TEXT, request TEXT, partial_results TEXT,'
+            ' response TEXT, error TEXT, created_at REAL, updated_at REAL, expires_at REAL,'
+            ' owner TEXT, lease_until REAL)'
+        )
+        columns = [row[1] for row in self._connection.execute('PRAGMA table_info(analysis_jobs)')]
+        if 'owner' not in columns:
+            # Stores created before jobs had owners
+            self._connection.execute('ALTER TABLE analysis_jobs ADD COLUMN owner TEXT')
+            self._connection.execute('ALTER TABLE analysis_jobs ADD COLUMN lease_until REAL')
+        self._connection.execute(
+            'CREATE INDEX IF NOT EXISTS analysis_jobs_expires_at ON analysis_jobs (expires_at)'
+        )
+    
+    @classmethod
+    def from_config(cls, config: Config) -> 'AnalysisJobStore':
+        """Create a store from the ANALYSIS_QUEUE_* settings"""
+        return cls(config.ANALYSIS_QUEUE_DIR)
+    
+    def create(self, job: AnalysisJob, max_unfinished: int) -> bool:
+        """
+        Insert a new job unless max_unfinished jobs are already queued or running.
+        Counting and inserting is one statement, so concurrent workers cannot overshoot the limit.
+        """
+        with self._lock:
+            cursor = self._connection.execute(
+                f'INSERT INTO analysis_jobs ({self.JOB_COLUMNS})'
+                ' SELECT ?, ?, ?, ?, ?, ?, ?, ?, ? WHERE ('
+                "  SELECT COUNT(*) FROM analysis_jobs"
+                "  WHERE status IN ('queued', 'running') AND expires_at > ?"
+                ' ) < ?',
+                (
+                    job.job_id,
+                    job.status.value,
+                    json.dumps({
+                        "links": job.request.links,
+                        "keywords": job.request.keywords,
+                        "resume": job.request.resume
+                    }),
+                    *self._to_state(job)[1:],
+                    job.created_at,
+                    job.updated_at,
+                    job.expires_at,
+                    time.time(),
+                    max_unfinished
+                )
+            )
+        return cursor.rowcount == 1
+    
+    def update(self, job: AnalysisJob, owner: str, lease_until: float) -> bool:
+        """Save a claimed job's progress and renew its lease. Returns False when owner lost the job"""
+        with self._lock:
+            cursor = self._connection.execute(
+                'UPDATE analysis_jobs SET status = ?, partial_results = ?, response = ?, error = ?,'
+                ' updated_at = ?, expires_at = ?, lease_until = ? WHERE job_id = ? AND owner = ?',
+                (*self._to_state(job), job.updated_at, job.expires_at, lease_until, job.job_id, owner)
+            )
+        return cursor.rowcount == 1
+    
+    def claim_next(self, owner: str, lease_until: float) -> Optional[str]:
+        """Mark the oldest claimable job as running under owner until lease_until, returning its id"""
+        with self._lock:
+            for _ in range(self.CLAIM_ATTEMPTS):
+                now = time.time()
+                row = self._connection.execute(
+                    f'SELECT job_id FROM analysis_jobs WHERE {self.CLAIMABLE} ORDER BY created_at LIMIT 1',
+                    {"now": now}
+                ).fetchone()
+                if row is None:
+                    return None
+                
+                cursor = self._connection.execute(
+                    "UPDATE analysis_jobs SET status = 'running', owner = :owner, lease_until = :lease_until"
+                    f' WHERE job_id = :job_id AND {self.CLAIMABLE}',
+                    {"owner": owner, "lease_until": lease_until, "job_id": row[0], "now": now}
+                )
+                if cursor.rowcount == 1:
+                    return row[0]
+        return None
+    
+    def renew(self, owner: str, lease_until: float) -> int:
+        """Extend the lease of every job owner is running, returning how many were renewed"""
+        with self._lock:
+            return self._connection.execute(
+                "UPDATE analysis_jobs SET lease_until = ? WHERE owner = ? AND status = 'running'",
+                (lease_until, owner)
+            ).rowcount
+    
+    def get(self, job_id: str) -> Optional[AnalysisJob]:
+        """Get a job unless it does not exist or has expired"""
+        with self._lock:
+            row = self._connection.execute(
+                f'SELECT {self.JOB_COLUMNS} FROM analysis_jobs WHERE job_id = ? AND expires_at > ?',
+                (job_id, time.time())
+            ).fetchone()
+        return self._to_job(row) if row else None
+    
+    def count_unfinished(self) -> int:
+        """Count queued and running jobs that have not expired, across every worker process"""
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COUNT(*) FROM analysis_jobs WHERE status IN ('queued', 'running') AND expires_at > ?",
+                (time.time(),)
+            ).fetchone()[0]
+    
+    def delete_expired(self) -> int:
+        """Delete every expired job, returning how many were removed"""
+        with self._lock:
+            return self._connection.execute(
+                'DELETE FROM analysis_jobs WHERE expires_at <= ?', (time.time(),)
+            ).rowcount
+    
+    @staticmethod
+    def _to_state(job: AnalysisJob) -> Tuple[str, str, Optional[str], Optional[str]]:
+        """Get the status, partial results, response and error columns of a job"""
+        return (
+            job.status.value,
+            json.dumps(job.partial_results),
+            json.dumps(job.response) if job.response is not None else None,
+            job.error
+        )
+    
+    @staticmethod
+    def _to_job(row: tuple) -> AnalysisJob:
+        """Build an AnalysisJob from a table row"""
+        job_id, status, request, partial_results, response, error, created_at, updated_at, expires_at = row
+        return AnalysisJob(
+            job_id=job_id,
+            status=AnalysisJobStatus(status),
+            request=AnalysisRequest(**json.loads(request)),
+            created_at=created_at,
+            updated_at=updated_at,
+            expires_at=expires_at,
+            # JSON object keys are strings
+            partial_results={int(index): result for index, result in json.loads(partial_results).items()},
+            response=json.loads(response) if response is not None else None,
+            error=error
+        )
+    
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,72 @@
+"""
+Readers for bulk link uploads.
+Yield links one at a time from JSONL or CSV byte streams so an upload is never held in memory.
+"""
+
+import csv
+import io
+import json
+from typing import BinaryIO, Iterator, Optional
+
+# Column names and JSON fields holding the link, in order of preference
+LINK_FIELDS = ('url', 'link')
+
+JSONL_TYPES = frozenset({'application/jsonl', 'application/x-ndjson', 'application/x-jsonlines'})
+CSV_TYPES = frozenset({'text/csv', 'application/csv'})
+
+
+def detect_format(filename: Optional[str], content_type: Optional[str]) -> Optional[str]:
+    """Get 'jsonl' or 'csv' from an upload's file extension or content type"""
+    extension = (filename or '').rsplit('.', 1)[-1].lower() if '.' in (filename or '') else ''
+    if extension in ('jsonl', 'ndjson') or content_type in JSONL_TYPES:
+        return 'jsonl'
+    if extension == 'csv' or content_type in CSV_TYPES:
+        return 'csv'
+    return None
+
+
+def iter_links(stream: BinaryIO, upload_format: str) -> Iterator[str]:
+    """Yield the non-empty links of a JSONL or CSV upload in order"""
+    text = io.TextIOWrapper(stream, encoding='utf-8-sig', errors='replace', newline='')
+    if upload_format == 'jsonl':
+        return _iter_jsonl_links(text)
+    if upload_format == 'csv':
+        return _iter_csv_links(text)
+    raise ValueError("Unsupported upload format. Use JSONL or CSV.")
+
+
+def _iter_jsonl_links(lines: Iterator[str]) -> Iterator[str]:
+    """One link per line, as a JSON string or an object with a url or link field"""
+    for line_number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        
+        try:
+            value = json.loads(line)
+        except json.JSONDecodeError:
+            raise ValueError(f"Line {line_number}: invalid JSON")
+        
+        if isinstance(value, dict):
+            value = next((value[name] for name in LINK_FIELDS if name in value), None)
+        if not isinstance(value, str):
+            raise ValueError(f"Line {line_number}: expected a URL string or an object with a url field")
+        
+        if value.strip():
+            yield value.strip()
+
+
+def _iter_csv_links(lines: Iterator[str]) -> Iterator[str]:
+    """Links from the url or link column, or from the first column when there is no header"""
+    reader = csv.reader(lines)
+    column = 0
+    for row_number, row in enumerate(reader, 1):
+        if row_number == 1:
+            header = [name.strip().lower() for name in row]
+            link_column = next((header.index(name) for name in LINK_FIELDS if name in header), None)
+            if link_column is not None:
+                column = link_column
+                continue
+        
+        if len(row) > column and row[column].strip():
+            yield row[column].strip()
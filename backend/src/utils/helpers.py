@@ -3,10 +3,30 @@ Utility functions for text processing and validation.
 Following the DRY and KISS principles.
 """
 
+import asyncio
+import concurrent.futures
+import functools
 import re
+import threading
 import urllib.parse
-from typing import List, Set
+from collections import OrderedDict
+from typing import Any, Callable, Coroutine, Dict, Hashable, Iterable, List, Optional, Set, Tuple
 from config.settings import Config
+from utils.phrase_matcher import PhraseMatcher, create_skill_matcher
+
+# Compiled once at import rather than looked up in re's cache on every call
+NON_WORD_PATTERN = re.compile(r'[^\w\s]')
+
+
+@functools.lru_cache(maxsize=1)
+def _get_tech_skill_matcher() -> PhraseMatcher:
+    """Compile the TECH_SKILLS matcher on first use"""
+    return create_skill_matcher()
+
+
+def precompile_text_tables():
+    """Compile the static TECH_SKILLS matcher now, e.g. during a Lambda cold start, instead of on first use"""
+    _get_tech_skill_matcher()
 
 
 class TextProcessor:
@@ -22,13 +42,14 @@ class TextProcessor:
             return []
         
         # Convert to lowercase and remove special characters
-        text = re.sub(r'[^\w\s]', ' ', text.lower())
+        text = NON_WORD_PATTERN.sub(' ', text.lower())
         words = text.split()
         
         # Filter out common words and short words
+        stop_words = Config.STOP_WORDS
         return [
             word for word in words 
-            if len(word) > 2 and word not in Config.STOP_WORDS
+            if len(word) > 2 and word not in stop_words
         ]
     
     @staticmethod
@@ -53,15 +74,8 @@ class TextProcessor:
     
     @staticmethod
     def extract_tech_skills(text: str) -> Set[str]:
-        """Extract technical skills from text"""
-        text_lower = text.lower()
-        found_skills = set()
-        
-        for skill in Config.TECH_SKILLS:
-            if skill in text_lower:
-                found_skills.add(skill)
-        
-        return found_skills
+        """Extract technical skills from text, matching whole words and phrases in one pass"""
+        return _get_tech_skill_matcher().find_all(text)
 
 
 class URLValidator:
@@ -79,18 +93,36 @@ class URLValidator:
         except Exception:
             return False
     
+    @staticmethod
+    def get_host(url: str) -> str:
+        """Get the lowercase host of a URL, or an empty string if it has none"""
+        try:
+            return (urllib.parse.urlparse(url).hostname or '').lower()
+        except Exception:
+            return ''
+    
     @staticmethod
     def normalize_url(url: str) -> str:
-        """Normalize URL by removing unnecessary parameters"""
+        """
+        Normalize URL by removing unnecessary parameters.
+        Lowercases scheme and host, drops tracking parameters and the fragment,
+        and sorts the remaining query parameters (e.g. gh_jid) so variants share one key.
+        """
         try:
             parsed = urllib.parse.urlparse(url)
             # Remove common tracking parameters
+            query = sorted(
+                (name, value)
+                for name, value in urllib.parse.parse_qsl(parsed.query, keep_blank_values=True)
+                if name.lower() not in Config.TRACKING_QUERY_PARAMS
+                and not name.lower().startswith(Config.TRACKING_QUERY_PREFIXES)
+            )
             return urllib.parse.urlunparse((
-                parsed.scheme,
-                parsed.netloc,
-                parsed.path,
+                parsed.scheme.lower(),
+                parsed.netloc.lower(),
+                parsed.path or '/',
                 parsed.params,
-                '',  # Remove query parameters for now
+                urllib.parse.urlencode(query),
                 ''   # Remove fragment
             ))
         except Exception:
@@ -101,35 +133,92 @@ class ScoreCalculator:
     """Score calculation utilities following business logic separation"""
     
     @staticmethod
-    def calculate_resume_score(matches: Set[str], total_resume_words: Set[str]) -> float:
-        """Calculate resume match score with improved logic"""
+    def find_tech_skill_words(words: Set[str]) -> Set[str]:
+        """Get the words that are single-word technical skills"""
+        return words & Config.TECH_SKILLS
+    
+    @staticmethod
+    def calculate_resume_score(matches: Set[str], 
+                               total_resume_words: Set[str], 
+                               tech_skill_words: Set[str] = None) -> float:
+        """
+        Calculate resume match score with improved logic.
+        tech_skill_words can hold the precomputed find_tech_skill_words(total_resume_words).
+        """
         if not total_resume_words:
             return 0.0
         
-        # Basic ratio
-        base_score = (len(matches) / len(total_resume_words)) * 100
-        
         # Bonus for technical skill matches
-        tech_matches = len([
-            word for word in matches 
-            if any(tech in word for tech in Config.TECH_SKILLS)
-        ])
-        tech_bonus = min(tech_matches * Config.TECH_BONUS_PER_MATCH, Config.TECH_BONUS_MAX)
+        if tech_skill_words is not None:
+            tech_matches = len(matches & tech_skill_words)
+        else:
+            tech_matches = len(ScoreCalculator.find_tech_skill_words(matches))
+        
+        return ScoreCalculator.calculate_resume_score_from_counts(
+            len(matches), len(total_resume_words), tech_matches
+        )
+    
+    @staticmethod
+    def calculate_resume_score_from_counts(match_count: int, 
+                                           resume_word_count: int, 
+                                           tech_match_count: int) -> float:
+        """Calculate resume match score from precomputed match counts"""
+        if not resume_word_count:
+            return 0.0
+        
+        # Basic ratio
+        base_score = (match_count / resume_word_count) * 100
+        tech_bonus = min(tech_match_count * Config.TECH_BONUS_PER_MATCH, Config.TECH_BONUS_MAX)
         
         return min(base_score + tech_bonus, 100.0)
     
     @staticmethod
     def calculate_keyword_score(matches: Set[str], total_keywords: Set[str]) -> float:
         """Calculate keyword match score"""
-        if not total_keywords:
+        return ScoreCalculator.calculate_keyword_score_from_counts(len(matches), len(total_keywords))
+    
+    @staticmethod
+    def calculate_keyword_score_from_counts(match_count: int, keyword_count: int) -> float:
+        """Calculate keyword match score from precomputed match counts"""
+        if not keyword_count:
             return 0.0
         
-        return (len(matches) / len(total_keywords)) * 100.0
+        return (match_count / keyword_count) * 100.0
     
     @staticmethod
     def calculate_total_score(resume_score: float, keyword_score: float) -> float:
         """Calculate weighted total score"""
         return (resume_score * Config.RESUME_WEIGHT) + (keyword_score * Config.KEYWORD_WEIGHT)
+    
+    @staticmethod
+    def calculate_score_matrices(match_counts: Any, 
+                                 resume_word_counts: Any, 
+                                 tech_match_counts: Any, 
+                                 keyword_match_counts: Any, 
+                                 keyword_count: int) -> Tuple[Any, Any, Any]:
+        """
+        Vectorized calculate_resume_score_from_counts, calculate_keyword_score_from_counts and
+        calculate_total_score for a resumes x jobs grid of NumPy arrays.
+        match_counts and tech_match_counts are (resumes, jobs), resume_word_counts is (resumes,)
+        and keyword_match_counts is (jobs,). Returns resume, keyword and total score matrices.
+        """
+        # Optional dependency, only required for matrix scoring
+        import numpy as np
+        
+        resume_word_counts = np.asarray(resume_word_counts, dtype=np.float64)[:, np.newaxis]
+        has_words = resume_word_counts > 0
+        base_scores = (match_counts / np.where(has_words, resume_word_counts, 1.0)) * 100
+        tech_bonus = np.minimum(tech_match_counts * Config.TECH_BONUS_PER_MATCH, Config.TECH_BONUS_MAX)
+        resume_scores = np.where(has_words, np.minimum(base_scores + tech_bonus, 100.0), 0.0)
+        
+        if keyword_count:
+            keyword_scores = (np.asarray(keyword_match_counts, dtype=np.float64) / keyword_count) * 100.0
+        else:
+            keyword_scores = np.zeros(len(keyword_match_counts))
+        keyword_scores = np.broadcast_to(keyword_scores, resume_scores.shape)
+        
+        total_scores = (resume_scores * Config.RESUME_WEIGHT) + (keyword_scores * Config.KEYWORD_WEIGHT)
+        return resume_scores, keyword_scores, total_scores
 
 
 class LoggerHelper:
@@ -144,3 +233,184 @@ class LoggerHelper:
     def format_completion_log(total_results: int) -> str:
         """Format analysis completion log message"""
         return f"Analysis completed. Processed {total_results} jobs"
+    
+    @staticmethod
+    def format_timing_log(mode: str, total_jobs: int, elapsed_seconds: float) -> str:
+        """Format analysis wall-clock timing log message"""
+        return f"Analyzed {total_jobs} jobs in {elapsed_seconds:.2f}s ({mode} mode)"
+
+
+class BackgroundEventLoop:
+    """
+    Long-lived asyncio event loop running on a daemon thread.
+    Lets synchronous callers (Flask views, Lambda handlers) run coroutines while
+    pooled async clients stay bound to a single loop across requests.
+    """
+    
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+    
+    def run(self, coroutine: Coroutine, timeout: float = None) -> Any:
+        """Run a coroutine on the background loop and wait for its result"""
+        return self.submit(coroutine).result(timeout)
+    
+    def submit(self, coroutine: Coroutine) -> concurrent.futures.Future:
+        """Schedule a coroutine on the background loop without waiting for it"""
+        return asyncio.run_coroutine_threadsafe(coroutine, self._get_loop())
+    
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the background loop, starting its thread on first use"""
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="job-scraper-event-loop",
+                    daemon=True
+                )
+                thread.start()
+            return self._loop
+
+
+class LRUCache:
+    """Thread-safe bounded mapping evicting the least recently used entries"""
+    
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable, is_current: Callable[[Any], bool] = None) -> Optional[Any]:
+        """
+        Get a value and mark it as recently used, counting the hit or miss.
+        A stored value that is_current rejects is stale: it counts as a miss and is not returned.
+        """
+        with self._lock:
+            if key not in self._entries or (is_current is not None and not is_current(self._entries[key])):
+                self.misses += 1
+                return None
+            
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+    
+    def put(self, key: Hashable, value: Any):
+        """Store a value, evicting the least recently used entry when full"""
+        if self.max_size <= 0:
+            return
+        
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+    
+    def ensure_capacity(self, size: int):
+        """Grow the cache to hold at least size entries, unless it is disabled"""
+        with self._lock:
+            if 0 < self.max_size < size:
+                self.max_size = size
+    
+    def invalidate(self, key: Hashable):
+        """Remove a single entry if present"""
+        with self._lock:
+            self._entries.pop(key, None)
+    
+    def clear(self):
+        """Remove every entry"""
+        with self._lock:
+            self._entries.clear()
+    
+    def get_stats(self) -> Dict:
+        """Get size and hit/miss counters"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+            }
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# int.bit_count is only available on Python 3.10+
+_popcount = getattr(int, 'bit_count', None) or (lambda bits: bin(bits).count('1'))
+
+# Positions of the set bits of every byte value, for decoding bitsets a byte at a time
+_BYTE_BIT_POSITIONS = tuple(tuple(bit for bit in range(8) if value >> bit & 1) for value in range(256))
+
+
+class TokenVocabulary:
+    """
+    Thread-safe interning of tokens to dense integer ids.
+    Token sets are encoded as int bitsets, so intersections are a single & and
+    match counts a popcount instead of building and intersecting sets of strings.
+    """
+    
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._tokens: List[str] = []
+        self._lock = threading.Lock()
+    
+    def encode(self, tokens: Iterable[str]) -> int:
+        """Encode tokens as a bitset, assigning ids to tokens seen for the first time"""
+        ids = self._ids
+        token_ids = []
+        unknown_tokens = []
+        for token in set(tokens):
+            token_id = ids.get(token)
+            if token_id is None:
+                unknown_tokens.append(token)
+            else:
+                token_ids.append(token_id)
+        
+        if unknown_tokens:
+            with self._lock:
+                for token in unknown_tokens:
+                    token_id = ids.get(token)
+                    if token_id is None:
+                        token_id = len(self._tokens)
+                        self._tokens.append(token)
+                        ids[token] = token_id
+                    token_ids.append(token_id)
+        
+        if not token_ids:
+            return 0
+        
+        # Setting bits in a byte buffer avoids creating a new big int per token
+        bitmap = bytearray(max(token_ids) // 8 + 1)
+        for token_id in token_ids:
+            bitmap[token_id >> 3] |= 1 << (token_id & 7)
+        return int.from_bytes(bitmap, 'little')
+    
+    def decode(self, bits: int) -> List[str]:
+        """Get the tokens of a bitset in id order"""
+        return [self._tokens[token_id] for token_id in self.decode_ids(bits)]
+    
+    @staticmethod
+    def decode_ids(bits: int) -> List[int]:
+        """
+        Get the token ids of a bitset in ascending order.
+        Scans the bitset's bytes once; clearing bits one at a time would copy the whole int per token.
+        """
+        token_ids = []
+        for byte_index, value in enumerate(bits.to_bytes((bits.bit_length() + 7) // 8, 'little')):
+            if value:
+                offset = byte_index << 3
+                token_ids.extend(offset + bit for bit in _BYTE_BIT_POSITIONS[value])
+        return token_ids
+    
+    @staticmethod
+    def count(bits: int) -> int:
+        """Count the tokens in a bitset"""
+        return _popcount(bits)
+    
+    def __len__(self) -> int:
+        return len(self._tokens)
@@ -0,0 +1,187 @@
+"""
+Disk-backed HTTP response cache for the scraping services.
+Stores fetched pages by normalized URL with TTL freshness, conditional
+revalidation validators and a size-bounded LRU eviction policy.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from config.settings import Config
+
+
+@dataclass
+class CachedResponse:
+    """Cached page body with the validators needed for conditional requests"""
+    url: str
+    content: bytes
+    encoding: Optional[str]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    stored_at: float
+    
+    @property
+    def text(self) -> str:
+        """Decode the cached body the same way the live response was decoded"""
+        return self.content.decode(self.encoding or 'utf-8', errors='replace')
+    
+    def is_fresh(self, ttl: float) -> bool:
+        """Check whether the entry can be served without contacting the origin"""
+        return time.time() - self.stored_at < ttl
+    
+    def conditional_headers(self) -> Dict[str, str]:
+        """Build revalidation headers from the stored validators"""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class HTTPResponseCache:
+    """
+    SQLite-backed response cache living in a local directory.
+    Entries older than the TTL are revalidated; the least recently used entries
+    are evicted once the stored bodies exceed max_bytes.
+    """
+    
+    DB_FILENAME = 'http_cache.sqlite3'
+    
+    def __init__(self, cache_dir: str, ttl: float, max_bytes: int):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        
+        os.makedirs(cache_dir, exist_ok=True)
+        self._connection = sqlite3.connect(
+            os.path.join(cache_dir, self.DB_FILENAME),
+            check_same_thread=False,
+            isolation_level=None
+        )
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS responses ('
+            ' key TEXT PRIMARY KEY, url TEXT, content BLOB, encoding TEXT,'
+            ' etag TEXT, last_modified TEXT, stored_at REAL, last_access REAL, size INTEGER)'
+        )
+        self._connection.execute(
+            'CREATE INDEX IF NOT EXISTS responses_last_access ON responses (last_access)'
+        )
+        # Total body size kept up to date by triggers, so every process sharing the
+        # directory sees it without summing the table
+        self._connection.executescript(
+            'BEGIN;'
+            'CREATE TABLE IF NOT EXISTS cache_size (total INTEGER NOT NULL);'
+            'CREATE TRIGGER IF NOT EXISTS responses_size_insert AFTER INSERT ON responses'
+            ' BEGIN UPDATE cache_size SET total = total + NEW.size; END;'
+            'CREATE TRIGGER IF NOT EXISTS responses_size_update AFTER UPDATE OF size ON responses'
+            ' BEGIN UPDATE cache_size SET total = total + NEW.size - OLD.size; END;'
+            'CREATE TRIGGER IF NOT EXISTS responses_size_delete AFTER DELETE ON responses'
+            ' BEGIN UPDATE cache_size SET total = total - OLD.size; END;'
+            'INSERT INTO cache_size SELECT COALESCE(SUM(size), 0) FROM responses'
+            ' WHERE NOT EXISTS (SELECT 1 FROM cache_size);'
+            'COMMIT;'
+        )
+    
+    @classmethod
+    def from_config(cls, config: Config) -> 'HTTPResponseCache':
+        """Create a cache from the HTTP_CACHE_* settings"""
+        return cls(config.HTTP_CACHE_DIR, config.HTTP_CACHE_TTL, config.HTTP_CACHE_MAX_BYTES)
+    
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Get a cached response and mark it as recently used"""
+        try:
+            with self._lock:
+                row = self._connection.execute(
+                    'SELECT url, content, encoding, etag, last_modified, stored_at'
+                    ' FROM responses WHERE key = ?', (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                
+                self._connection.execute(
+                    'UPDATE responses SET last_access = ? WHERE key = ?', (time.time(), key)
+                )
+            return CachedResponse(*row)
+        except sqlite3.Error as e:
+            self.logger.warning(f"HTTP cache read failed for {key}: {str(e)}")
+            return None
+    
+    def put(self,
+            key: str,
+            url: str,
+            content: bytes,
+            encoding: Optional[str],
+            etag: Optional[str] = None,
+            last_modified: Optional[str] = None):
+        """Store a response, evicting least recently used entries past max_bytes"""
+        if len(content) > self.max_bytes:
+            return
+        
+        now = time.time()
+        try:
+            with self._lock:
+                # An upsert rather than INSERT OR REPLACE, whose implicit delete skips the size trigger
+                self._connection.execute(
+                    'INSERT INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)'
+                    ' ON CONFLICT (key) DO UPDATE SET url = excluded.url, content = excluded.content,'
+                    ' encoding = excluded.encoding, etag = excluded.etag,'
+                    ' last_modified = excluded.last_modified, stored_at = excluded.stored_at,'
+                    ' last_access = excluded.last_access, size = excluded.size',
+                    (key, url, content, encoding, etag, last_modified, now, now, len(content))
+                )
+                self._evict()
+        except sqlite3.Error as e:
+            self.logger.warning(f"HTTP cache write failed for {key}: {str(e)}")
+    
+    def touch(self, key: str):
+        """Restart the freshness lifetime of an entry after a 304 revalidation"""
+        now = time.time()
+        try:
+            with self._lock:
+                self._connection.execute(
+                    'UPDATE responses SET stored_at = ?, last_access = ? WHERE key = ?',
+                    (now, now, key)
+                )
+        except sqlite3.Error as e:
+            self.logger.warning(f"HTTP cache update failed for {key}: {str(e)}")
+    
+    def invalidate(self, key: str):
+        """Remove a single entry"""
+        try:
+            with self._lock:
+                self._connection.execute('DELETE FROM responses WHERE key = ?', (key,))
+        except sqlite3.Error as e:
+            self.logger.warning(f"HTTP cache invalidation failed for {key}: {str(e)}")
+    
+    def clear(self):
+        """Remove every entry"""
+        try:
+            with self._lock:
+                self._connection.execute('DELETE FROM responses')
+        except sqlite3.Error as e:
+            self.logger.warning(f"HTTP cache clear failed: {str(e)}")
+    
+    def _evict(self):
+        """Delete least recently used entries until the cache fits in max_bytes"""
+        total_size = self._connection.execute('SELECT total FROM cache_size').fetchone()[0]
+        if total_size <= self.max_bytes:
+            return
+        
+        # Reads the oldest entries through the last_access index only as far as needed
+        evicted_keys = []
+        for key, size in self._connection.execute('SELECT key, size FROM responses ORDER BY last_access'):
+            if total_size <= self.max_bytes:
+                break
+            evicted_keys.append((key,))
+            total_size -= size
+        
+        self._connection.executemany('DELETE FROM responses WHERE key = ?', evicted_keys)
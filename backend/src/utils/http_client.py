@@ -0,0 +1,139 @@
+"""
+Pooled HTTP client for the scraping services.
+Keeps connections alive between fetches so repeated hosts skip the TCP/TLS handshake.
+"""
+
+import threading
+import time
+from typing import Dict
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config.settings import Config
+from utils.timing import CONNECT, timed
+
+
+class ConnectionPoolStats:
+    """Thread-safe counters describing how well a connection pool is reused"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.handshakes = 0
+    
+    def record(self, requests_made: int = 0, handshakes: int = 0):
+        """Add request and new-connection counts"""
+        with self._lock:
+            self.requests += requests_made
+            self.handshakes += handshakes
+    
+    def merge(self, other: 'ConnectionPoolStats'):
+        """Add the counters of another stats object"""
+        with other._lock:
+            requests_made, handshakes = other.requests, other.handshakes
+        self.record(requests_made, handshakes)
+    
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for logging and JSON serialization"""
+        with self._lock:
+            requests_made, handshakes = self.requests, self.handshakes
+        
+        reused = max(requests_made - handshakes, 0)
+        return {
+            "requests": requests_made,
+            "handshakes": handshakes,
+            "reused_connections": reused,
+            "reuse_rate": round(reused / requests_made, 4) if requests_made else 0.0
+        }
+
+
+def _create_counting_pool_class(pool_class, stats: ConnectionPoolStats):
+    """
+    Subclass a urllib3 pool so every request and socket connect is recorded in stats.
+    Connects are timed including DNS resolution and any TLS handshake, which urllib3 runs together.
+    """
+    
+    class CountingConnection(pool_class.ConnectionCls):
+        def connect(self):
+            # urllib3 reconnects dropped connections lazily, so count real connects
+            stats.record(handshakes=1)
+            with timed(CONNECT):
+                super().connect()
+    
+    class CountingConnectionPool(pool_class):
+        ConnectionCls = CountingConnection
+        
+        def urlopen(self, *args, **kwargs):
+            stats.record(requests_made=1)
+            return super().urlopen(*args, **kwargs)
+    
+    return CountingConnectionPool
+
+
+class _StatsHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose host pools report requests and new connections"""
+    
+    def __init__(self, stats: ConnectionPoolStats, **kwargs):
+        self.stats = stats
+        super().__init__(**kwargs)
+    
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            scheme: _create_counting_pool_class(pool_class, self.stats)
+            for scheme, pool_class in self.poolmanager.pool_classes_by_scheme.items()
+        }
+
+
+class PooledHTTPClient:
+    """
+    Long-lived requests session with a configurable keep-alive connection pool.
+    Pools idle for longer than HTTP_KEEPALIVE_TIMEOUT are dropped so stale sockets are not reused.
+    """
+    
+    def __init__(self, config: Config = None):
+        self.config = config or Config()
+        self._lock = threading.Lock()
+        self._stats = ConnectionPoolStats()
+        self._last_used = time.monotonic()
+        self._session, self._adapter = self._create_session()
+    
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """Send a GET request through the pooled session"""
+        self._expire_idle_connections()
+        return self._session.get(url, **kwargs)
+    
+    def get_stats(self) -> Dict:
+        """Get connection reuse statistics since the client was created"""
+        return self._stats.to_dict()
+    
+    def collect_stats(self, stats: ConnectionPoolStats):
+        """Add this client's counters to stats"""
+        stats.merge(self._stats)
+    
+    def close(self):
+        """Close all pooled connections"""
+        self._session.close()
+    
+    def _create_session(self):
+        """Create the session with one adapter shared by HTTP and HTTPS"""
+        adapter = _StatsHTTPAdapter(
+            self._stats,
+            pool_connections=self.config.HTTP_POOL_CONNECTIONS,
+            pool_maxsize=self.config.HTTP_POOL_MAXSIZE
+        )
+        session = requests.Session()
+        session.headers['User-Agent'] = self.config.USER_AGENT
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session, adapter
+    
+    def _expire_idle_connections(self):
+        """Drop pooled connections when the client sat idle past the keep-alive timeout"""
+        with self._lock:
+            now = time.monotonic()
+            if now - self._last_used > self.config.HTTP_KEEPALIVE_TIMEOUT:
+                # Servers have most likely closed these sockets already
+                self._adapter.poolmanager.clear()
+            self._last_used = now
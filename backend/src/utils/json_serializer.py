@@ -0,0 +1,108 @@
+"""
+JSON serialization shared by the Flask API, the Lambda adapter and streaming endpoints.
+Encodes straight to UTF-8 bytes with orjson when it is installed, falling back to the
+standard library. Each surface keeps the encoding it always had: Flask responses are
+compact with sorted keys, ASCII escapes and a trailing newline like jsonify, and Lambda
+bodies use json.dumps' defaults. orjson writes floats below 1e-4 or from 1e16 in its own
+exponent form (1e-5 rather than 1e-05) and NaN as null; without orjson the bytes are identical.
+Objects orjson rejects, such as lone surrogates from request bodies or non-string dict keys,
+are encoded by the standard library as before.
+"""
+
+import json
+import re
+from typing import Any, Optional
+
+from utils.timing import SERIALIZE, timed
+
+try:
+    # Optional dependency, only required for faster response encoding
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson only encodes NumPy scalars (e.g. /rank scores) when asked to
+_ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY if orjson is not None else 0
+_ORJSON_SORTED_OPTIONS = (
+    _ORJSON_OPTIONS | orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE if orjson is not None else 0
+)
+
+# Characters json.dumps escapes with ensure_ascii that orjson writes as they are
+_NON_ASCII = re.compile('[^\x00-\x7e]')
+
+# Lone surrogates, which can be escaped in JSON but not encoded as UTF-8
+_SURROGATE = re.compile('[\ud800-\udfff]')
+
+
+def _default(obj: Any) -> Any:
+    """Encode models by their to_dict and NumPy scalars as Python numbers"""
+    if hasattr(obj, 'to_dict'):
+        return obj.to_dict()
+    if hasattr(obj, 'item'):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _escape_non_ascii(match) -> str:
+    """Escape one character as \\uXXXX, as a surrogate pair beyond the BMP, like json.dumps"""
+    code = ord(match.group(0))
+    if code < 0x10000:
+        return f'\\u{code:04x}'
+    code -= 0x10000
+    return f'\\u{0xd800 | (code >> 10):04x}\\u{0xdc00 | (code & 0x3ff):04x}'
+
+
+def _orjson_dumps(obj: Any, option: int) -> Optional[bytes]:
+    """Encode with orjson, or get None when it is not installed or rejects the object"""
+    if orjson is None:
+        return None
+    try:
+        return orjson.dumps(obj, default=_default, option=option)
+    except orjson.JSONEncodeError:
+        # Lone surrogates and non-string keys, which json.dumps encodes
+        return None
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes, keeping dictionary key order"""
+    with timed(SERIALIZE):
+        encoded = _orjson_dumps(obj, _ORJSON_OPTIONS)
+        if encoded is not None:
+            return encoded
+        
+        encoded = json.dumps(obj, default=_default, ensure_ascii=False, separators=(',', ':'))
+        try:
+            return encoded.encode('utf-8')
+        except UnicodeEncodeError:
+            # Surrogates only occur inside strings, so escaping them keeps the JSON valid
+            return _SURROGATE.sub(_escape_non_ascii, encoded).encode('utf-8')
+
+
+def dumps_text(obj: Any) -> str:
+    """Serialize to a compact JSON string, for APIs that take text bodies"""
+    return dumps(obj).decode('utf-8')
+
+
+def dumps_sorted(obj: Any) -> bytes:
+    """Serialize like Flask's jsonify: compact, sorted keys, ASCII escapes and a trailing newline"""
+    with timed(SERIALIZE):
+        encoded = _orjson_dumps(obj, _ORJSON_SORTED_OPTIONS)
+        if encoded is None:
+            encoded = json.dumps(obj, default=_default, sort_keys=True, separators=(',', ':'))
+            return f"{encoded}\n".encode('ascii')
+        
+        if encoded.isascii() and b'\x7f' not in encoded:
+            return encoded
+        # Non-ASCII characters only occur inside strings, so escaping them keeps the JSON valid
+        return _NON_ASCII.sub(_escape_non_ascii, encoded.decode('utf-8')).encode('ascii')
+
+
+def dumps_standard(obj: Any) -> str:
+    """Serialize with json.dumps' defaults (', ' and ': ' separators, ASCII escapes) for Lambda bodies"""
+    with timed(SERIALIZE):
+        return json.dumps(obj, default=_default)
+
+
+def get_backend() -> str:
+    """Get the name of the encoder in use"""
+    return 'orjson' if orjson is not None else 'json'
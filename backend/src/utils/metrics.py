@@ -0,0 +1,214 @@
+"""
+Prometheus metrics for the analysis pipeline.
+PipelineMetrics is installed as the utils.timing recorder, turning stage durations into latency
+histograms and pipeline events into counters, and renders them with cache hit ratios in the
+Prometheus text exposition format served on /metrics. Metrics are kept per process: every
+series carries a worker label with the process ID, so series of different workers never mix.
+"""
+
+import bisect
+import os
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+from config.settings import Config
+from utils import timing
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Seconds; spans cached lookups through slow page downloads
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Hosts beyond METRICS_MAX_HOSTS share this label so scraped URLs cannot grow the series unbounded
+OTHER_HOST = 'other'
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text exposition format"""
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = '') -> str:
+    """Format label pairs as {name="value",...}, or nothing without labels"""
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value, keeping whole numbers free of a decimal point"""
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Counter:
+    """Thread-safe counter family with one series per label combination"""
+    
+    def __init__(self, name: str, documentation: str, label_names: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, ...], float] = {}
+    
+    def inc(self, label_values: Tuple[str, ...] = (), amount: float = 1):
+        """Increase the series of the label values"""
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+    
+    def render(self, worker: str = None) -> List[str]:
+        """Get the exposition lines of the family, labelled with worker if given"""
+        with self._lock:
+            values = sorted(self._values.items())
+        
+        names, prefix = (('worker',), (worker,)) if worker is not None else ((), ())
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        for label_values, value in values:
+            labels = _format_labels(names + self.label_names, prefix + label_values)
+            lines.append(f"{self.name}{labels} {_format_value(value)}")
+        return lines
+
+
+class Histogram:
+    """Thread-safe histogram family with fixed buckets and one series per label combination"""
+    
+    def __init__(self, 
+                 name: str, 
+                 documentation: str, 
+                 label_names: Tuple[str, ...] = (), 
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        # Per series: observations per bucket (the last one is +Inf), then the sum
+        self._series: Dict[Tuple[str, ...], Tuple[List[int], List[float]]] = {}
+    
+    def observe(self, value: float, label_values: Tuple[str, ...] = ()):
+        """Add one observation to the series of the label values"""
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = ([0] * (len(self.buckets) + 1), [0.0])
+            series[0][index] += 1
+            series[1][0] += value
+    
+    def render(self, worker: str = None) -> List[str]:
+        """Get the exposition lines of the family with cumulative buckets, labelled with worker if given"""
+        with self._lock:
+            series = sorted(
+                (label_values, list(counts), total[0])
+                for label_values, (counts, total) in self._series.items()
+            )
+        
+        names, prefix = (('worker',), (worker,)) if worker is not None else ((), ())
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        for label_values, counts, total in series:
+            names_values = (names + self.label_names, prefix + label_values)
+            cumulative = 0
+            for bound, observations in zip(self.buckets + (float('inf'),), counts):
+                cumulative += observations
+                le = 'le="+Inf"' if bound == float('inf') else f'le="{_format_value(bound)}"'
+                bucket_labels = _format_labels(*names_values, le)
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            labels = _format_labels(*names_values)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class PipelineMetrics:
+    """
+    Recorder collecting pipeline timings and events as Prometheus metrics.
+    Cache hit ratios are read from the caches' own counters when metrics are rendered,
+    so caches cost nothing extra per lookup.
+    """
+    
+    def __init__(self, config: Config = None):
+        self.config = config or Config()
+        self._hosts_lock = threading.Lock()
+        self._hosts = set()
+        self._cache_stats_sources: List[Callable[[], Dict[str, Optional[Dict]]]] = []
+        
+        self.stage_duration = Histogram(
+            'job_scraper_stage_duration_seconds', 'Duration of each pipeline stage run.', ('stage',)
+        )
+        self.jobs = Counter('job_scraper_jobs_total', 'Analyzed links by job status.', ('status',))
+        self.host_requests = Counter(
+            'job_scraper_host_requests_total', 'Page requests by host and outcome.', ('host', 'outcome')
+        )
+        self.http_cache = Counter(
+            'job_scraper_http_cache_requests_total', 'HTTP response cache lookups by result.', ('result',)
+        )
+        self._events = {
+            timing.JOB_STATUS: self.jobs,
+            timing.HOST_REQUEST: self.host_requests,
+            timing.HTTP_CACHE: self.http_cache
+        }
+    
+    def record(self, stage: str, seconds: float):
+        """Observe one run of a pipeline stage"""
+        self.stage_duration.observe(seconds, (stage,))
+    
+    def count(self, event: str, labels: Tuple[str, ...]):
+        """Count one pipeline event"""
+        counter = self._events.get(event)
+        if counter is None:
+            return
+        if event == timing.HOST_REQUEST:
+            labels = (self._limit_host(labels[0]),) + labels[1:]
+        counter.inc(labels)
+    
+    def add_cache_stats(self, get_cache_stats: Callable[[], Dict[str, Optional[Dict]]]):
+        """Report the hits and misses of the caches returned by get_cache_stats, keyed by cache name"""
+        self._cache_stats_sources.append(get_cache_stats)
+    
+    def render(self) -> str:
+        """Render every metric of this process in the Prometheus text exposition format"""
+        # Read at render time, so workers forked after the metrics were created report their own ID
+        worker = str(os.getpid())
+        lines = []
+        for metric in (self.stage_duration, self.jobs, self.host_requests, self.http_cache):
+            lines.extend(metric.render(worker))
+        lines.extend(self._render_caches(worker))
+        return '\n'.join(lines) + '\n'
+    
+    def _render_caches(self, worker: str) -> List[str]:
+        """Render lookups and hit ratios of the in-memory caches"""
+        lookups = Counter('job_scraper_cache_lookups_total', 'In-memory cache lookups by result.',
+                          ('cache', 'result'))
+        hit_ratio = [
+            "# HELP job_scraper_cache_hit_ratio Share of in-memory cache lookups that were hits.",
+            "# TYPE job_scraper_cache_hit_ratio gauge"
+        ]
+        for get_cache_stats in self._cache_stats_sources:
+            for cache, stats in get_cache_stats().items():
+                if stats is None:
+                    continue
+                lookups.inc((cache, 'hit'), stats['hits'])
+                lookups.inc((cache, 'miss'), stats['misses'])
+                labels = _format_labels(('worker', 'cache'), (worker, cache))
+                hit_ratio.append(f'job_scraper_cache_hit_ratio{labels} {stats["hit_rate"]}')
+        return lookups.render(worker) + hit_ratio
+    
+    def _limit_host(self, host: str) -> str:
+        """Get the host label, folding hosts past METRICS_MAX_HOSTS into one series"""
+        if host in self._hosts:
+            return host
+        with self._hosts_lock:
+            if len(self._hosts) >= self.config.METRICS_MAX_HOSTS:
+                return OTHER_HOST
+            self._hosts.add(host)
+        return host
+
+
+def create_metrics(config: Config) -> Optional[PipelineMetrics]:
+    """Create the pipeline metrics and install them as the timing recorder, if enabled in config"""
+    if not config.METRICS_ENABLED:
+        return None
+    
+    metrics = PipelineMetrics(config)
+    timing.set_recorder(metrics)
+    return metrics
@@ -0,0 +1,149 @@
+"""
+MinHash signatures and locality-sensitive hashing for near-duplicate text detection.
+Two texts whose word shingle sets have Jaccard similarity s agree on each signature
+value with probability s, so signatures estimate similarity without comparing texts.
+"""
+
+import random
+import zlib
+from collections import OrderedDict
+from typing import Dict, Hashable, List, Optional, Set, Tuple
+
+from utils.helpers import TextProcessor
+
+# Multiply-shift hashing works modulo 2**64
+MASK_64 = (1 << 64) - 1
+
+
+class MinHasher:
+    """
+    Compute MinHash signatures over word shingles with a fixed set of hash permutations.
+    Permutations are multiply-shift hashes of the 32-bit shingle hashes; they are
+    evaluated with NumPy when vectorized and it is installed, and in pure Python
+    otherwise, with identical results.
+    """
+    
+    def __init__(self, num_perm: int = 64, shingle_size: int = 3, seed: int = 1, vectorized: bool = True):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        rng = random.Random(seed)
+        self._permutations = [
+            (rng.getrandbits(64) | 1, rng.getrandbits(64)) for _ in range(num_perm)
+        ]
+        self._numpy_permutations = self._create_numpy_permutations() if vectorized else None
+    
+    def _create_numpy_permutations(self) -> Optional[tuple]:
+        """Stack the permutation coefficients as NumPy columns, if NumPy is available"""
+        try:
+            # Optional dependency, only required for vectorized signatures
+            import numpy as np
+        except ImportError:
+            return None
+        
+        multipliers = np.array([a for a, _ in self._permutations], dtype=np.uint64)[:, np.newaxis]
+        offsets = np.array([b for _, b in self._permutations], dtype=np.uint64)[:, np.newaxis]
+        return np, multipliers, offsets
+    
+    def shingles(self, text: str) -> Set[int]:
+        """Hash every run of shingle_size consecutive normalized words"""
+        words = TextProcessor.normalize_text(text)
+        if len(words) < self.shingle_size:
+            return {zlib.crc32(' '.join(words).encode('utf-8'))} if words else set()
+        
+        return {
+            zlib.crc32(' '.join(words[i:i + self.shingle_size]).encode('utf-8'))
+            for i in range(len(words) - self.shingle_size + 1)
+        }
+    
+    def signature(self, text: str) -> Optional[Tuple[int, ...]]:
+        """Get the MinHash signature of a text, or None when it has no words"""
+        shingles = self.shingles(text)
+        if not shingles:
+            return None
+        
+        if self._numpy_permutations is not None:
+            np, multipliers, offsets = self._numpy_permutations
+            values = np.fromiter(shingles, dtype=np.uint64, count=len(shingles))
+            # uint64 arithmetic wraps around, which is the modulo 2**64 of multiply-shift
+            hashes = (multipliers * values + offsets) >> np.uint64(32)
+            return tuple(hashes.min(axis=1).tolist())
+        
+        return tuple(
+            min([((a * shingle + b) & MASK_64) >> 32 for shingle in shingles])
+            for a, b in self._permutations
+        )
+    
+    @staticmethod
+    def estimate_similarity(signature1: Tuple[int, ...], signature2: Tuple[int, ...]) -> float:
+        """Estimate the Jaccard similarity of two texts from their signatures"""
+        matches = sum(1 for value1, value2 in zip(signature1, signature2) if value1 == value2)
+        return matches / len(signature1)
+
+
+class LSHIndex:
+    """
+    Banded LSH index over MinHash signatures.
+    Signatures are split into bands and two texts become candidates when any band is
+    identical, which is likely above roughly (1 / bands) ** (1 / rows) similarity.
+    Holds at most capacity entries, evicting the least recently matched ones.
+    """
+    
+    def __init__(self, num_perm: int, bands: int, capacity: int):
+        if bands < 1 or num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be a multiple of bands ({bands})")
+        
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.capacity = capacity
+        self._entries: OrderedDict = OrderedDict()
+        self._buckets: Dict[Tuple, Set[Hashable]] = {}
+    
+    def query(self, signature: Tuple[int, ...]) -> Set[Hashable]:
+        """Get the keys sharing at least one band with the signature"""
+        candidates = set()
+        for band_key in self._band_keys(signature):
+            candidates.update(self._buckets.get(band_key, ()))
+        return candidates
+    
+    def get(self, key: Hashable) -> Optional[Tuple[Tuple[int, ...], object]]:
+        """Get the signature and value stored for a key"""
+        return self._entries.get(key)
+    
+    def insert(self, key: Hashable, signature: Tuple[int, ...], value: object = None):
+        """Add or replace an entry, evicting the least recently used entry when full"""
+        if self.capacity <= 0:
+            return
+        
+        self.remove(key)
+        self._entries[key] = (signature, value)
+        for band_key in self._band_keys(signature):
+            self._buckets.setdefault(band_key, set()).add(key)
+        
+        while len(self._entries) > self.capacity:
+            self.remove(next(iter(self._entries)))
+    
+    def touch(self, key: Hashable):
+        """Mark an entry as recently used"""
+        if key in self._entries:
+            self._entries.move_to_end(key)
+    
+    def remove(self, key: Hashable):
+        """Remove an entry if present"""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        
+        for band_key in self._band_keys(entry[0]):
+            bucket = self._buckets.get(band_key)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[band_key]
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def _band_keys(self, signature: Tuple[int, ...]) -> List[Tuple]:
+        """Split a signature into (band, values) bucket keys"""
+        rows = self.rows
+        return [(band, signature[band * rows:(band + 1) * rows]) for band in range(self.bands)]
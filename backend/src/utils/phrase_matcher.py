@@ -0,0 +1,142 @@
+"""
+Aho-Corasick phrase matcher for skills and keywords.
+Finds every occurrence of a large phrase dictionary in one linear pass over a text,
+including multi-word and punctuated phrases such as "machine learning" or "c++".
+"""
+
+import re
+from collections import deque
+from typing import Dict, Iterable, List, Set, Tuple
+
+from config.settings import Config
+
+
+# Words and single punctuation characters inside a whitespace-separated chunk
+TOKEN_PATTERN = re.compile(r'\w+|[^\w\s]')
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split lowercased text into word and punctuation tokens.
+    Whitespace runs become a single '' token, so multi-word phrases match regardless
+    of how many spaces or line breaks separate their words.
+    """
+    tokens = []
+    for chunk in text.lower().split():
+        if chunk.isalnum():
+            tokens.append(chunk)
+        else:
+            tokens.extend(TOKEN_PATTERN.findall(chunk))
+        tokens.append('')
+    
+    # Drop the separator after the last chunk
+    return tokens[:-1]
+
+
+def normalize_phrase(phrase: str) -> str:
+    """Lowercase a phrase and collapse its whitespace"""
+    return ' '.join(phrase.lower().split())
+
+
+def _is_word_token(token: str) -> bool:
+    """Check whether a token is a run of word characters"""
+    return bool(token) and (token[0].isalnum() or token[0] == '_')
+
+
+class PhraseMatcher:
+    """
+    Aho-Corasick automaton over text tokens.
+    Phrases only match whole words: "go" does not match "good" and ".net" does not
+    match inside "asp.net". Matching cost is linear in the text length and
+    independent of the number of phrases.
+    """
+    
+    def __init__(self, phrases: Iterable[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._outputs: List[List[Tuple[str, int, bool, bool]]] = [[]]
+        self.phrases: Set[str] = set()
+        
+        for phrase in phrases:
+            self._add_phrase(normalize_phrase(phrase))
+        self._build_failure_links()
+    
+    def find_all(self, text: str) -> Set[str]:
+        """Get the normalized phrases occurring in text"""
+        if not text:
+            return set()
+        
+        tokens = tokenize(text)
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        root = goto[0]
+        found = set()
+        state = 0
+        for index, token in enumerate(tokens):
+            if state:
+                while state and token not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(token, 0)
+            else:
+                # Fast path: most tokens do not start any phrase
+                state = root.get(token, 0)
+            if not state:
+                continue
+            
+            for phrase, length, check_start, check_end in outputs[state]:
+                if phrase in found:
+                    continue
+                # Phrases starting or ending with punctuation need an explicit word boundary
+                start = index - length + 1
+                if check_start and start > 0 and _is_word_token(tokens[start - 1]):
+                    continue
+                if check_end and index + 1 < len(tokens) and _is_word_token(tokens[index + 1]):
+                    continue
+                found.add(phrase)
+        
+        return found
+    
+    def __len__(self) -> int:
+        return len(self.phrases)
+    
+    def _add_phrase(self, phrase: str):
+        """Insert a phrase into the trie"""
+        tokens = tokenize(phrase)
+        if not phrase or phrase in self.phrases:
+            return
+        
+        state = 0
+        for token in tokens:
+            next_state = self._goto[state].get(token)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append([])
+                self._goto[state][token] = next_state
+            state = next_state
+        
+        self._outputs[state].append(
+            (phrase, len(tokens), not _is_word_token(tokens[0]), not _is_word_token(tokens[-1]))
+        )
+        self.phrases.add(phrase)
+    
+    def _build_failure_links(self):
+        """Compute failure links breadth-first and merge the outputs of suffix states"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, next_state in self._goto[state].items():
+                fallback = self._fail[state]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(token, 0)
+                self._outputs[next_state] = (
+                    self._outputs[next_state] + self._outputs[self._fail[next_state]]
+                )
+                queue.append(next_state)
+
+
+def create_skill_matcher(keywords: Iterable[str] = (), config: Config = None) -> PhraseMatcher:
+    """Compile TECH_SKILLS plus the given keywords into a single matcher"""
+    config = config or Config()
+    return PhraseMatcher(list(config.TECH_SKILLS) + list(keywords))
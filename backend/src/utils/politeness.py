@@ -0,0 +1,226 @@
+"""
+Per-host politeness scheduler for the scraping services.
+Spaces requests to each host with a token bucket, honors Retry-After, and adapts
+per-host concurrency to throttling and errors with additive-increase/multiplicative-decrease.
+"""
+
+import asyncio
+import email.utils
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from config.settings import Config
+
+# Responses that mean the host wants us to slow down
+THROTTLE_STATUSES = frozenset({429, 503})
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Get the seconds to wait from a Retry-After header holding seconds or an HTTP date"""
+    if not value:
+        return None
+    
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class _HostState:
+    """Token bucket, backoff and adaptive concurrency limit of a single host"""
+    
+    def __init__(self, rate: float, burst: float, max_concurrency: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.refilled_at = time.monotonic()
+        self.blocked_until = 0.0
+        self.max_concurrency = max_concurrency
+        self.concurrency_limit = float(max_concurrency)
+        self.decreased_at = 0.0
+        self.in_flight = 0
+    
+    def reserve(self, now: float) -> float:
+        """Take a request slot, or get the seconds to wait before trying again"""
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        
+        if self.in_flight >= int(self.concurrency_limit):
+            # Freed by release, which wakes waiting threads
+            return float('inf')
+        
+        if self.rate > 0:
+            self.tokens = min(self.burst, self.tokens + (now - self.refilled_at) * self.rate)
+            self.refilled_at = now
+            if self.tokens < 1:
+                return (1 - self.tokens) / self.rate
+            self.tokens -= 1
+        
+        self.in_flight += 1
+        return 0.0
+
+
+class HostPolitenessScheduler:
+    """
+    Thread-safe gate every outgoing request to a host passes through.
+    A request needs a token from the host's bucket (POLITENESS_RATE per second, bursts of
+    POLITENESS_BURST) and a free slot below the host's concurrency limit. The limit starts at
+    MAX_CONCURRENCY_PER_HOST, halves when the host throttles or fails, and grows back by
+    roughly one per limit's worth of successful requests. At most POLITENESS_MAX_HOSTS hosts
+    are tracked; the least recently used ones without requests in flight are forgotten first.
+    """
+    
+    # Waiting coroutines cannot be woken by release, so they poll at most this often
+    ASYNC_POLL_INTERVAL = 0.05
+    
+    def __init__(self, config: Config = None):
+        self.config = config or Config()
+        self._hosts: OrderedDict = OrderedDict()
+        self._condition = threading.Condition()
+    
+    def acquire(self, host: str, timeout: float = None) -> bool:
+        """
+        Block until a request to host may be sent, or for at most timeout seconds.
+        Returns False, without taking a slot, when the timeout ran out first.
+        """
+        expires_at = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                # Looked up again after waiting, in case the host was forgotten meanwhile
+                wait = self._get_state(host).reserve(now)
+                if wait <= 0:
+                    return True
+                if expires_at is not None:
+                    if now >= expires_at:
+                        return False
+                    wait = min(wait, expires_at - now)
+                self._condition.wait(None if wait == float('inf') else wait)
+    
+    async def acquire_async(self, host: str, timeout: float = None) -> bool:
+        """
+        Wait on the running event loop until a request to host may be sent, or for at most
+        timeout seconds. Returns False, without taking a slot, when the timeout ran out first.
+        """
+        expires_at = None if timeout is None else time.monotonic() + timeout
+        while True:
+            now = time.monotonic()
+            with self._condition:
+                wait = self._get_state(host).reserve(now)
+            if wait <= 0:
+                return True
+            if expires_at is not None:
+                if now >= expires_at:
+                    return False
+                wait = min(wait, expires_at - now)
+            await asyncio.sleep(min(wait, self.ASYNC_POLL_INTERVAL))
+    
+    def release(self, host: str, status: Optional[int], retry_after: Optional[str] = None) -> Optional[float]:
+        """
+        Return a request slot with the outcome of the request: its HTTP status, or None
+        when it timed out or failed to connect. Adjusts the host's concurrency limit and,
+        when the host throttled, blocks it and returns the backoff in seconds.
+        """
+        now = time.monotonic()
+        with self._condition:
+            state = self._get_state(host)
+            state.in_flight = max(0, state.in_flight - 1)
+            
+            backoff = None
+            if status is None or status in THROTTLE_STATUSES or status >= 500:
+                self._decrease(state, now)
+                if status in THROTTLE_STATUSES:
+                    backoff = min(
+                        parse_retry_after(retry_after) or self.config.POLITENESS_BACKOFF,
+                        self.config.POLITENESS_MAX_RETRY_AFTER
+                    )
+                    state.blocked_until = max(state.blocked_until, now + backoff)
+            elif state.concurrency_limit < state.max_concurrency:
+                state.concurrency_limit = min(
+                    state.max_concurrency, state.concurrency_limit + 1 / state.concurrency_limit
+                )
+            
+            self._condition.notify_all()
+        return backoff
+    
+    def cancel(self, host: str):
+        """Return a request slot without an outcome, for requests abandoned before their response"""
+        with self._condition:
+            state = self._get_state(host)
+            state.in_flight = max(0, state.in_flight - 1)
+            self._condition.notify_all()
+    
+    def set_crawl_delay(self, host: str, delay: float):
+        """Slow a host down to at most one request every delay seconds"""
+        if delay <= 0:
+            return
+        
+        with self._condition:
+            state = self._get_state(host)
+            state.rate = min(state.rate, 1 / delay) if state.rate > 0 else 1 / delay
+            state.burst = 1
+            state.tokens = min(state.tokens, 1)
+    
+    def get_stats(self) -> Dict:
+        """Get the current concurrency limit, in-flight requests and backoff of every host"""
+        now = time.monotonic()
+        with self._condition:
+            return {
+                host: {
+                    "concurrency_limit": int(state.concurrency_limit),
+                    "in_flight": state.in_flight,
+                    "rate": state.rate,
+                    "blocked_for": round(max(0.0, state.blocked_until - now), 3)
+                }
+                for host, state in self._hosts.items()
+            }
+    
+    def _get_state(self, host: str) -> _HostState:
+        """Get a host's state, creating it on first use. Callers hold the condition"""
+        state = self._hosts.get(host)
+        if state is not None:
+            self._hosts.move_to_end(host)
+            return state
+        
+        state = _HostState(
+            self.config.POLITENESS_RATE,
+            max(1.0, self.config.POLITENESS_BURST),
+            max(1, self.config.MAX_CONCURRENCY_PER_HOST)
+        )
+        self._hosts[host] = state
+        if len(self._hosts) > max(1, self.config.POLITENESS_MAX_HOSTS):
+            self._evict()
+        return state
+    
+    def _evict(self):
+        """Forget the least recently used host with no requests in flight. Callers hold the condition"""
+        # The newest host is the one just added
+        for host, state in itertools.islice(self._hosts.items(), len(self._hosts) - 1):
+            if state.in_flight == 0:
+                del self._hosts[host]
+                return
+    
+    def _decrease(self, state: _HostState, now: float):
+        """Halve the concurrency limit, at most once per backoff period so one burst of failures counts once"""
+        if now - state.decreased_at < self.config.POLITENESS_BACKOFF:
+            return
+        state.concurrency_limit = max(1.0, state.concurrency_limit * 0.5)
+        state.decreased_at = now
+
+
+def create_politeness_scheduler(config: Config) -> Optional[HostPolitenessScheduler]:
+    """Create the per-host politeness scheduler when enabled in config"""
+    if not config.POLITENESS_ENABLED:
+        return None
+    
+    return HostPolitenessScheduler(config)
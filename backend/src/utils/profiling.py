@@ -0,0 +1,169 @@
+"""
+On-demand per-request profiling.
+A sampling profiler records the stacks of the request's thread and the pipeline's worker threads
+while one request runs, and aggregates them as folded stacks ("frame;frame;frame count" lines),
+the input format of flamegraph.pl, speedscope and most flame graph viewers.
+"""
+
+import logging
+import os
+import random
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from config.settings import Config
+
+# Threads doing a request's work besides its own: the scraping pool and background event loop
+# ("job-scraper...") and asyncio's default executor, where async mode parses pages
+PIPELINE_THREAD_PREFIXES = ('job-scraper', 'asyncio_')
+
+
+def _frame_label(frame) -> str:
+    """Label a frame as function (file:line of its definition), like py-spy's folded output"""
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class SamplingProfiler:
+    """
+    Samples the stacks of the starting thread and pipeline threads every interval
+    from a background thread. Worker threads are shared, so in concurrent and async
+    modes their samples may include other requests running at the same time.
+    """
+    
+    def __init__(self, interval: float, max_depth: int = 128):
+        self.interval = interval
+        self.max_depth = max_depth
+        self.samples = 0
+        self._stacks: Dict[str, int] = {}
+        self._target_thread_id = None
+        self._stopped = threading.Event()
+        self._thread = None
+    
+    def __enter__(self):
+        self.start()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+        return False
+    
+    def start(self):
+        """Start sampling, with the calling thread as the request's thread"""
+        self._target_thread_id = threading.get_ident()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        """Stop sampling and wait for the sampler thread"""
+        self._stopped.set()
+        self._thread.join()
+    
+    def folded(self) -> str:
+        """Get the samples as folded stacks, most frequent first"""
+        stacks = sorted(self._stacks.items(), key=lambda item: -item[1])
+        return ''.join(f"{stack} {count}\n" for stack, count in stacks)
+    
+    def _run(self):
+        """Take a sample every interval until stopped"""
+        while not self._stopped.wait(self.interval):
+            self._sample()
+    
+    def _sample(self):
+        """Add the current stack of every profiled thread, rooted at the thread's name"""
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for thread_id, frame in sys._current_frames().items():
+            name = names.get(thread_id, '')
+            if thread_id != self._target_thread_id and not name.startswith(PIPELINE_THREAD_PREFIXES):
+                continue
+            
+            labels = []
+            while frame is not None and len(labels) < self.max_depth:
+                labels.append(_frame_label(frame))
+                frame = frame.f_back
+            labels.append(name)
+            stack = ';'.join(reversed(labels))
+            self._stacks[stack] = self._stacks.get(stack, 0) + 1
+        self.samples += 1
+
+
+class RequestProfiler:
+    """
+    Decides which requests are profiled and stores their profiles.
+    A request is profiled when the caller asks for it or, for always-on profiling of a
+    fraction of traffic, with probability PROFILING_SAMPLE_RATE.
+    """
+    
+    def __init__(self, config: Config = None):
+        self.config = config or Config()
+        self.logger = logging.getLogger(__name__)
+    
+    def should_profile(self, requested: bool) -> bool:
+        """Check whether to profile a request"""
+        return requested or random.random() < self.config.PROFILING_SAMPLE_RATE
+    
+    def is_requested(self, headers, query_args) -> bool:
+        """
+        Check whether the request headers or query parameters ask for a profile.
+        Headers are looked up in lower case, which case-insensitive mappings also accept.
+        """
+        value = (
+            headers.get(self.config.PROFILING_HEADER.lower())
+            or query_args.get(self.config.PROFILING_QUERY_PARAM)
+        )
+        return str(value or '').lower() in ('1', 'true', 'yes')
+    
+    def run(self, function: Callable[[], Any], requested: bool) -> Tuple[Any, Optional[Dict]]:
+        """
+        Call function, under the profiler when this request is profiled. Returns its result
+        and, when the caller asked for a profile, the profile to send back with the response.
+        """
+        if not self.should_profile(requested):
+            return function(), None
+        
+        with self.create_profiler() as profiler:
+            result = function()
+        profile_id = self.save(profiler)
+        
+        if not requested:
+            return result, None
+        return result, {
+            "id": profile_id,
+            "format": "folded",
+            "samples": profiler.samples,
+            "stacks": profiler.folded()
+        }
+    
+    def create_profiler(self) -> SamplingProfiler:
+        """Create a sampler for one request"""
+        return SamplingProfiler(self.config.PROFILING_INTERVAL)
+    
+    def save(self, profiler: SamplingProfiler) -> Optional[str]:
+        """Write a profile to PROFILING_DIR as <id>.folded, returning its id"""
+        profile_id = f"{time.strftime('%Y%m%dT%H%M%S')}-{os.urandom(4).hex()}"
+        try:
+            os.makedirs(self.config.PROFILING_DIR, exist_ok=True)
+            with open(os.path.join(self.config.PROFILING_DIR, f"{profile_id}.folded"), 'w') as profile_file:
+                profile_file.write(profiler.folded())
+            self._prune()
+        except OSError as e:
+            self.logger.warning(f"Saving profile failed: {str(e)}")
+            return None
+        
+        self.logger.info(f"Saved profile {profile_id} ({profiler.samples} samples)")
+        return profile_id
+    
+    def _prune(self):
+        """Delete the oldest profiles beyond PROFILING_MAX_FILES"""
+        names = sorted(name for name in os.listdir(self.config.PROFILING_DIR) if name.endswith('.folded'))
+        for name in names[:max(0, len(names) - self.config.PROFILING_MAX_FILES)]:
+            os.remove(os.path.join(self.config.PROFILING_DIR, name))
+
+
+def create_request_profiler(config: Config) -> Optional[RequestProfiler]:
+    """Create the request profiler if enabled in config"""
+    if not config.PROFILING_ENABLED:
+        return None
+    return RequestProfiler(config)
@@ -0,0 +1,152 @@
+"""
+Cached robots.txt evaluation for the scraping services.
+Each site's robots.txt is fetched once per ROBOTS_CACHE_TTL and kept parsed in memory,
+so disallowed job pages are skipped without another round trip.
+"""
+
+import logging
+import threading
+import time
+import urllib.parse
+from typing import Dict, Optional, Tuple
+
+import requests
+
+from config.settings import Config
+from models.job_models import Deadline
+from utils.helpers import LRUCache
+from utils.http_client import PooledHTTPClient
+from utils.politeness import HostPolitenessScheduler
+from utils.robots_parser import RobotsRules, parse_robots_txt
+
+
+class RobotsTxtCache:
+    """
+    LRU cache of parsed robots.txt files keyed by origin (scheme, host and port).
+    Follows RFC 9309: a missing robots.txt (4xx) allows everything and a server error (5xx)
+    disallows everything until it is fetched again. Unreachable robots.txt files allow
+    everything and are retried after ROBOTS_ERROR_TTL. Fetches wait for the politeness
+    scheduler like any other request to the host.
+    """
+    
+    def __init__(self, 
+                 config: Config = None, 
+                 http_client: PooledHTTPClient = None, 
+                 scheduler: HostPolitenessScheduler = None):
+        self.config = config or Config()
+        self.http_client = http_client or PooledHTTPClient(self.config)
+        self.scheduler = scheduler
+        self.logger = logging.getLogger(__name__)
+        self._cache = LRUCache(self.config.ROBOTS_CACHE_SIZE)
+        self._fetch_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+    
+    def lookup(self, url: str) -> Optional[bool]:
+        """Check a URL against an already cached robots.txt, or get None when it must be fetched"""
+        origin, path = self._split_url(url)
+        entry = self._cache.get(origin)
+        if entry is None or entry[0] <= time.time():
+            return None
+        return entry[1].can_fetch(path)
+    
+    def is_allowed(self, url: str, deadline: Deadline = None) -> bool:
+        """
+        Check whether robots.txt allows fetching a URL, fetching robots.txt when needed.
+        A fetch cut short by the deadline raises requests' Timeout instead of being cached.
+        """
+        allowed = self.lookup(url)
+        if allowed is not None:
+            return allowed
+        
+        origin, path = self._split_url(url)
+        # One fetch per origin even when many of its links are scraped at once
+        with self._get_fetch_lock(origin):
+            entry = self._cache.get(origin)
+            if entry is None or entry[0] <= time.time():
+                entry = self._fetch(origin, deadline)
+                self._cache.put(origin, entry)
+        
+        return entry[1].can_fetch(path)
+    
+    def get_stats(self) -> Dict:
+        """Get cache size and hit/miss counters"""
+        return self._cache.get_stats()
+    
+    def _fetch(self, origin: str, deadline: Deadline = None) -> Tuple[float, RobotsRules]:
+        """Fetch and parse an origin's robots.txt, returning its rules with their expiry time"""
+        url = f"{origin}/robots.txt"
+        host = urllib.parse.urlsplit(origin).hostname or ''
+        timeout = self.config.REQUEST_TIMEOUT
+        cut_short = deadline is not None and deadline.remaining() < timeout
+        if cut_short:
+            timeout = deadline.remaining()
+            if timeout <= 0:
+                raise requests.exceptions.Timeout("Deadline exceeded before fetching robots.txt")
+        
+        if self.scheduler is not None and not self.scheduler.acquire(
+            host, deadline.remaining() if deadline is not None else None
+        ):
+            raise requests.exceptions.Timeout("Deadline exceeded waiting for the host")
+        
+        now = time.time()
+        try:
+            with self.http_client.get(
+                url,
+                timeout=timeout,
+                headers={'User-Agent': self.config.USER_AGENT},
+                stream=True
+            ) as response:
+                status = response.status_code
+                retry_after = response.headers.get('Retry-After')
+                content = response.raw.read(self.config.ROBOTS_MAX_BYTES, decode_content=True)
+        except requests.exceptions.RequestException as e:
+            if self.scheduler is not None:
+                self.scheduler.release(host, None)
+            if cut_short and isinstance(e, requests.exceptions.Timeout):
+                # The caller ran out of time, which says nothing about the site
+                raise
+            self.logger.warning(f"Could not fetch {url}, allowing all paths: {str(e)}")
+            return now + self.config.ROBOTS_ERROR_TTL, RobotsRules()
+        
+        if self.scheduler is not None:
+            self.scheduler.release(host, status, retry_after)
+        if status >= 500:
+            return now + self.config.ROBOTS_ERROR_TTL, RobotsRules(disallow_all=True)
+        if status >= 400:
+            return now + self.config.ROBOTS_CACHE_TTL, RobotsRules()
+        
+        rules = parse_robots_txt(content.decode('utf-8', errors='replace'), self.config.ROBOTS_USER_AGENT)
+        if rules.crawl_delay and self.scheduler is not None:
+            self.scheduler.set_crawl_delay(host, rules.crawl_delay)
+        
+        return now + self.config.ROBOTS_CACHE_TTL, rules
+    
+    def _get_fetch_lock(self, origin: str) -> threading.Lock:
+        """Get the lock serializing robots.txt fetches for an origin"""
+        with self._lock:
+            if len(self._fetch_locks) > max(1, self.config.ROBOTS_CACHE_SIZE):
+                # Drop locks nobody holds so the map stays bounded
+                self._fetch_locks = {
+                    key: lock for key, lock in self._fetch_locks.items() if lock.locked()
+                }
+            return self._fetch_locks.setdefault(origin, threading.Lock())
+    
+    @staticmethod
+    def _split_url(url: str) -> Tuple[str, str]:
+        """Split a URL into its lowercase origin and the path robots.txt rules apply to"""
+        parts = urllib.parse.urlsplit(url)
+        origin = f"{parts.scheme.lower()}://{parts.netloc.lower()}"
+        path = parts.path or '/'
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        return origin, path
+
+
+def create_robots_cache(config: Config, 
+                        http_client: PooledHTTPClient = None, 
+                        scheduler: HostPolitenessScheduler = None) -> Optional[RobotsTxtCache]:
+    """Create the robots.txt cache when enabled in config"""
+    if not config.ROBOTS_TXT_ENABLED:
+        return None
+    
+    return RobotsTxtCache(config, http_client, scheduler)
@@ -0,0 +1,115 @@
+"""
+robots.txt parsing and matching following RFC 9309.
+Only the group that applies to our user agent is kept. A path is checked against every rule
+of that group: the longest matching pattern wins, Allow wins ties, and patterns may use
+'*' for any sequence of characters and a trailing '$' to anchor the end of the path.
+"""
+
+import re
+import urllib.parse
+from typing import List, Optional, Pattern, Tuple
+
+# Characters left as they are when normalizing patterns and paths, so only non-ASCII
+# characters and spaces get percent-encoded before comparing them
+_SAFE_CHARACTERS = "/?#[]@!$&'()*+,;=:-._~%"
+
+_PERCENT_ESCAPE = re.compile(r'%[0-9a-fA-F]{2}')
+
+
+def _normalize(value: str) -> str:
+    """Percent-encode a pattern or path the same way, with uppercase escapes"""
+    value = urllib.parse.quote(value, safe=_SAFE_CHARACTERS)
+    return _PERCENT_ESCAPE.sub(lambda match: match.group(0).upper(), value)
+
+
+def _compile(pattern: str) -> Optional[Pattern]:
+    """Compile a pattern with wildcards into a regex, or get None when a prefix test does"""
+    anchored = pattern.endswith('$')
+    if anchored:
+        pattern = pattern[:-1]
+    if '*' not in pattern and not anchored:
+        return None
+    return re.compile('.*'.join(re.escape(part) for part in pattern.split('*')) + (r'\Z' if anchored else ''))
+
+
+class RobotsRules:
+    """Allow and Disallow rules of the robots.txt group that applies to one user agent"""
+    
+    def __init__(self, 
+                 rules: List[Tuple[str, bool]] = (), 
+                 crawl_delay: Optional[float] = None, 
+                 disallow_all: bool = False):
+        self.crawl_delay = crawl_delay
+        self.disallow_all = disallow_all
+        # Most specific first, Allow before Disallow of the same length, so the first match decides
+        ordered = sorted(set(rules), key=lambda rule: (-len(rule[0]), not rule[1]))
+        self._rules = [(pattern, _compile(pattern), allowed) for pattern, allowed in ordered]
+    
+    def can_fetch(self, path: str) -> bool:
+        """Check whether the rules allow a path, including its query string"""
+        if path == '/robots.txt':
+            return True
+        if self.disallow_all:
+            return False
+        
+        path = _normalize(path or '/')
+        for pattern, regex, allowed in self._rules:
+            if regex.match(path) if regex is not None else path.startswith(pattern):
+                return allowed
+        return True
+
+
+def _product_token(user_agent: str) -> str:
+    """Get the lowercase product token of a User-agent value, e.g. 'examplebot' of 'ExampleBot/1.0'"""
+    return re.split(r'[\s/]', user_agent.strip(), maxsplit=1)[0].lower()
+
+
+def parse_robots_txt(content: str, user_agent: str) -> RobotsRules:
+    """
+    Parse a robots.txt file into the rules for user_agent. Groups naming the user agent's
+    product token are merged; without any, the '*' groups apply, and without those everything is allowed.
+    """
+    token = _product_token(user_agent)
+    # Rules and crawl delays of the groups naming our product token or '*'
+    groups = {}
+    current = []
+    in_rules = False
+    
+    for line in content.splitlines():
+        key, separator, value = line.split('#', 1)[0].partition(':')
+        if not separator:
+            continue
+        key = key.strip().lower()
+        value = value.strip()
+        
+        if key == 'user-agent':
+            if in_rules:
+                # A user-agent line after rules starts the next group
+                current = []
+                in_rules = False
+            agent = _product_token(value)
+            if agent in (token, '*'):
+                current.append(groups.setdefault(agent, ([], [])))
+        elif key in ('allow', 'disallow', 'crawl-delay'):
+            in_rules = True
+            for rules, delays in current:
+                if key == 'crawl-delay':
+                    delays.append(value)
+                elif value:
+                    # An empty Disallow allows everything, which is already the default
+                    rules.append((_normalize(value), key == 'allow'))
+    
+    rules, delays = groups.get(token) or groups.get('*') or ([], [])
+    return RobotsRules(rules, _parse_crawl_delay(delays))
+
+
+def _parse_crawl_delay(values: List[str]) -> Optional[float]:
+    """Get the first valid Crawl-delay of a group, in seconds"""
+    for value in values:
+        try:
+            delay = float(value)
+        except ValueError:
+            continue
+        if delay > 0:
+            return delay
+    return None
@@ -0,0 +1,150 @@
+"""
+Per-stage timing and event counts of the analysis pipeline.
+Services wrap each stage in timed() and report events with count(); both go to the installed
+recorder, and with none installed timed() returns a shared no-op context and count() returns
+at once, so the hot path stays cheap.
+"""
+
+import contextlib
+import threading
+import time
+from collections import Counter
+from typing import ContextManager, Dict, List, Optional, Tuple
+
+# Pipeline stages, in the order a link goes through them. Fetch covers the network
+# stages: DNS and connect for new connections, TTFB until the response headers
+# (including any DNS and connect, like curl's time_starttransfer) and the body download.
+FETCH = 'fetch'
+DNS = 'dns'
+CONNECT = 'connect'
+TTFB = 'ttfb'
+DOWNLOAD = 'download'
+PARSE = 'parse'
+EXTRACT = 'extract'
+SCORE = 'score'
+SERIALIZE = 'serialize'
+STAGES = (FETCH, DNS, CONNECT, TTFB, DOWNLOAD, PARSE, EXTRACT, SCORE, SERIALIZE)
+
+# Events and their labels
+JOB_STATUS = 'job_status'  # JobStatus value of every analyzed link
+HOST_REQUEST = 'host_request'  # host, then success or error (connection failures and 4xx/5xx)
+HTTP_CACHE = 'http_cache'  # hit, revalidated or miss of the HTTP response cache
+
+_NULL_TIMER = contextlib.nullcontext()
+_recorder = None
+
+
+class _StageTimer:
+    """Context manager reporting the duration of one stage run to a recorder"""
+    
+    __slots__ = ('recorder', 'stage', 'started_at')
+    
+    def __init__(self, recorder, stage: str):
+        self.recorder = recorder
+        self.stage = stage
+    
+    def __enter__(self):
+        self.started_at = time.perf_counter()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.recorder.record(self.stage, time.perf_counter() - self.started_at)
+        return False
+
+
+def timed(stage: str) -> ContextManager:
+    """Time a block as one run of a pipeline stage, if a recorder is installed"""
+    recorder = _recorder
+    if recorder is None:
+        return _NULL_TIMER
+    return _StageTimer(recorder, stage)
+
+
+def record(stage: str, seconds: float):
+    """Report the duration of a stage measured elsewhere, e.g. across HTTP client callbacks"""
+    recorder = _recorder
+    if recorder is not None:
+        recorder.record(stage, seconds)
+
+
+def count(event: str, *labels: str):
+    """Count one occurrence of a pipeline event, if a recorder is installed"""
+    recorder = _recorder
+    if recorder is not None:
+        recorder.count(event, labels)
+
+
+def set_recorder(recorder) -> Optional[object]:
+    """
+    Install the object whose record(stage, seconds) receives every stage duration and
+    count(event, labels) every event, or None to stop. Returns the previously installed recorder.
+    """
+    global _recorder
+    previous, _recorder = _recorder, recorder
+    return previous
+
+
+def get_recorder() -> Optional[object]:
+    """Get the installed recorder"""
+    return _recorder
+
+
+class StageTimings:
+    """
+    Thread-safe recorder keeping every duration per stage, summarized as latency percentiles,
+    and event counts per label.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._samples: Dict[str, List[float]] = {}
+        self._counts: Dict[str, Counter] = {}
+    
+    def record(self, stage: str, seconds: float):
+        """Add one duration of a stage"""
+        with self._lock:
+            self._samples.setdefault(stage, []).append(seconds)
+    
+    def count(self, event: str, labels: Tuple[str, ...]):
+        """Add one occurrence of an event"""
+        with self._lock:
+            self._counts.setdefault(event, Counter())[labels] += 1
+    
+    def clear(self):
+        """Forget every recorded duration and event"""
+        with self._lock:
+            self._samples.clear()
+            self._counts.clear()
+    
+    def counts(self) -> Dict[str, Dict[str, int]]:
+        """Get the occurrences of every event, keyed by its labels joined with '/'"""
+        with self._lock:
+            return {
+                event: {'/'.join(labels): occurrences for labels, occurrences in counter.items()}
+                for event, counter in self._counts.items()
+            }
+    
+    def summary(self) -> Dict[str, Dict]:
+        """Get the run count and latency statistics of every recorded stage, in milliseconds"""
+        with self._lock:
+            samples = {stage: sorted(durations) for stage, durations in self._samples.items()}
+        
+        order = {stage: i for i, stage in enumerate(STAGES)}
+        return {
+            stage: {
+                "count": len(durations),
+                "total_ms": round(sum(durations) * 1000, 3),
+                "mean_ms": round(sum(durations) * 1000 / len(durations), 3),
+                "p50_ms": round(percentile(durations, 50) * 1000, 3),
+                "p95_ms": round(percentile(durations, 95) * 1000, 3)
+            }
+            for stage, durations in sorted(samples.items(), key=lambda item: order.get(item[0], len(order)))
+        }
+
+
+def percentile(sorted_values: List[float], percent: float) -> float:
+    """Get the nearest-rank percentile of already sorted values"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * percent // 100))
+    return sorted_values[int(rank) - 1]
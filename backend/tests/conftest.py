@@ -0,0 +1,9 @@
+"""
+Shared pytest setup: makes the backend/src packages importable from the tests.
+"""
+
+import os
+import sys
+
+# Add the backend/src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
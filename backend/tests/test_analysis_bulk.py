@@ -0,0 +1,45 @@
+"""
+Tests for bulk analysis: uploads that outlast their deadline return partial results.
+"""
+
+import time
+
+from config.settings import Config
+from models.job_models import BulkAnalysisRequest, Deadline, JobData
+from services.analyzer_service import JobAnalyzerService
+from services.match_service import MatchCalculatorService
+
+LINKS = [f'https://example.com/jobs/{i}' for i in range(6)]
+
+
+class SlowScraper:
+    """Scraper answering every link after a delay, recording what it fetched"""
+    
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.fetched = []
+    
+    def extract_job_data(self, url, deadline=None):
+        time.sleep(self.delay)
+        self.fetched.append(url)
+        return JobData(url=url, title='Engineer', body='python developer', word_count=2)
+
+
+def test_links_after_the_deadline_are_timed_out_without_fetching():
+    config = Config()
+    config.ANALYSIS_MODE = 'sequential'
+    config.BULK_BATCH_SIZE = 2
+    scraper = SlowScraper(delay=0.2)
+    analyzer = JobAnalyzerService(scraper, MatchCalculatorService(config), config)
+    
+    started_at = time.monotonic()
+    response = analyzer.analyze_jobs_bulk(BulkAnalysisRequest(
+        links=iter(LINKS), keywords=['python'], resume='python developer', deadline=Deadline.after(0.3)
+    ))
+    
+    assert time.monotonic() - started_at < 1
+    assert scraper.fetched == LINKS[:2]
+    assert [result.job_data.url for result in response.results] == LINKS[:2]
+    assert response.summary['total_links'] == 6
+    assert response.summary['successful'] == 2
+    assert response.summary['timed_out'] == 4
@@ -0,0 +1,134 @@
+"""
+Tests for the background analysis queue shared by several worker processes.
+Each store or queue service instance stands in for one process using the same directory.
+"""
+
+import threading
+import time
+
+import pytest
+
+from config.settings import Config
+from models.job_models import (
+    AnalysisComplete, AnalysisJob, AnalysisJobStatus, AnalysisProgress, AnalysisRequest, JobData, JobResult
+)
+from services.job_queue_service import AnalysisJobQueueService
+from utils.analysis_job_store import AnalysisJobStore
+
+REQUEST = AnalysisRequest(links=['https://example.com/job1'], keywords=['python'], resume='python developer')
+
+
+def make_job(job_id: str) -> AnalysisJob:
+    now = time.time()
+    return AnalysisJob(
+        job_id=job_id,
+        status=AnalysisJobStatus.QUEUED,
+        request=REQUEST,
+        created_at=now,
+        updated_at=now,
+        expires_at=now + 60
+    )
+
+
+class CountingAnalyzer:
+    """Streams one result per link, counting how often each request's analysis ran"""
+    
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.runs = 0
+        self._lock = threading.Lock()
+    
+    def analyze_jobs_stream(self, request, deadline=None):
+        with self._lock:
+            self.runs += 1
+        time.sleep(self.delay)
+        for index, url in enumerate(request.links):
+            job_data = JobData(url=url, title='Engineer', body='python', word_count=1)
+            yield AnalysisProgress(index, JobResult(job_data))
+        yield AnalysisComplete(list(range(len(request.links))), {"total_processed": len(request.links)})
+
+
+class TestAnalysisJobStore:
+    
+    def test_a_job_is_claimed_once(self, tmp_path):
+        first, second = AnalysisJobStore(str(tmp_path)), AnalysisJobStore(str(tmp_path))
+        assert first.create(make_job('job'), 10)
+        
+        assert first.claim_next('first', time.time() + 60) == 'job'
+        assert second.claim_next('second', time.time() + 60) is None
+        assert first.get('job').status == AnalysisJobStatus.RUNNING
+    
+    def test_expired_lease_is_claimed_again(self, tmp_path):
+        first, second = AnalysisJobStore(str(tmp_path)), AnalysisJobStore(str(tmp_path))
+        first.create(make_job('job'), 10)
+        first.claim_next('first', time.time() - 1)
+        
+        assert second.claim_next('second', time.time() + 60) == 'job'
+        # The first owner lost the job and may no longer update it
+        assert not first.update(first.get('job'), 'first', time.time() + 60)
+        assert second.update(second.get('job'), 'second', time.time() + 60)
+    
+    def test_renewed_lease_keeps_the_job(self, tmp_path):
+        first, second = AnalysisJobStore(str(tmp_path)), AnalysisJobStore(str(tmp_path))
+        first.create(make_job('job'), 10)
+        first.claim_next('first', time.time() - 1)
+        
+        assert first.renew('first', time.time() + 60) == 1
+        assert second.claim_next('second', time.time() + 60) is None
+    
+    def test_limit_counts_every_process(self, tmp_path):
+        first, second = AnalysisJobStore(str(tmp_path)), AnalysisJobStore(str(tmp_path))
+        assert first.create(make_job('a'), 2)
+        assert second.create(make_job('b'), 2)
+        assert not first.create(make_job('c'), 2)
+        assert second.count_unfinished() == 2
+
+
+@pytest.fixture
+def config(tmp_path):
+    config = Config()
+    config.ANALYSIS_QUEUE_DIR = str(tmp_path)
+    config.ANALYSIS_QUEUE_WORKERS = 2
+    config.ANALYSIS_QUEUE_POLL_INTERVAL = 0.05
+    return config
+
+
+def wait_until_finished(queue: AnalysisJobQueueService, job_ids, timeout: float = 10):
+    expires_at = time.time() + timeout
+    while time.time() < expires_at:
+        statuses = {queue.get(job_id).status for job_id in job_ids}
+        assert AnalysisJobStatus.FAILED not in statuses
+        if statuses == {AnalysisJobStatus.COMPLETED}:
+            return
+        time.sleep(0.05)
+    raise AssertionError(f"Jobs did not finish: {statuses}")
+
+
+class TestAnalysisJobQueueService:
+    
+    def test_workers_start_with_the_first_submission(self, config):
+        queue = AnalysisJobQueueService(CountingAnalyzer(), config)
+        assert queue._workers == []
+        
+        job = queue.submit(REQUEST)
+        assert len(queue._workers) == config.ANALYSIS_QUEUE_WORKERS + 1
+        wait_until_finished(queue, [job.job_id])
+    
+    def test_jobs_run_once_across_processes(self, config):
+        analyzer = CountingAnalyzer()
+        queues = [AnalysisJobQueueService(analyzer, config) for _ in range(3)]
+        
+        jobs = [queues[i % len(queues)].submit(REQUEST) for i in range(12)]
+        wait_until_finished(queues[0], [job.job_id for job in jobs])
+        
+        assert analyzer.runs == len(jobs)
+        assert queues[1].get(jobs[0].job_id).to_dict()["summary"] == {"total_processed": 1}
+    
+    def test_full_queue_rejects_jobs_of_any_process(self, config):
+        config.ANALYSIS_QUEUE_MAX_SIZE = 1
+        first = AnalysisJobQueueService(CountingAnalyzer(delay=1), config)
+        second = AnalysisJobQueueService(CountingAnalyzer(delay=1), config)
+        
+        assert first.submit(REQUEST) is not None
+        assert second.submit(REQUEST) is None
+        assert second.get_stats()["pending"] == 1
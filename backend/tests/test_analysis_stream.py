@@ -0,0 +1,63 @@
+"""
+Tests for streamed analysis: completion order in every mode and failures that end the stream.
+"""
+
+import threading
+import time
+
+import pytest
+
+from config.settings import Config
+from models.job_models import AnalysisComplete, AnalysisProgress, AnalysisRequest, JobData
+from services.analyzer_service import JobAnalyzerService
+from services.match_service import MatchCalculatorService
+
+DELAYS = {
+    'https://a.example.com/slow': 0.3,
+    'https://b.example.com/fast': 0.01,
+    'https://c.example.com/mid': 0.15
+}
+REQUEST = AnalysisRequest(links=list(DELAYS), keywords=['python'], resume='python developer')
+
+
+class DelayedScraper:
+    """Scraper answering every link after its delay"""
+    
+    def extract_job_data(self, url, deadline=None):
+        time.sleep(DELAYS[url])
+        return JobData(url=url, title='Engineer', body='python developer', word_count=2)
+
+
+def create_analyzer(mode: str) -> JobAnalyzerService:
+    config = Config()
+    config.ANALYSIS_MODE = mode
+    return JobAnalyzerService(DelayedScraper(), MatchCalculatorService(config), config)
+
+
+@pytest.mark.parametrize('mode', ['sequential', 'concurrent', 'async'])
+def test_results_stream_in_completion_order(mode):
+    events = list(create_analyzer(mode).analyze_jobs_stream(REQUEST))
+    assert [event.index for event in events if isinstance(event, AnalysisProgress)] == [1, 2, 0]
+    assert isinstance(events[-1], AnalysisComplete)
+
+
+def test_async_scrape_failure_ends_the_stream():
+    analyzer = create_analyzer('async')
+    
+    async def failing_scrape(links, on_result=None, deadline=None):
+        on_result(0, JobData.from_error(links[0], 'Request timeout'))
+        raise RuntimeError('event loop failed')
+    analyzer._scrape_async = failing_scrape
+    
+    outcome = []
+    
+    def consume():
+        try:
+            list(analyzer.analyze_jobs_stream(REQUEST))
+        except RuntimeError as e:
+            outcome.append(str(e))
+    
+    consumer = threading.Thread(target=consume, daemon=True)
+    consumer.start()
+    consumer.join(5)
+    assert outcome == ['event loop failed']
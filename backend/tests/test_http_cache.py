@@ -0,0 +1,62 @@
+"""
+Tests for the disk-backed HTTP response cache: size tracking, eviction and error handling.
+"""
+
+import sqlite3
+
+from utils.http_cache import HTTPResponseCache
+
+
+def total_size(cache: HTTPResponseCache) -> int:
+    return cache._connection.execute('SELECT total FROM cache_size').fetchone()[0]
+
+
+def test_least_recently_used_entries_are_evicted_past_max_bytes(tmp_path):
+    cache = HTTPResponseCache(str(tmp_path), ttl=60, max_bytes=10)
+    cache.put('a', 'https://a', b'1234', 'utf-8')
+    cache.put('b', 'https://b', b'1234', 'utf-8')
+    cache.get('a')
+    cache.put('c', 'https://c', b'1234', 'utf-8')
+    
+    assert cache.get('a') is not None
+    assert cache.get('b') is None
+    assert total_size(cache) == 8
+
+
+def test_total_size_follows_replacements_and_deletes(tmp_path):
+    cache = HTTPResponseCache(str(tmp_path), ttl=60, max_bytes=100)
+    cache.put('a', 'https://a', b'1234', 'utf-8')
+    cache.put('a', 'https://a', b'12', 'utf-8')
+    cache.put('b', 'https://b', b'123', 'utf-8')
+    assert total_size(cache) == 5
+    
+    cache.invalidate('a')
+    assert total_size(cache) == 3
+    cache.clear()
+    assert total_size(cache) == 0
+
+
+def test_total_size_of_an_existing_cache_is_counted_once(tmp_path):
+    # A cache written before sizes were tracked
+    connection = sqlite3.connect(str(tmp_path / HTTPResponseCache.DB_FILENAME))
+    connection.execute(
+        'CREATE TABLE responses (key TEXT PRIMARY KEY, url TEXT, content BLOB, encoding TEXT,'
+        ' etag TEXT, last_modified TEXT, stored_at REAL, last_access REAL, size INTEGER)'
+    )
+    connection.execute(
+        "INSERT INTO responses VALUES ('a', 'https://a', x'31323334', 'utf-8', NULL, NULL, 0, 0, 4)"
+    )
+    connection.commit()
+    connection.close()
+    
+    assert total_size(HTTPResponseCache(str(tmp_path), ttl=60, max_bytes=100)) == 4
+    assert total_size(HTTPResponseCache(str(tmp_path), ttl=60, max_bytes=100)) == 4
+
+
+def test_invalidate_and_clear_log_database_errors(tmp_path, caplog):
+    cache = HTTPResponseCache(str(tmp_path), ttl=60, max_bytes=100)
+    cache._connection.close()
+    
+    cache.invalidate('a')
+    cache.clear()
+    assert len([record for record in caplog.records if record.levelname == 'WARNING']) == 2
@@ -0,0 +1,56 @@
+"""
+Tests for the job index endpoints: admin token gating and request validation.
+"""
+
+import pytest
+from flask import Flask
+
+from api.routes import JobAPI
+from config.settings import Config
+from services.analyzer_service import JobAnalyzerService
+from services.index_service import JobIndexService
+from services.match_service import MatchCalculatorService
+from services.scraper_service import create_scraper_service
+
+ADMIN_HEADERS = {'Authorization': 'Bearer s3cret'}
+
+
+def create_client(index_dir: str, admin_token: str = None):
+    config = Config()
+    index = JobIndexService(config, index_dir)
+    scraper = create_scraper_service(config)
+    analyzer = JobAnalyzerService(scraper, MatchCalculatorService(config), config, index)
+    app = Flask(__name__)
+    app.register_blueprint(JobAPI(analyzer, index, admin_token=admin_token).get_blueprint())
+    return app.test_client()
+
+
+def test_admin_endpoints_need_a_configured_token(tmp_path):
+    client = create_client(str(tmp_path))
+    assert client.post('/index/compact', headers=ADMIN_HEADERS).status_code == 404
+    assert client.delete('/index/jobs', json={'urls': ['https://example.com/1']}).status_code == 404
+
+
+def test_admin_endpoints_check_the_token(tmp_path):
+    client = create_client(str(tmp_path), 's3cret')
+    assert client.post('/index/compact').status_code == 401
+    assert client.post('/index/compact', headers={'Authorization': 'Bearer wrong'}).status_code == 401
+    assert client.post('/index/compact', headers=ADMIN_HEADERS).status_code == 200
+
+
+def test_remove_requires_a_list_of_urls(tmp_path):
+    client = create_client(str(tmp_path), 's3cret')
+    response = client.delete('/index/jobs', json={'urls': 'https://example.com/1'}, headers=ADMIN_HEADERS)
+    assert response.status_code == 400
+    response = client.delete('/index/jobs', json={'urls': ['https://example.com/1']}, headers=ADMIN_HEADERS)
+    assert response.get_json()["removed"] == 0
+
+
+@pytest.mark.parametrize('body', [
+    {'resume': None, 'keywords': ['python']},
+    {'resume': 'python developer', 'keywords': 'python'},
+    {'resume': 'python developer', 'keywords': [1]}
+])
+def test_search_rejects_invalid_types(tmp_path, body):
+    response = create_client(str(tmp_path)).post('/search', json=body)
+    assert response.status_code == 400
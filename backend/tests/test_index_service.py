@@ -0,0 +1,43 @@
+"""
+Tests for the job index: search past deleted postings and eviction beyond the size limit.
+"""
+
+from config.settings import Config
+from models.job_models import JobData
+from services.index_service import JobIndexService
+
+
+def create_job(i: int, body: str) -> JobData:
+    return JobData(
+        url=f'https://example.com/jobs/{i}', title='Engineer', body=body, word_count=len(body.split())
+    )
+
+
+def create_index(tmp_path, **settings) -> JobIndexService:
+    config = Config()
+    for name, value in settings.items():
+        setattr(config, name, value)
+    return JobIndexService(config, str(tmp_path))
+
+
+def test_deleted_postings_do_not_hide_live_matches(tmp_path):
+    index = create_index(tmp_path, SEARCH_POSTINGS_PER_TERM=2)
+    index.add_jobs([create_job(i, 'python ' * 10) for i in range(3)])
+    index.add_jobs([create_job(3, 'python developer')])
+    index.remove_jobs([f'https://example.com/jobs/{i}' for i in range(3)])
+
+    results = index.search('python', 10)
+    assert [job_data.url for job_data, _ in results] == ['https://example.com/jobs/3']
+
+
+def test_oldest_documents_are_evicted_past_the_limit(tmp_path):
+    index = create_index(tmp_path, JOB_INDEX_MAX_DOCUMENTS=2)
+    for i in range(4):
+        index.add_jobs([create_job(i, f'python developer {i}')])
+
+    assert index.get_stats() == {'documents': 2, 'total_length': 6, 'deleted': 0}
+    results = index.search('python', 10)
+    assert sorted(job_data.url for job_data, _ in results) == [
+        'https://example.com/jobs/2', 'https://example.com/jobs/3'
+    ]
+    assert index._connection.execute('SELECT COUNT(*) FROM postings').fetchone()[0] == 6
@@ -0,0 +1,33 @@
+"""
+Tests for the parsed job data cache of the scraper.
+"""
+
+from config.settings import Config
+from services.scraper_service import JobScraperService
+
+URL = 'https://example.com/jobs/1'
+
+
+class CountingParser:
+    """HTML parser counting the pages it parses"""
+    
+    def __init__(self):
+        self.parsed = 0
+    
+    def parse(self, html_content):
+        self.parsed += 1
+        return 'Engineer', html_content
+
+
+def test_changed_content_counts_as_a_miss():
+    parser = CountingParser()
+    scraper = JobScraperService(Config(), html_parser=parser)
+    
+    assert scraper._parse_job_page(URL, 'python developer').body == 'python developer'
+    assert scraper._parse_job_page(URL + '?utm_source=feed', 'python developer').body == 'python developer'
+    assert scraper._parse_job_page(URL, 'react developer').body == 'react developer'
+    assert scraper._parse_job_page(URL, 'react developer').body == 'react developer'
+    
+    stats = scraper.get_job_data_cache_stats()
+    assert parser.parsed == 2
+    assert (stats['hits'], stats['misses'], stats['size']) == (2, 2, 1)
@@ -0,0 +1,79 @@
+"""
+Tests that every response surface keeps its JSON encoding byte for byte.
+"""
+
+import json
+
+from flask import Flask, jsonify
+
+from api.json_provider import FastJSONProvider
+from api.routes import JobAPI
+from config.settings import Config
+from models.job_models import JobData
+from services.analyzer_service import JobAnalyzerService
+from services.match_service import MatchCalculatorService
+from utils import json_serializer
+
+DATA = {
+    "title": "Développeur Python ☃ 😀",
+    "score": 85.5,
+    "keywords": ["python", "docker"],
+    "details": {"b": None, "a": True, "control": "\x7f\n"}
+}
+
+
+def test_sorted_output_matches_jsonify():
+    expected = (json.dumps(DATA, sort_keys=True, separators=(',', ':')) + '\n').encode('ascii')
+    assert json_serializer.dumps_sorted(DATA) == expected
+
+
+def test_standard_output_matches_json_dumps():
+    assert json_serializer.dumps_standard(DATA) == json.dumps(DATA)
+
+
+def test_flask_responses_match_the_default_provider():
+    fast_app = Flask('fast')
+    fast_app.json = FastJSONProvider(fast_app)
+    default_app = Flask('default')
+    
+    with fast_app.app_context():
+        fast = jsonify(DATA).get_data()
+    with default_app.app_context():
+        default = jsonify(DATA).get_data()
+    assert fast == default
+    
+    fast_app.debug = default_app.debug = True
+    with fast_app.app_context():
+        fast = jsonify(DATA).get_data()
+    with default_app.app_context():
+        default = jsonify(DATA).get_data()
+    assert fast == default
+
+
+def test_objects_orjson_rejects_encode_like_json_dumps():
+    data = {"keyword": "\ud800", 1: ["caf\u00e9"]}
+    assert json_serializer.dumps_sorted({"keyword": "\ud800"}) == b'{"keyword":"\\ud800"}\n'
+    assert json.loads(json_serializer.dumps(data)) == {"keyword": "\ud800", "1": ["caf\u00e9"]}
+
+
+class EchoScraper:
+    """Scraper answering every link with a posting that matches the lone surrogate keyword"""
+    
+    def extract_job_data(self, url, deadline=None):
+        return JobData(url=url, title='Engineer', body='python developer \ud800', word_count=3)
+
+
+def test_lone_surrogate_keyword_is_echoed_back():
+    config = Config()
+    app = Flask('analyze')
+    app.json = FastJSONProvider(app)
+    analyzer = JobAnalyzerService(EchoScraper(), MatchCalculatorService(config), config)
+    app.register_blueprint(JobAPI(analyzer).get_blueprint())
+    
+    response = app.test_client().post(
+        '/analyze',
+        data='{"links": ["https://example.com/1"], "keywords": ["python", "\\ud800"], "resume": "python"}',
+        content_type='application/json'
+    )
+    assert response.status_code == 200
+    assert b'\\ud800' in response.get_data()
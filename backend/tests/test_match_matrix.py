@@ -0,0 +1,32 @@
+"""
+Tests for the token bitsets and bag-of-words matrices behind matrix scoring.
+"""
+
+import numpy as np
+
+from services.match_service import MatchCalculatorService
+from utils.helpers import LRUCache, TokenVocabulary
+
+
+def test_decode_ids_returns_ascending_ids():
+    bits = (1 << 0) | (1 << 7) | (1 << 8) | (1 << 1000)
+    assert TokenVocabulary.decode_ids(bits) == [0, 7, 8, 1000]
+    assert TokenVocabulary.decode_ids(0) == []
+
+
+def test_bag_of_words_matrix_has_one_column_per_shared_token():
+    shared_bits = (1 << 3) | (1 << 9) | (1 << 64)
+    rows = [(1 << 3) | (1 << 64) | (1 << 70), 1 << 9, 0]
+    matrix = MatchCalculatorService._build_bag_of_words_matrix(np, rows, shared_bits)
+    assert matrix.tolist() == [[1, 0, 1], [0, 1, 0], [0, 0, 0]]
+
+
+def test_profile_cache_grows_to_the_request():
+    service = MatchCalculatorService()
+    service.profile_cache = LRUCache(2)
+    resumes = [f"python developer number{i}" for i in range(5)]
+    
+    service.calculate_match_matrix(resumes, ["python developer"], ["python"])
+    service.calculate_match_matrix(resumes, ["python developer"], ["python"])
+    assert service.profile_cache.get_stats()["max_size"] == 5
+    assert service.profile_cache.hits == len(resumes)
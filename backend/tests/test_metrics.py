@@ -0,0 +1,20 @@
+"""
+Tests for the Prometheus exposition of pipeline metrics.
+"""
+
+import os
+
+from config.settings import Config
+from utils import timing
+from utils.metrics import PipelineMetrics
+
+
+def test_every_series_is_labelled_with_the_worker():
+    metrics = PipelineMetrics(Config())
+    metrics.record(timing.FETCH, 0.2)
+    metrics.count(timing.JOB_STATUS, ('success',))
+    metrics.add_cache_stats(lambda: {'job_data': {'hits': 1, 'misses': 1, 'hit_rate': 0.5}})
+    
+    samples = [line for line in metrics.render().splitlines() if not line.startswith('#')]
+    assert samples
+    assert all(line.startswith(line.split('{')[0] + f'{{worker="{os.getpid()}"') for line in samples)
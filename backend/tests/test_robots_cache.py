@@ -0,0 +1,181 @@
+"""
+Tests for robots.txt matching (RFC 9309) and the robots.txt cache.
+"""
+
+import pytest
+
+from config.settings import Config
+from utils.politeness import HostPolitenessScheduler
+from utils.robots_cache import RobotsTxtCache
+from utils.robots_parser import parse_robots_txt
+
+USER_AGENT = 'job-scraper'
+
+
+def allowed(robots_txt: str, path: str) -> bool:
+    return parse_robots_txt(robots_txt, USER_AGENT).can_fetch(path)
+
+
+class TestRobotsRules:
+    
+    def test_longest_match_wins_regardless_of_order(self):
+        robots_txt = "User-agent: *\nAllow: /\nDisallow: /private\n"
+        assert not allowed(robots_txt, '/private/x')
+        assert allowed(robots_txt, '/public')
+    
+    def test_longer_allow_overrides_disallow(self):
+        robots_txt = "User-agent: *\nDisallow: /jobs/\nAllow: /jobs/public/\n"
+        assert allowed(robots_txt, '/jobs/public/1')
+        assert not allowed(robots_txt, '/jobs/private/1')
+    
+    def test_allow_wins_ties(self):
+        robots_txt = "User-agent: *\nDisallow: /page\nAllow: /page\n"
+        assert allowed(robots_txt, '/page')
+    
+    def test_wildcard_matches_query(self):
+        robots_txt = "User-agent: *\nDisallow: /*?session=\n"
+        assert not allowed(robots_txt, '/jobs/1?session=abc')
+        assert allowed(robots_txt, '/jobs/1?page=2')
+    
+    def test_end_anchor(self):
+        robots_txt = "User-agent: *\nDisallow: /*.pdf$\n"
+        assert not allowed(robots_txt, '/files/job.pdf')
+        assert allowed(robots_txt, '/files/job.pdf?download=1')
+        assert allowed(robots_txt, '/files/job.html')
+    
+    def test_specific_group_replaces_wildcard_group(self):
+        robots_txt = (
+            "User-agent: *\nDisallow: /\n\n"
+            "User-agent: Job-Scraper/2.0\nDisallow: /admin\n"
+        )
+        assert allowed(robots_txt, '/jobs/1')
+        assert not allowed(robots_txt, '/admin')
+    
+    def test_groups_for_the_same_agent_are_merged(self):
+        robots_txt = (
+            "User-agent: job-scraper\nDisallow: /a\n\n"
+            "User-agent: other\nDisallow: /\n\n"
+            "User-agent: job-scraper\nDisallow: /b\n"
+        )
+        assert not allowed(robots_txt, '/a')
+        assert not allowed(robots_txt, '/b')
+        assert allowed(robots_txt, '/c')
+    
+    def test_consecutive_user_agents_share_a_group(self):
+        robots_txt = "User-agent: other\nUser-agent: job-scraper\nDisallow: /private\n"
+        assert not allowed(robots_txt, '/private')
+    
+    def test_empty_disallow_and_comments(self):
+        robots_txt = "# comment\nUser-agent: *  # everyone\nDisallow:\n"
+        assert allowed(robots_txt, '/anything')
+    
+    def test_robots_txt_is_always_allowed(self):
+        assert allowed("User-agent: *\nDisallow: /\n", '/robots.txt')
+    
+    def test_crawl_delay_of_matching_group(self):
+        robots_txt = "User-agent: *\nCrawl-delay: 10\n\nUser-agent: job-scraper\nCrawl-delay: 2\n"
+        assert parse_robots_txt(robots_txt, USER_AGENT).crawl_delay == 2
+
+
+class FakeRawBody:
+    """Stands in for urllib3's raw response body"""
+    
+    def __init__(self, body: bytes):
+        self.body = body
+    
+    def read(self, amount: int, decode_content: bool = False) -> bytes:
+        return self.body[:amount]
+
+
+class FakeResponse:
+    """Streamed response with the attributes the cache reads"""
+    
+    def __init__(self, status_code: int, body: bytes = b'', headers: dict = None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.raw = FakeRawBody(body)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *args):
+        return False
+
+
+class FakeHTTPClient:
+    """Serves one robots.txt response and records the requested URLs"""
+    
+    def __init__(self, response: FakeResponse):
+        self.response = response
+        self.urls = []
+    
+    def get(self, url, **kwargs):
+        self.urls.append(url)
+        return self.response
+
+
+class RecordingScheduler(HostPolitenessScheduler):
+    """Scheduler recording acquired and released hosts"""
+    
+    def __init__(self, config: Config):
+        super().__init__(config)
+        self.calls = []
+    
+    def acquire(self, host, timeout=None):
+        self.calls.append(('acquire', host))
+        return super().acquire(host, timeout)
+    
+    def release(self, host, status, retry_after=None):
+        self.calls.append(('release', host, status))
+        return super().release(host, status, retry_after)
+
+
+@pytest.fixture
+def config():
+    config = Config()
+    config.ROBOTS_USER_AGENT = USER_AGENT
+    config.POLITENESS_RATE = 0
+    return config
+
+
+class TestRobotsTxtCache:
+    
+    def test_fetches_once_per_origin_through_the_scheduler(self, config):
+        http_client = FakeHTTPClient(FakeResponse(200, b"User-agent: *\nAllow: /\nDisallow: /private\n"))
+        scheduler = RecordingScheduler(config)
+        cache = RobotsTxtCache(config, http_client, scheduler)
+        
+        assert not cache.is_allowed('https://Jobs.Example.com/private/x')
+        assert cache.is_allowed('https://jobs.example.com/jobs/1')
+        assert http_client.urls == ['https://jobs.example.com/robots.txt']
+        assert scheduler.calls == [('acquire', 'jobs.example.com'), ('release', 'jobs.example.com', 200)]
+        assert scheduler.get_stats()['jobs.example.com']['in_flight'] == 0
+    
+    def test_server_error_disallows_everything(self, config):
+        cache = RobotsTxtCache(config, FakeHTTPClient(FakeResponse(500)), RecordingScheduler(config))
+        assert not cache.is_allowed('https://example.com/jobs/1')
+    
+    def test_missing_robots_txt_allows_everything(self, config):
+        cache = RobotsTxtCache(config, FakeHTTPClient(FakeResponse(404)), RecordingScheduler(config))
+        assert cache.is_allowed('https://example.com/jobs/1')
+    
+    def test_crawl_delay_slows_the_host_down(self, config):
+        scheduler = RecordingScheduler(config)
+        http_client = FakeHTTPClient(FakeResponse(200, b"User-agent: *\nCrawl-delay: 4\n"))
+        cache = RobotsTxtCache(config, http_client, scheduler)
+        cache.is_allowed('https://example.com/jobs/1')
+        assert scheduler.get_stats()['example.com']['rate'] == 0.25
+
+
+class TestHostPolitenessScheduler:
+    
+    def test_forgets_least_recently_used_idle_hosts(self, config):
+        config.POLITENESS_MAX_HOSTS = 2
+        scheduler = HostPolitenessScheduler(config)
+        
+        scheduler.acquire('busy.example.com')
+        scheduler.acquire('a.example.com')
+        scheduler.release('a.example.com', 200)
+        scheduler.acquire('b.example.com')
+        
+        assert set(scheduler.get_stats()) == {'busy.example.com', 'b.example.com'}
@@ -0,0 +1,73 @@
+"""
+Tests for the request slots the scrapers take from the politeness scheduler.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from config.settings import Config
+from models.job_models import Deadline, JobStatus
+from services.async_scraper_service import AsyncJobScraperService
+from services.scraper_service import JobScraperService
+
+URL = 'https://example.com/jobs/1'
+HOST = 'example.com'
+
+
+class HangingSession:
+    """Client session whose requests never answer"""
+    
+    timeout = None
+    
+    async def get(self, url, **kwargs):
+        await asyncio.sleep(60)
+
+
+class FailingClient:
+    """HTTP client failing every request with an unexpected error"""
+    
+    def get(self, url, **kwargs):
+        raise RuntimeError('connection pool broken')
+
+
+def test_cancelled_async_request_frees_its_slot():
+    scraper = AsyncJobScraperService(Config())
+    scraper._get_session = HangingSession
+    
+    async def cancel_in_flight_request():
+        task = asyncio.ensure_future(scraper._make_request_async(URL))
+        await asyncio.sleep(0.05)
+        assert scraper.scheduler.get_stats()[HOST]['in_flight'] == 1
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+    
+    asyncio.run(cancel_in_flight_request())
+    assert scraper.scheduler.get_stats()[HOST]['in_flight'] == 0
+    assert scraper.scheduler.get_stats()[HOST]['concurrency_limit'] == Config.MAX_CONCURRENCY_PER_HOST
+
+
+def test_async_request_to_a_busy_host_times_out_at_the_deadline():
+    config = Config()
+    config.ROBOTS_TXT_ENABLED = False
+    scraper = AsyncJobScraperService(config)
+    scraper._get_session = HangingSession
+    for _ in range(Config.MAX_CONCURRENCY_PER_HOST):
+        scraper.scheduler.acquire(HOST)
+    
+    started_at = time.monotonic()
+    job_data = asyncio.run(scraper.extract_job_data_async(URL, Deadline.after(0.2)))
+    
+    assert time.monotonic() - started_at < 1
+    assert job_data.status == JobStatus.TIMEOUT
+    assert scraper.scheduler.get_stats()[HOST]['in_flight'] == Config.MAX_CONCURRENCY_PER_HOST
+
+
+def test_unexpected_sync_error_frees_its_slot():
+    scraper = JobScraperService(Config(), http_client=FailingClient())
+    
+    with pytest.raises(RuntimeError):
+        scraper._send_request(URL, HOST, {})
+    assert scraper.scheduler.get_stats()[HOST]['in_flight'] == 0
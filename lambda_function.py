@@ -13,12 +13,9 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'backend', 'src'))
 
 try:
-    from lambda_adapter import lambda_handler as new_lambda_handler
-    
-    def lambda_handler(event, context):
-        """Legacy Lambda handler - redirects to new structure"""
-        return new_lambda_handler(event, context)
-        
+    # Re-export the handler itself so invocations do not pass through a wrapper; its heavy
+    # dependencies are imported on the first request (see backend/src/lambda_adapter.py)
+    from lambda_adapter import lambda_handler
 except ImportError:
     # Fallback to basic error response if new structure not available
     import json